@@ -1,5 +1,7 @@
-from .sys import SYSTEM_LOGGER_CONFIG
+from .sys import CRASH_DUMP_DATEFMT, CRASH_DUMP_DIR, SYSTEM_LOGGER_CONFIG
 
 __all__ = [
+    "CRASH_DUMP_DATEFMT",
+    "CRASH_DUMP_DIR",
     "SYSTEM_LOGGER_CONFIG",
 ]
@@ -2,6 +2,10 @@ from pathlib import Path
 
 from ....config import PROJECT_ROOT
 
+# Where `LoggerManager` writes ring buffers on an uncaught exception
+CRASH_DUMP_DIR = Path(f"{PROJECT_ROOT}/logs/crash/")
+CRASH_DUMP_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
 SYSTEM_LOGGER_CONFIG = {
     "name": "system",
     "path": Path(f"{PROJECT_ROOT}/core/utils/logger"),
@@ -21,10 +25,16 @@ SYSTEM_LOGGER_CONFIG = {
         "enabled": False,
         "queue_size": 1000,
         "timeout": 1,
+        "overflow": "drop",
+    },
+    "ring_buffer": {
+        "enabled": True,
+        "capacity": 1000,
+        "level": "DEBUG",
     },
     "security": {
         "enabled": True,
-        "sanitize_sensitive_data": True,
+        "sanitize_sensitive_data": False,
     },
     "filters": {
         "enabled": False,
@@ -1,11 +1,14 @@
-import inspect
+import copyreg
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import CodeType
+from typing import Any, ClassVar, Dict, Optional, Set, Tuple
 
 from ...shared.core import KNOWN_LAYERS
 from ...shared.exceptions.aliases import LineNo
 from ...shared.logger.log_levels import LogLevel
+from ...shared.metrics import ERRORS, WARNINGS, Counter
 from ..exceptions.error_codes import ErrorCode
 from ..protocols.infrastructure.logger import ServiceLoggerProtocol
 
@@ -17,169 +20,127 @@ from ..protocols.infrastructure.logger import ServiceLoggerProtocol
 
 class SerializableExceptionMixin:
 
+    __slots__ = ()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to a serializable dict."""
 
         raise NotImplementedError
 
 
-# ------------------------------------------------------------------------------
-#   Custom exceptions and warnings
-#   Exposed for other exceptions to inherit from
-# ------------------------------------------------------------------------------
-
-
-class CoreError(Exception, SerializableExceptionMixin):
-    """Base exception for all custom exceptions."""
-
-    def __init__(
-        self,
-        message: str,
-        err_code: ErrorCode,
-        file_path: Optional[Path] = None,
-        line_no: Optional[LineNo] = None,
-        *,
-        layer: Optional[str] = None,
-        service: Optional[str] = None,
-        cause: Optional[BaseException] = None,
-        user_message: Optional[str] = None,
-        severity: Optional[str] = None,
-        timestamp: Optional[datetime] = None,
-        logger: Optional[ServiceLoggerProtocol] = None,
-        log_level: LogLevel = LogLevel.DEBUG,
-    ):
-        self.message = message
-        self.error_code = err_code
-
-        if (file_path is None) or (line_no is None):
-            caller_frame = self._find_caller_frame()
-            self.file_path = caller_frame.f_code.co_filename
-            self.line_no = caller_frame.f_lineno
-        else:
-            self.file_path = file_path
-            self.line_no = line_no
-
-        self.file_name = str(self.file_path).split("/")[-1].split("\\")[-1]
-        self.layer = layer or self._infer_layer()
-        self.service = service or self._infer_service()
-        self.__cause__ = cause
-        self.user_message = user_message or message
-        self.severity = severity or "ERROR"
-        self.timestamp = timestamp or datetime.now(timezone.utc)
-
-        if logger:
-            log_function = {
-                LogLevel.DEBUG: logger.debug,
-                LogLevel.INFO: logger.info,
-                LogLevel.WARNING: logger.warning,
-                LogLevel.ERROR: logger.error,
-                LogLevel.CRITICAL: logger.critical,
-            }.get(log_level, logger.error)
-            log_function(message)
+# `__init__` code objects of the exception hierarchy, skipped when looking
+# for the frame that created the exception
+_INIT_CODES: Set[CodeType] = set()
 
-        super().__init__(self.message)
 
-    def __str__(self) -> str:
-        return (
-            f"[{self.error_code}] {self.message} "
-            f"(at {self.file_name}:{self.line_no})"
-        )
+class CallerLocationMixin:
+    """Lazily resolved location of the code that created the exception.
 
-    def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}"
-            f"message='{self.message}'"
-            f"error_code='{self.error_code}'"
-            f"file_path='{self.file_path}'"
-            f"line_number='{self.line_no}'"
-        )
+    Creating the exception only keeps the caller's code object and last
+    instruction; `file_path`, `line_no` and `file_name` are resolved on
+    first access, which most caught-and-handled exceptions never do.
+    """
 
-    # -------------------------------------------------------------------------
-    #   Public methods
-    # -------------------------------------------------------------------------
+    __slots__ = ()
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "error_type": self.__class__.__name__,
-            "message": self.message,
-            "error_code": self.error_code,
-            "file_path": self.file_path,
-            "file_name": self.file_name,
-            "line_number": self.line_no,
-            "layer": self.layer,
-            "service": self.service,
-            "cause": repr(self.__cause__) if self.__cause__ else None,
-            "user_message": self.user_message,
-            "severity": self.severity,
-            "timestamp": self.timestamp,
-        }
+    _file_path: Optional[Path | str]
+    _line_no: Optional[LineNo]
+    _file_name: Optional[str]
+    _caller: Optional[Tuple[CodeType, int]]
 
-    # -------------------------------------------------------------------------
-    #   Private helper methods
-    # -------------------------------------------------------------------------
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        init = cls.__dict__.get("__init__")
+        if init is not None and hasattr(init, "__code__"):
+            _INIT_CODES.add(init.__code__)
 
-    def _find_caller_frame(self):
-        """Walk up the stack to find caller's frame.
+    @property
+    def file_path(self) -> Optional[Path | str]:
+        if self._caller is not None:
+            self._resolve_caller()
+        return self._file_path
 
-        Detect the frame is of the caller by looking for the first frame that
-        is not part of the exception hierarchy initialization.
+    @property
+    def line_no(self) -> Optional[LineNo]:
+        if self._caller is not None:
+            self._resolve_caller()
+        return self._line_no
 
-        Returns:
-            Caller's frame.
-        """
+    @property
+    def file_name(self) -> str:
+        if self._file_name is None:
+            self._file_name = str(self.file_path).split("/")[-1].split("\\")[-1]
+        return self._file_name
 
-        frame = inspect.currentframe()
+    def _set_location(
+        self,
+        file_path: Optional[Path | str],
+        line_no: Optional[LineNo],
+    ):
+        """Keep the given location, or capture the caller's if incomplete."""
 
-        while frame:
-            frame = frame.f_back
-            if frame is None:
+        self._file_path = file_path
+        self._line_no = line_no
+        self._file_name = None
+        self._caller = None
+        if (file_path is None) or (line_no is None):
+            # Skip the exception hierarchy's `__init__` frames by code object,
+            # reading `f_locals` would build a dict per frame
+            frame = sys._getframe(1)
+            while frame.f_back is not None and frame.f_code in _INIT_CODES:
+                frame = frame.f_back
+            self._caller = (frame.f_code, frame.f_lasti)
+
+    def _resolve_caller(self):
+        code, lasti = self._caller  # type: ignore[misc]
+        self._file_path = code.co_filename
+        self._line_no = code.co_firstlineno
+        for start, end, line in code.co_lines():
+            if start <= lasti < end and line is not None:
+                self._line_no = line
                 break
+        self._caller = None
 
-            # Get the class being called in this frame
-            frame_locals = frame.f_locals
-
-            # Skips frames that are __init__ of exception classes
-            if (
-                "self" in frame_locals
-                and isinstance(frame_locals["self"], CoreError)
-                and frame.f_code.co_name == "__init__"
-            ):
-                continue
-
-            return frame
-
-        # Fallback (shouldn't happen normally)
-        return inspect.currentframe().f_back
-
-    def _infer_layer(self) -> Optional[str]:
-        """Extract layer type from module path."""
-
-        mod_path = self.__class__.__module__
-        for layer in KNOWN_LAYERS:
-            if f".{layer}" in mod_path or mod_path.startswith(layer):
-                return layer
-
-        return None
-
-    def _infer_service(self) -> Optional[str]:
-        """Extract service name from module path."""
-
-        mod_parts = self.__class__.__module__.split(".")
-
-        for layer in KNOWN_LAYERS:
-            if layer in mod_parts:
-                idx = mod_parts.index(layer)
-                if len(mod_parts) > idx + 1:
-                    # Service name is after the layer
-                    return mod_parts[idx + 1]
-                # Layer found but no service segment
-                break
 
-        return None
+# ------------------------------------------------------------------------------
+#   Shared base
+#   Implements both core exceptions and warnings
+# ------------------------------------------------------------------------------
 
 
-class CoreWarning(Warning):
-    # Root for all warnings
+class _CoreExceptionBase(Exception, SerializableExceptionMixin, CallerLocationMixin):
+    """Implementation shared by `CoreError` and `CoreWarning`.
+
+    Slotted, so an instance without subclass attributes never allocates a
+    `__dict__`. The layer and service inferred from the module path depend
+    only on the class, so they are computed once per class in
+    `__init_subclass__`.
+    """
+
+    __slots__ = (
+        "message",
+        "error_code",
+        "_file_path",
+        "_line_no",
+        "_file_name",
+        "_caller",
+        "layer",
+        "service",
+        "user_message",
+        "severity",
+        "timestamp",
+    )
+
+    # Set per class
+    _inferred_layer: ClassVar[Optional[str]] = None
+    _inferred_service: ClassVar[Optional[str]] = None
+    _default_severity: ClassVar[str] = "ERROR"
+    _counter: ClassVar[Counter] = ERRORS
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._inferred_layer = cls._infer_layer()
+        cls._inferred_service = cls._infer_service()
 
     def __init__(
         self,
@@ -200,21 +161,14 @@ class CoreWarning(Warning):
         self.message = message
         self.error_code = err_code
 
-        if (file_path is None) or (line_no is None):
-            caller_frame = self._find_caller_frame()
-            self.file_path = caller_frame.f_code.co_filename
-            self.line_no = caller_frame.f_lineno
-        else:
-            self.file_path = file_path
-            self.line_no = line_no
-
-        self.file_name = str(self.file_path).split("/")[-1].split("\\")[-1]
-        self.layer = layer or self._infer_layer()
-        self.service = service or self._infer_service()
+        self._set_location(file_path, line_no)
+        self.layer = layer or self._inferred_layer
+        self.service = service or self._inferred_service
         self.__cause__ = cause
         self.user_message = user_message or message
-        self.severity = severity or "WARNING"
+        self.severity = severity or self._default_severity
         self.timestamp = timestamp or datetime.now(timezone.utc)
+        self._counter.inc(str(err_code), self.__class__.__name__)
 
         if logger:
             log_function = {
@@ -228,6 +182,28 @@ class CoreWarning(Warning):
 
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # Rebuilt from its state, not through `__init__`, which would
+        # re-capture the location, reset the defaults and count it again
+        return (copyreg.__newobj__, (type(self), *self.args), self.__getstate__())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Code objects can't be pickled
+        if self._caller is not None:
+            self._resolve_caller()
+
+        state: Dict[str, Any] = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __str__(self) -> str:
         return (
             f"[{self.error_code}] {self.message} "
@@ -267,53 +243,22 @@ class CoreWarning(Warning):
     #   Private helper methods
     # -------------------------------------------------------------------------
 
-    def _find_caller_frame(self):
-        """Walk up the stack to find caller's frame.
-
-        Detect the frame is of the caller by looking for the first frame that
-        is not part of the exception hierarchy initialization.
-
-        Returns:
-            Caller's frame.
-        """
-
-        frame = inspect.currentframe()
-
-        while frame:
-            frame = frame.f_back
-            if frame is None:
-                break
-
-            # Get the class being called in this frame
-            frame_locals = frame.f_locals
-
-            # Skips frames that are __init__ of exception classes
-            if (
-                "self" in frame_locals
-                and isinstance(frame_locals["self"], CoreError)
-                and frame.f_code.co_name == "__init__"
-            ):
-                continue
-
-            return frame
-
-        # Fallback (shouldn't happen normally)
-        return inspect.currentframe().f_back
-
-    def _infer_layer(self) -> Optional[str]:
+    @classmethod
+    def _infer_layer(cls) -> Optional[str]:
         """Extract layer type from module path."""
 
-        mod_path = self.__class__.__module__
+        mod_path = cls.__module__
         for layer in KNOWN_LAYERS:
             if f".{layer}" in mod_path or mod_path.startswith(layer):
                 return layer
 
         return None
 
-    def _infer_service(self) -> Optional[str]:
+    @classmethod
+    def _infer_service(cls) -> Optional[str]:
         """Extract service name from module path."""
 
-        mod_parts = self.__class__.__module__.split(".")
+        mod_parts = cls.__module__.split(".")
 
         for layer in KNOWN_LAYERS:
             if layer in mod_parts:
@@ -327,6 +272,26 @@ class CoreWarning(Warning):
         return None
 
 
+# ------------------------------------------------------------------------------
+#   Custom exceptions and warnings
+#   Exposed for other exceptions to inherit from
+# ------------------------------------------------------------------------------
+
+
+class CoreError(_CoreExceptionBase):
+    """Base exception for all custom exceptions."""
+
+    __slots__ = ()
+
+
+class CoreWarning(_CoreExceptionBase, Warning):
+    # Root for all warnings
+
+    __slots__ = ()
+    _default_severity = "WARNING"
+    _counter = WARNINGS
+
+
 class CoreCriticalError(Exception):
     # Root for all unrecoverable exceptions, should terminate execution
     pass
@@ -24,10 +24,16 @@ Categories:
    UNK: `Unknown`, unexpected/unclassified, or generic errors
    VAL: `Validation`, input/data format validation
 
+Metadata:
+   `ErrorCode.info` (or `.layer`, `.service`, `.category`, `.severity`,
+   `.description`), and the `CODES_BY_LAYER`, `CODES_BY_SERVICE`,
+   `CODES_BY_CATEGORY` and `CODES_BY_SEVERITY` indexes
+
 Generated by: `{PROJECT_ROOT}/scripts/exceptions/error_code_generator.py`
 """
 
 from enum import StrEnum
+from typing import Dict, NamedTuple, Tuple
 
 class ErrorCode(StrEnum):
     SYS_UNK_UNK_100 = 'SYS-UNK-UNK-100'  # Base for system error - Dont use
@@ -49,4 +55,297 @@ class ErrorCode(StrEnum):
     INF_CFGB_LOOK_524 = 'INF-CFGB-LOOK-524'  # Config model does not have file or console handler
     INF_CFGB_LOOK_525 = 'INF-CFGB-LOOK-525'  # Looking up a nonexistent config builder type
     INF_LOGR_LOOK_526 = 'INF-LOGR-LOOK-526'  # Tried to create duplication of a service logger
-    INF_TDET_CFG_527 = 'INF-TDET-CFG-527'  # Failed to detect a config type
\ No newline at end of file
+    INF_TDET_CFG_527 = 'INF-TDET-CFG-527'  # Failed to detect a config type
+    INF_LOGR_LOOK_528 = 'INF-LOGR-LOOK-528'  # Looking up a nonexistent or closed service logger
+
+    # -------------------------------------------------------------------------
+    #   Metadata
+    #   O(1) lookups into the table below
+    # -------------------------------------------------------------------------
+
+    @property
+    def info(self) -> "ErrorCodeInfo":
+        ordinal = _ORDINALS[self]
+        return ErrorCodeInfo(
+            self,
+            _LAYERS[ordinal],
+            _SERVICES[ordinal],
+            _CATEGORIES[ordinal],
+            _SEVERITIES[ordinal],
+            _DESCRIPTIONS[ordinal],
+        )
+
+    @property
+    def layer(self) -> str:
+        return _LAYERS[_ORDINALS[self]]
+
+    @property
+    def service(self) -> str:
+        return _SERVICES[_ORDINALS[self]]
+
+    @property
+    def category(self) -> str:
+        return _CATEGORIES[_ORDINALS[self]]
+
+    @property
+    def severity(self) -> str:
+        return _SEVERITIES[_ORDINALS[self]]
+
+    @property
+    def description(self) -> str:
+        return _DESCRIPTIONS[_ORDINALS[self]]
+
+
+class ErrorCodeInfo(NamedTuple):
+    code: ErrorCode
+    layer: str
+    service: str
+    category: str
+    severity: str
+    description: str
+
+
+# Struct of arrays, indexed by the member's position in `ErrorCode`
+_LAYERS: Tuple[str, ...] = (
+    'SYS',
+    'APP',
+    'COR',
+    'COR',
+    'COR',
+    'COR',
+    'COR',
+    'DOM',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+    'INF',
+)
+_SERVICES: Tuple[str, ...] = (
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'UNK',
+    'CFGB',
+    'CFGB',
+    'CFGB',
+    'CFGB',
+    'CFGB',
+    'LOGR',
+    'TDET',
+    'LOGR',
+)
+_CATEGORIES: Tuple[str, ...] = (
+    'UNK',
+    'UNK',
+    'UNK',
+    'IO',
+    'IO',
+    'IO',
+    'IO',
+    'UNK',
+    'UNK',
+    'LOOK',
+    'LOOK',
+    'LOOK',
+    'CFG',
+    'LOOK',
+    'LOOK',
+    'LOOK',
+    'LOOK',
+    'LOOK',
+    'LOOK',
+    'CFG',
+    'LOOK',
+)
+_SEVERITIES: Tuple[str, ...] = (
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'WARNING',
+    'ERROR',
+    'WARNING',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+    'ERROR',
+)
+_DESCRIPTIONS: Tuple[str, ...] = (
+    'Base for system error - Dont use',
+    'Base application error - Dont use',
+    'Base core error - Dont use',
+    'FileNotFoundError - file to access is not found',
+    'FileNotFoundWarning - file is not found, but recoverable',
+    'PathNotFoundError - path to access is not found',
+    'PathNotFoundWarning - path is not found, but recoverable',
+    'Base domain error - Dont use',
+    'Base infrastructure error - Dont use',
+    'Failure to lookup something',
+    'Required values are missing',
+    'Accessing nonexistent registry',
+    'Configuration-related error',
+    'Config model does not have name or path',
+    'Config model does not have format or date format',
+    'Config model does not have file output path',
+    'Config model does not have file or console handler',
+    'Looking up a nonexistent config builder type',
+    'Tried to create duplication of a service logger',
+    'Failed to detect a config type',
+    'Looking up a nonexistent or closed service logger',
+)
+
+_ORDINALS: Dict[str, int] = {
+    code: ordinal for ordinal, code in enumerate(ErrorCode)
+}
+
+# Indexes, e.g. for aggregating metrics or routing alerts
+CODES_BY_LAYER: Dict[str, Tuple[ErrorCode, ...]] = {
+    'SYS': (
+        ErrorCode.SYS_UNK_UNK_100,
+    ),
+    'APP': (
+        ErrorCode.APP_UNK_UNK_200,
+    ),
+    'COR': (
+        ErrorCode.COR_UNK_UNK_300,
+        ErrorCode.COR_UNK_IO_301,
+        ErrorCode.COR_UNK_IO_302,
+        ErrorCode.COR_UNK_IO_303,
+        ErrorCode.COR_UNK_IO_304,
+    ),
+    'DOM': (
+        ErrorCode.DOM_UNK_UNK_400,
+    ),
+    'INF': (
+        ErrorCode.INF_UNK_UNK_500,
+        ErrorCode.INF_UNK_LOOK_501,
+        ErrorCode.INF_UNK_LOOK_502,
+        ErrorCode.INF_UNK_LOOK_503,
+        ErrorCode.INF_UNK_CFG_504,
+        ErrorCode.INF_CFGB_LOOK_521,
+        ErrorCode.INF_CFGB_LOOK_522,
+        ErrorCode.INF_CFGB_LOOK_523,
+        ErrorCode.INF_CFGB_LOOK_524,
+        ErrorCode.INF_CFGB_LOOK_525,
+        ErrorCode.INF_LOGR_LOOK_526,
+        ErrorCode.INF_TDET_CFG_527,
+        ErrorCode.INF_LOGR_LOOK_528,
+    ),
+}
+CODES_BY_SERVICE: Dict[str, Tuple[ErrorCode, ...]] = {
+    'UNK': (
+        ErrorCode.SYS_UNK_UNK_100,
+        ErrorCode.APP_UNK_UNK_200,
+        ErrorCode.COR_UNK_UNK_300,
+        ErrorCode.COR_UNK_IO_301,
+        ErrorCode.COR_UNK_IO_302,
+        ErrorCode.COR_UNK_IO_303,
+        ErrorCode.COR_UNK_IO_304,
+        ErrorCode.DOM_UNK_UNK_400,
+        ErrorCode.INF_UNK_UNK_500,
+        ErrorCode.INF_UNK_LOOK_501,
+        ErrorCode.INF_UNK_LOOK_502,
+        ErrorCode.INF_UNK_LOOK_503,
+        ErrorCode.INF_UNK_CFG_504,
+    ),
+    'CFGB': (
+        ErrorCode.INF_CFGB_LOOK_521,
+        ErrorCode.INF_CFGB_LOOK_522,
+        ErrorCode.INF_CFGB_LOOK_523,
+        ErrorCode.INF_CFGB_LOOK_524,
+        ErrorCode.INF_CFGB_LOOK_525,
+    ),
+    'LOGR': (
+        ErrorCode.INF_LOGR_LOOK_526,
+        ErrorCode.INF_LOGR_LOOK_528,
+    ),
+    'TDET': (
+        ErrorCode.INF_TDET_CFG_527,
+    ),
+}
+CODES_BY_CATEGORY: Dict[str, Tuple[ErrorCode, ...]] = {
+    'UNK': (
+        ErrorCode.SYS_UNK_UNK_100,
+        ErrorCode.APP_UNK_UNK_200,
+        ErrorCode.COR_UNK_UNK_300,
+        ErrorCode.DOM_UNK_UNK_400,
+        ErrorCode.INF_UNK_UNK_500,
+    ),
+    'IO': (
+        ErrorCode.COR_UNK_IO_301,
+        ErrorCode.COR_UNK_IO_302,
+        ErrorCode.COR_UNK_IO_303,
+        ErrorCode.COR_UNK_IO_304,
+    ),
+    'LOOK': (
+        ErrorCode.INF_UNK_LOOK_501,
+        ErrorCode.INF_UNK_LOOK_502,
+        ErrorCode.INF_UNK_LOOK_503,
+        ErrorCode.INF_CFGB_LOOK_521,
+        ErrorCode.INF_CFGB_LOOK_522,
+        ErrorCode.INF_CFGB_LOOK_523,
+        ErrorCode.INF_CFGB_LOOK_524,
+        ErrorCode.INF_CFGB_LOOK_525,
+        ErrorCode.INF_LOGR_LOOK_526,
+        ErrorCode.INF_LOGR_LOOK_528,
+    ),
+    'CFG': (
+        ErrorCode.INF_UNK_CFG_504,
+        ErrorCode.INF_TDET_CFG_527,
+    ),
+}
+CODES_BY_SEVERITY: Dict[str, Tuple[ErrorCode, ...]] = {
+    'ERROR': (
+        ErrorCode.SYS_UNK_UNK_100,
+        ErrorCode.APP_UNK_UNK_200,
+        ErrorCode.COR_UNK_UNK_300,
+        ErrorCode.COR_UNK_IO_301,
+        ErrorCode.COR_UNK_IO_303,
+        ErrorCode.DOM_UNK_UNK_400,
+        ErrorCode.INF_UNK_UNK_500,
+        ErrorCode.INF_UNK_LOOK_501,
+        ErrorCode.INF_UNK_LOOK_502,
+        ErrorCode.INF_UNK_LOOK_503,
+        ErrorCode.INF_UNK_CFG_504,
+        ErrorCode.INF_CFGB_LOOK_521,
+        ErrorCode.INF_CFGB_LOOK_522,
+        ErrorCode.INF_CFGB_LOOK_523,
+        ErrorCode.INF_CFGB_LOOK_524,
+        ErrorCode.INF_CFGB_LOOK_525,
+        ErrorCode.INF_LOGR_LOOK_526,
+        ErrorCode.INF_TDET_CFG_527,
+        ErrorCode.INF_LOGR_LOOK_528,
+    ),
+    'WARNING': (
+        ErrorCode.COR_UNK_IO_302,
+        ErrorCode.COR_UNK_IO_304,
+    ),
+}
\ No newline at end of file
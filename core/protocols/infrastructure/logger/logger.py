@@ -1,5 +1,7 @@
-from typing import Protocol
+import logging
+from typing import Optional, Protocol, TextIO
 
+from .....shared.logger.aliases import LogMessage
 from .....shared.logger.log_levels import LogLevel
 
 
@@ -18,26 +20,47 @@ class ServiceLoggerProtocol(Protocol):
     #   Public methods
     # -------------------------------------------------------------------------
 
-    def debug(self, message: str, **context):
+    def debug(self, message: LogMessage, *args, **context):
         """Log with debug level."""
         ...
 
-    def info(self, message: str, **context):
+    def info(self, message: LogMessage, *args, **context):
         """Log with info level."""
         ...
 
-    def warning(self, message: str, **context):
+    def warning(self, message: LogMessage, *args, **context):
         """Log with warning level."""
         ...
 
-    def error(self, message: str, **context):
+    def error(self, message: LogMessage, *args, **context):
         """Log with error level."""
         ...
 
-    def critical(self, message: str, **context):
+    def critical(self, message: LogMessage, *args, **context):
         """Log with critical level."""
         ...
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if a record of this level would be emitted."""
+        ...
+
+    def set_levels(
+        self,
+        *,
+        console_level: Optional[LogLevel] = None,
+        file_level: Optional[LogLevel] = None,
+    ):
+        """Re-level the console and/or file output in place."""
+        ...
+
+    def dump_recent(self, stream: TextIO) -> int:
+        """Write the records kept in memory, oldest first."""
+        ...
+
+    def redirect(self, handler: logging.Handler):
+        """Hand records to another handler instead of its own."""
+        ...
+
     # -------------------------------------------------------------------------
     #   Helper methods
     # -------------------------------------------------------------------------
@@ -45,7 +68,8 @@ class ServiceLoggerProtocol(Protocol):
     def _log_with_context(
         self,
         level: LogLevel,
-        message: str,
+        message: LogMessage,
+        *args,
         **context,
     ):
         """Log with additional context data."""
@@ -55,6 +79,11 @@ class ServiceLoggerProtocol(Protocol):
     #   Close method
     # -------------------------------------------------------------------------
 
-    def close(self):
-        """Clean shutdown of this logger."""
+    def close(self, timeout: Optional[float] = None):
+        """Clean shutdown of this logger.
+
+        Args:
+            timeout (float): Max seconds to wait for pending records to be
+                written, if the logger is asynchronous
+        """
         ...
@@ -1,8 +1,20 @@
 __version__ = "1.0.0"
 __author__ = "Amjko2234"
 
-from .manager import create_config_builder
+from .manager import (
+    create_config_builder,
+    enable_config_snapshots,
+    start_config_reloading,
+    stop_config_reloading,
+    subscribe_config_changes,
+)
+from .services.reload import ConfigChange
 
 __all__ = [
+    "ConfigChange",
     "create_config_builder",
+    "enable_config_snapshots",
+    "start_config_reloading",
+    "stop_config_reloading",
+    "subscribe_config_changes",
 ]
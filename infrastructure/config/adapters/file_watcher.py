@@ -0,0 +1,154 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from ..protocol.file_watcher import FileWatcherProtocol
+
+# inotify(7) flags
+IN_CLOSE_WRITE = 0x0000_0008
+IN_MOVED_TO = 0x0000_0080
+IN_CREATE = 0x0000_0100
+IN_IGNORED = 0x0000_8000
+IN_NONBLOCK = 0x0000_0800
+IN_CLOEXEC = 0x0008_0000
+
+# Written and closed, or replaced by a rename as editors save; not every
+# `write`, so a file is never read half-written
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# `struct inotify_event`: wd, mask, cookie, name length, then the name
+INOTIFY_EVENT = struct.Struct("iIII")
+READ_SIZE = 64 * 1024
+
+
+class _InotifyWatcher:
+    """Waits on inotify events of the watched files' directories.
+
+    Directories are watched, not files, so a file replaced by a rename is
+    still seen; events of other files in them are ignored. Linux only.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self._fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        # Watch descriptor -> watched directory
+        self._directories: Dict[int, Path] = {}
+
+    def wait(
+        self,
+        paths: Set[Path],
+        timeout: float,
+    ) -> Set[Path]:
+
+        self._watch_directories({path.parent for path in paths})
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, READ_SIZE)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            # The directory was removed, watched again once it's back
+            if mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if path in paths:
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _watch_directories(self, directories: Set[Path]):
+        for directory in directories - set(self._directories.values()):
+            wd = self._add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            # e.g. a missing directory, retried on the next wait
+            if wd >= 0:
+                self._directories[wd] = directory
+
+
+class _PollingWatcher:
+    """Compares the files' mtime and size after every wait.
+
+    Portable fallback of `_InotifyWatcher`; a change is seen up to one
+    `timeout` late.
+    """
+
+    def __init__(self):
+        # Path -> (mtime_ns, size), None if missing
+        self._stats: Dict[Path, Optional[Tuple[int, int]]] = {}
+
+    def wait(
+        self,
+        paths: Set[Path],
+        timeout: float,
+    ) -> Set[Path]:
+
+        # Newly watched files are compared from now on
+        for path in paths - self._stats.keys():
+            self._stats[path] = self._stat(path)
+        for path in self._stats.keys() - paths:
+            del self._stats[path]
+
+        time.sleep(timeout)
+
+        changed: Set[Path] = set()
+        for path in paths:
+            stat = self._stat(path)
+            if stat != self._stats[path]:
+                self._stats[path] = stat
+                changed.add(path)
+        return changed
+
+    def close(self):
+        self._stats.clear()
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+def create_file_watcher(use_inotify: bool = True) -> FileWatcherProtocol:
+    """Create an inotify watcher where available, a polling one otherwise."""
+
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher()
+        except (OSError, AttributeError):
+            # No inotify in libc, or out of inotify instances
+            pass
+    return _PollingWatcher()
@@ -41,9 +41,7 @@ class LoggerConfigBuilder(BaseConfigBuilder[LoggerConfig]):
 
         # Validate to avoid unwanted values
         console = self._validated_copy(self._current_config.console, level=level)
-        self._current_config = self._current_config.model_copy(
-            update={"console": console}
-        )
+        self._current_config = self._replaced(self._current_config, console=console)
         return self
 
     def with_file_level(self, level: LogLevel) -> "LoggerConfigBuilder":
@@ -61,5 +59,5 @@ class LoggerConfigBuilder(BaseConfigBuilder[LoggerConfig]):
 
         # Validate to avoid unwanted values
         file = self._validated_copy(self._current_config.file, level=level)
-        self._current_config = self._current_config.model_copy(update={"file": file})
+        self._current_config = self._replaced(self._current_config, file=file)
         return self
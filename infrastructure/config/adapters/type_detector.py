@@ -1,10 +1,13 @@
+import io
 import json
+import os
 import re
 from collections.abc import Callable
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
+from dotenv import dotenv_values
 
 from ....config.paths import get_relative
 from ....core.exceptions.base import CoreError, CoreWarning
@@ -16,6 +19,7 @@ from ....shared.utils import PathUtils
 from ....shared.utils.str_formatter import blue, bold, green, italic, red, underline
 from ..exceptions import UnknownConfigTypeDetector
 from ..protocol.type_detector import CfgTypeDetectorProtocol
+from ..services.cache import LoadedConfig, loaded_config_cache
 
 MIN_YAML_INDICATORS = 0
 MIN_YAML_SIGNIFICANCE = 0.3
@@ -23,13 +27,27 @@ MIN_REQ_ENV_LINES = 0
 MIN_NON_COMMENT_LINES = 0
 MIN_ENV_SIGNIFICANCE = 0.7
 
+# Returned by the parsers when the content is not of their type
+_PARSE_FAILED: Any = object()
+
+_Parse = Callable[[ConfigType], Any]
+"""Parses the file's content as a type, at most once per type."""
+
 
 class _ConfigTypeDetector:
+    """Detects a config file's type and loads it from a single read.
+
+    The file is read into memory once; every detector works on that
+    content, and each type is parsed at most once. The parse that confirms
+    the type is returned as the loaded config, and cached process-wide
+    until the file's mtime or size changes.
+    """
 
     SUPPORTED_TYPES: Dict[str, ConfigType] = {
-        "json": ".json",
-        "yaml": ".yaml",
-        "env": ".env",
+        "json": "json",
+        "yaml": "yaml",
+        "yml": "yaml",
+        "env": "env",
     }
 
     def __init__(
@@ -41,7 +59,7 @@ class _ConfigTypeDetector:
 
         self.logger = logger
         self.enable_content_validation = enable_content_validation
-        self.detectors: List[Callable[[Path | str], Optional[ConfigType]]] = [
+        self.detectors: List[Callable[[Path, str, _Parse], Optional[ConfigType]]] = [
             self._detect_by_extension,
             self._detect_by_content_struct,
             self._detect_by_parsing_attempt,
@@ -56,6 +74,27 @@ class _ConfigTypeDetector:
         file_path: Path | str,
     ) -> ConfigType:
 
+        return self.load(file_path).type
+
+    def load(
+        self,
+        file_path: Path | str,
+        config_type: Optional[ConfigType] = None,
+        *,
+        source: Optional[bytes] = None,
+    ) -> LoadedConfig:
+        """Detect the file's type, or use `config_type`, and parse it.
+
+        Unchanged files are served from the cache without reading them.
+
+        Args:
+            file_path (Path | str): Path to the config file
+            config_type (ConfigType): Known file type, skips the detection
+            source (bytes): The file's content, if the caller already read
+                it; parsed instead of reading the file again, and not cached
+                as its version is unknown
+        """
+
         try:
             path = PathUtils.validate_path(file_path)
         except FileNotFoundError:
@@ -63,22 +102,64 @@ class _ConfigTypeDetector:
         except PathNotFoundError:
             raise
 
+        stat: Optional[os.stat_result] = None
+        if source is None:
+            stat = os.stat(path)
+            loaded = loaded_config_cache.get(path, stat)
+            if loaded is not None and config_type in (None, loaded.type):
+                return loaded
+
+            with PathUtils.open_file(path) as file:
+                content = file.read().strip()
+        else:
+            # Decoded as `PathUtils.open_file` reads it
+            with io.TextIOWrapper(io.BytesIO(source), encoding="utf-8") as file:
+                content = file.read().strip()
+
+        parsed: Dict[ConfigType, Any] = {}
+
+        def parse(_type: ConfigType) -> Any:
+            if _type not in parsed:
+                parsed[_type] = self._parse(content, _type)
+            return parsed[_type]
+
+        if config_type is None:
+            config_type = self._detect(path, content, parse)
+        data = parse(config_type)
+        if data is _PARSE_FAILED:
+            raise UnknownConfigTypeDetector(
+                f"Unable to parse {underline(f'{get_relative(path)}')} "
+                f"as {blue(f'{config_type.upper()}')}"
+            )
+
+        loaded = LoadedConfig(type=config_type, data=data)
+        if stat is not None:
+            loaded_config_cache.put(path, stat, loaded)
+        return loaded
+
+    # -------------------------------------------------------------------------
+    #   Private methods
+    #   Main detectors
+    # -------------------------------------------------------------------------
+
+    def _detect(self, path: Path, content: str, parse: _Parse) -> ConfigType:
+        """Run the detectors in order, until one's type parses the content."""
+
         detected_type: Optional[ConfigType] = None
         detection_method: Optional[str] = None
         for detector in self.detectors:
             try:
-                result = detector(path)
-                if result and result in self.SUPPORTED_TYPES:
-                    detected_type = result
+                result = detector(path, content, parse)
+                if result and result in self.SUPPORTED_TYPES.values():
                     detection_method = detector.__name__
                     self.logger.debug(
-                        f"Detected {blue(f'{result.upper()}')} "
+                        lambda: f"Detected {blue(f'{result.upper()}')} "
                         f"for {underline(f'{get_relative(path)}')} "
                         f"{italic(f'(using {detection_method})')}"
                     )
 
                     if (self.enable_content_validation) and (
-                        not self._validate_detection(path, result)
+                        parse(result) is _PARSE_FAILED
                     ):
                         self.logger.warning(
                             f"Content validation failed "
@@ -87,10 +168,11 @@ class _ConfigTypeDetector:
                         )
                         continue
 
+                    detected_type = result
                     break
             except (CoreError, CoreWarning) as err:
                 self.logger.debug(
-                    f"Detector {underline(f'{detector.__name__}')} failed "
+                    lambda: f"Detector {underline(f'{detector.__name__}')} failed "
                     f"for {underline(f'{get_relative(path)}')} "
                     f"{red(f'{err}')}"
                 )
@@ -104,99 +186,59 @@ class _ConfigTypeDetector:
             )
 
         self.logger.info(
-            f"Successfully detector {underline(f'{get_relative(path)}')} "
+            f"Successfully detected {underline(f'{get_relative(path)}')} "
             f"as {blue(f'{detected_type.upper()}')} "
             f"{italic(f'(via {detection_method})')}"
         )
         return detected_type
 
-    # -------------------------------------------------------------------------
-    #   Private methods
-    #   Main detectors
-    # -------------------------------------------------------------------------
-
     def _detect_by_extension(
         self,
-        file_path: Path | str,
-    ) -> Optional[str]:
+        path: Path,
+        content: str,
+        parse: _Parse,
+    ) -> Optional[ConfigType]:
         """Detect type based on file extension."""
 
-        extension = Path(file_path).suffix.lower().replace(".", "")
+        extension = path.suffix.lower().replace(".", "")
+        # e.g. `.env` has no suffix, only a name
+        if not extension and path.name.startswith("."):
+            extension = path.name[1:].lower()
         return self.SUPPORTED_TYPES.get(extension)
 
     def _detect_by_content_struct(
         self,
-        file_path: Path | str,
-    ) -> Optional[str]:
+        path: Path,
+        content: str,
+        parse: _Parse,
+    ) -> Optional[ConfigType]:
         """Detect type by analyzing content structure patterns."""
 
-        try:
-            path = Path(file_path)
-            with PathUtils.open_file(path) as file:
-                content = file.read().strip()
-            if not content:
-                return None
-            if self._is_json(content):
-                return "json"
-            if self._is_env(content):
-                return "env"
-            if self._is_yaml(content):  # More permissive, so last
-                return "yaml"
-            return None
-        except CoreError as err:
-            self.logger.debug(
-                f"Content struct analysis failed for {get_relative(path)}: {err}"
-            )
+        if not content:
             return None
+        if self._is_json(content):
+            return "json"
+        if self._is_env(content):
+            return "env"
+        if self._is_yaml(content):  # More permissive, so last
+            return "yaml"
+        return None
 
     def _detect_by_parsing_attempt(
         self,
-        file_path: Path | str,
-    ) -> Optional[str]:
+        path: Path,
+        content: str,
+        parse: _Parse,
+    ) -> Optional[ConfigType]:
         """Detect type by attempting to parse with each format."""
 
-        try:
-            path = Path(file_path)
-            with PathUtils.open_file(path) as file:
-                content = file.read().strip()
-            if not content:
-                return None
-            if self._parse_json(content):  # Stricter parser so prioritize
-                return "json"
-            if self._parse_yaml(content):  # More permissive, so after json
-                return "yaml"
-            if self._parse_env(content):
-                return "env"
-            return None
-        except CoreError as err:
-            self.logger.debug(
-                f"Parse attempt detection failed for {get_relative(path)}: {err}"
-            )
+        if not content:
             return None
-
-    def _validate_detection(
-        self,
-        file_path: Path | str,
-        detected_type: str,
-    ) -> bool:
-        """Validate that the detected type can actually parse the file."""
-
-        try:
-            path = Path(file_path)
-            with PathUtils.open_file(path) as file:
-                content = file.read().strip()
-
-            if detected_type == "json":
-                return self._parse_json(content)
-            elif detected_type == "yaml":
-                return self._parse_yaml(content)
-            elif detected_type == "env":
-                return self._parse_env(content)
-            return False
-
-        except CoreError as err:
-            self.logger.debug(f"Validation failed for {get_relative(path)}: {err}")
-            return False
+        # Stricter parser first, YAML parses nearly anything
+        for config_type in ("json", "yaml", "env"):
+            if parse(config_type) is not _PARSE_FAILED:
+                return config_type
+        return None
 
     # -------------------------------------------------------------------------
     #   Private methods
@@ -283,29 +325,41 @@ class _ConfigTypeDetector:
 
     # -------------------------------------------------------------------------
     #   Private methods
-    #   Helpers for detection by parsing attempt
+    #   Parsers, return `_PARSE_FAILED` if the content is not of their type
     # -------------------------------------------------------------------------
 
-    def _parse_json(self, content: str) -> bool:
+    def _parse(self, content: str, config_type: ConfigType) -> Any:
+        match config_type:
+            case "json":
+                return self._parse_json(content)
+            case "yaml":
+                return self._parse_yaml(content)
+            case "env":
+                return self._parse_env(content)
+            case _:
+                return _PARSE_FAILED
+
+    def _parse_json(self, content: str) -> Any:
         """Attempt to parse content as JSON."""
 
         try:
-            json.loads(content)
-            return True
+            return json.loads(content)
         except Exception:
-            return False
+            return _PARSE_FAILED
 
-    def _parse_yaml(self, content: str) -> bool:
+    def _parse_yaml(self, content: str) -> Any:
         """Attempt to parse content as YAML."""
 
         try:
             result = yaml.safe_load(content)
-            # Additional checks because YAML can parse anything
-            return result is not None and not isinstance(result, str)
         except Exception:
-            return False
+            return _PARSE_FAILED
+        # Additional checks because YAML can parse anything
+        if result is None or isinstance(result, str):
+            return _PARSE_FAILED
+        return result
 
-    def _parse_env(self, content: str) -> bool:
+    def _parse_env(self, content: str) -> Any:
         """Attempt to parse content as ENV file."""
 
         try:
@@ -323,10 +377,12 @@ class _ConfigTypeDetector:
                     if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", key.strip()):
                         valid_entries += 1
                     else:
-                        return False
+                        return _PARSE_FAILED
                 # A non-empty, non-comment line not containing key=value
                 elif line:
-                    return False
-            return valid_entries > 0
+                    return _PARSE_FAILED
+            if not valid_entries:
+                return _PARSE_FAILED
+            return dict(dotenv_values(stream=io.StringIO(content)))
         except Exception:
-            return False
+            return _PARSE_FAILED
@@ -1,16 +1,21 @@
+import asyncio
+from collections.abc import Callable
 from logging import getLogger
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Literal, Optional, overload
+from typing import Any, Dict, List, Literal, Optional, overload
 
 from pydantic import BaseModel
 
 from ...core.exceptions.error_codes import ErrorCode
-from ..exceptions import RegistryLookupError
+from ..exceptions import LookupError, RegistryLookupError
+from ..logger import LoggerManager
 from .adapters.logger_builder import LoggerConfigBuilder
 from .registry import BUILDER_REGISTRY, BuilderRegistry
 from .services.base_builder import BaseConfigBuilder
 from .services.factory import _ConfigBuilderFactory
+from .services.reload import ConfigChange, ConfigSubscriber, _ConfigReloader
+from .services.snapshot import DEFAULT_SNAPSHOT_PATH
 
 
 class ConfigBuilderManager:
@@ -40,6 +45,12 @@ class ConfigBuilderManager:
             return
 
         self._factory = _ConfigBuilderFactory()
+        self._reloader = _ConfigReloader(
+            self._factory.load_config,
+            logger=LoggerManager().system_logger,
+        )
+        # Active loggers follow their reloaded config's levels
+        self._reloader.subscribe(_relevel_logger, builder_type="logger")
         self._initialized = True
 
     # -------------------------------------------------------------------------
@@ -64,13 +75,74 @@ class ConfigBuilderManager:
         if builder_key not in self._builders:
             with self._lock:
                 if builder_key not in self._builders:
-                    self._builders[builder_key] = self._factory.create_builder(
-                        builder_type,
-                        Path(path),
-                    )
+                    builder = self._factory.create_builder(builder_type, Path(path))
+                    self._reloader.watch(builder_type, path, builder)
+                    self._builders[builder_key] = builder
 
         return self._builders[builder_key]
 
+    def enable_snapshots(self, path: Optional[Path | str] = DEFAULT_SNAPSHOT_PATH):
+        """Skip loading unchanged configs, see `_ConfigSnapshotCache`.
+
+        Call before creating the builders; disabled if `path` is None.
+        """
+
+        self._factory.enable_snapshots(path)
+
+    def flush_snapshots(self):
+        """Write the snapshots added since startup, e.g. once it's done.
+
+        Otherwise they are written on exit.
+        """
+
+        snapshots = self._factory._snapshot_cache
+        if snapshots:
+            snapshots.flush()
+
+    # -------------------------------------------------------------------------
+    #   Reload methods
+    # -------------------------------------------------------------------------
+
+    def start_reloading(self, poll_interval: float = 1.0, use_inotify: bool = True):
+        """Watch the created builders' files, and reload them on change.
+
+        See `_ConfigReloader.start`.
+        """
+
+        self._reloader.start(poll_interval, use_inotify)
+
+    def stop_reloading(self, timeout: Optional[float] = None):
+        self._reloader.stop(timeout)
+
+    def reload(self, path: Path | str) -> List[ConfigChange]:
+        """Reload a file's builders now, e.g. on a signal or command."""
+
+        return self._reloader.reload(path)
+
+    def subscribe(
+        self,
+        callback: ConfigSubscriber,
+        *,
+        builder_type: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Callable[[], None]:
+        """Call `callback` with every reloaded config.
+
+        See `_ConfigReloader.subscribe`.
+        """
+
+        return self._reloader.subscribe(callback, builder_type=builder_type, loop=loop)
+
+
+def _relevel_logger(change: ConfigChange):
+    """Re-level the active logger of a reloaded logger config."""
+
+    try:
+        LoggerManager().apply_config(change.config)  # type: ignore[arg-type]
+    except LookupError:
+        # Not created yet, it will be built from the reloaded config
+        pass
+
 
 # -----------------------------------------------------------------------------
 #   Public API
@@ -112,3 +184,54 @@ def create_config_builder(
     """
 
     return config_builder_manager.create_builder(builder_type, path)
+
+
+def enable_config_snapshots(path: Optional[Path | str] = DEFAULT_SNAPSHOT_PATH):
+    """Load validated configs from a snapshot file on the next startups.
+
+    A config whose file and model are unchanged since it was last validated
+    skips type detection, parsing and validation. Call before creating the
+    builders.
+
+    Args:
+        path: The snapshot file, under `data/` by default; None disables
+    """
+
+    config_builder_manager.enable_snapshots(path)
+
+
+def subscribe_config_changes(
+    callback: ConfigSubscriber,
+    *,
+    builder_type: Optional[str] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Callable[[], None]:
+    """Call `callback` with every reloaded config.
+
+    Args:
+        callback: Called with the `ConfigChange`
+        builder_type: Only changes of this builder type, any if None
+        loop: Call it on this loop's thread, not the reload thread
+
+    Returns:
+        A function that unsubscribes the callback.
+    """
+
+    return config_builder_manager.subscribe(
+        callback, builder_type=builder_type, loop=loop
+    )
+
+
+def start_config_reloading(poll_interval: float = 1.0, use_inotify: bool = True):
+    """Reload the created builders' configs when their files change.
+
+    Args:
+        poll_interval: Seconds between stats when inotify is unavailable
+        use_inotify: Use inotify where available
+    """
+
+    config_builder_manager.start_reloading(poll_interval, use_inotify)
+
+
+def stop_config_reloading(timeout: Optional[float] = None):
+    config_builder_manager.stop_reloading(timeout)
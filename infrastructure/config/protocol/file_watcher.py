@@ -0,0 +1,25 @@
+from pathlib import Path
+from typing import Protocol, Set
+
+
+class FileWatcherProtocol(Protocol):
+
+    def wait(
+        self,
+        paths: Set[Path],
+        timeout: float,
+    ) -> Set[Path]:
+        """Wait for any of the files to change.
+
+        Args:
+            paths (Set[Path]): Resolved paths of the watched files
+            timeout (float): Max seconds to wait
+
+        Returns:
+            The paths that changed, empty on timeout.
+        """
+        ...
+
+    def close(self):
+        """Release the watcher's resources."""
+        ...
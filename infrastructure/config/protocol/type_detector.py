@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Optional, Protocol
 
 from ....shared.config import ConfigType
+from ..services.cache import LoadedConfig
 
 
 class CfgTypeDetectorProtocol(Protocol):
@@ -23,3 +24,26 @@ class CfgTypeDetectorProtocol(Protocol):
             ...
         """
         ...
+
+    def load(
+        self,
+        file_path: Path | str,
+        config_type: Optional[ConfigType] = None,
+        *,
+        source: Optional[bytes] = None,
+    ) -> LoadedConfig:
+        """Detect configuration file type, and parse the file from the same read.
+
+        Args:
+            file_path (Path | str): Path to configuration file
+            config_type (ConfigType): Known file type, skips the detection
+            source (bytes): The file's content, if already read by the caller
+
+        Returns:
+            The file's type and parsed values, shared with other callers
+            while the file is unchanged.
+
+        Raises:
+            ...
+        """
+        ...
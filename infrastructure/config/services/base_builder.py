@@ -1,9 +1,10 @@
 from abc import ABC
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
 ConfigType = TypeVar("ConfigType", bound=BaseModel, covariant=True)
+ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
 class BaseConfigBuilder(Generic[ConfigType], ABC):
@@ -19,8 +20,14 @@ class BaseConfigBuilder(Generic[ConfigType], ABC):
         - reset(): Resets internal config to its original default state
         - build(): Finalizes and returns current config
 
+    Configs are frozen and copied on write: an override re-validates only
+    the sub-model it touches, and shares every other sub-model with the
+    config it was applied to. `build()` returns the same instance until an
+    override changes something, so building per-request variants is cheap.
+
     Notes:
-        - Do not mutate fields of `self._base_config`, `self._current_config`.
+        - Do not mutate fields of `self._base_config`, `self._current_config`,
+          including their lists and dicts; they are shared between builds.
         - This class enforces read-only semantics/config state to satisfy
           covariance.
         - This class should not be instantiated directly.
@@ -28,7 +35,7 @@ class BaseConfigBuilder(Generic[ConfigType], ABC):
 
     def __init__(self, config: ConfigType):
         self._base_config = config
-        self._current_config = config.model_copy(deep=True)
+        self._current_config = config
 
     def reset(self) -> "BaseConfigBuilder[ConfigType]":
         """Reset to base configuration.
@@ -38,7 +45,7 @@ class BaseConfigBuilder(Generic[ConfigType], ABC):
             apply the changes and get the config itself.
         """
 
-        self._current_config = self._base_config.model_copy(deep=True)
+        self._current_config = self._base_config
         return self
 
     def build(self) -> ConfigType:
@@ -49,10 +56,28 @@ class BaseConfigBuilder(Generic[ConfigType], ABC):
             to the config.
 
         Returns:
-            The config.
+            The config, shared and immutable; the same instance as the last
+            build if nothing changed since.
         """
 
-        return self._current_config.model_copy(deep=True)
+        return self._current_config
+
+    def replace_base(self, config: ConfigType) -> bool:  # type: ignore[misc]
+        """Swap in a reloaded base configuration.
+
+        Each attribute is replaced whole, so a concurrent `build()` gets
+        either the previous or the new config. Changes applied since the
+        last `reset()` are discarded.
+
+        Returns:
+            Whether the config differs from the previous base.
+        """
+
+        if config == self._base_config:
+            return False
+        self._base_config = config
+        self._current_config = config
+        return True
 
     # -------------------------------------------------------------------------
     #   Abstract methods
@@ -71,17 +96,40 @@ class BaseConfigBuilder(Generic[ConfigType], ABC):
     #   reconfig data
     # -------------------------------------------------------------------------
 
-    def _validated_copy(self, model: BaseModel, **kwupdate) -> BaseModel:
+    def _validated_copy(self, model: ModelType, **kwupdate: Any) -> ModelType:
         """Update and validate changes to config.
 
+        Only `model`'s own fields are re-validated; its sub-models are
+        passed as is, and shared with `model`.
+
         Args:
             model: The model to validate `kwupdate` in.
             kwupdate: The changes to make in the config.
 
         Returns:
-            Updated and validated config instance.
+            Updated and validated config instance, or `model` itself if
+            every value is unchanged.
         """
 
-        data = model.model_dump()
+        if all(getattr(model, key) == value for key, value in kwupdate.items()):
+            return model
+
+        data = dict(model)
         data.update(kwupdate)
         return model.__class__(**data)
+
+    def _replaced(self, model: ModelType, **update: Any) -> ModelType:
+        """Copy `model` with already validated fields replaced.
+
+        Args:
+            model: The model to replace fields of, e.g. the current config.
+            update: Validated values, e.g. from `_validated_copy`.
+
+        Returns:
+            A shallow copy sharing the other fields, or `model` itself if
+            every value is the same instance.
+        """
+
+        if all(getattr(model, key) is value for key, value in update.items()):
+            return model
+        return model.model_copy(update=update)
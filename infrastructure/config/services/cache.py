@@ -0,0 +1,73 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from ....shared.config import ConfigType, ConfigValues
+
+# Resolved path -> (mtime_ns, size, loaded config)
+_Entry = Tuple[int, int, "LoadedConfig"]
+
+
+@dataclass(frozen=True)
+class LoadedConfig:
+    """A config file's detected type and its parsed values.
+
+    Note:
+        Shared by every caller loading the unchanged file, don't mutate
+        `data`.
+    """
+
+    type: ConfigType
+    data: ConfigValues
+
+
+class _LoadedConfigCache:
+    """Process-wide cache of loaded config files.
+
+    An entry is valid while the file's `mtime_ns` and size are unchanged, so
+    a hit costs one `stat` and no read or parse. Only the latest version of
+    each file is kept.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, _Entry] = {}
+        self._lock = Lock()
+
+    def get(self, path: Path, stat: os.stat_result) -> Optional[LoadedConfig]:
+        """Get the file's loaded config, if it's unchanged since loaded."""
+
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+
+        mtime_ns, size, loaded = entry
+        if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return loaded
+
+    def put(self, path: Path, stat: os.stat_result, loaded: LoadedConfig):
+        """Store a file's loaded config.
+
+        Args:
+            path (Path): Resolved path of the file
+            stat (os.stat_result): Taken before the file was read, so a
+                change while reading invalidates the entry
+            loaded (LoadedConfig): The file's type and values
+        """
+
+        with self._lock:
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, loaded)
+
+    def invalidate(self, path: Optional[Path] = None):
+        """Drop a file's entry, or every entry if no path is given."""
+
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+loaded_config_cache = _LoadedConfigCache()
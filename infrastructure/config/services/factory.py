@@ -5,19 +5,20 @@ from a global registry (`BUILDER_REGISTRY`). Intended to be the single entry
 point for config builder creation.
 """
 
+import copy
 from pathlib import Path
 from typing import Any, List, Literal, Optional, overload
 
-import jsonschema
 from pydantic import BaseModel
 
 from ....shared.config import ConfigValues, EnvConfig, JsonConfig, YamlConfig
-from ....shared.utils import IOUtils
+from ....shared.utils import PathUtils, SchemaUtils
 from ...logger import LoggerManager
 from ..adapters.type_detector import _ConfigTypeDetector
 from ..protocol.type_detector import CfgTypeDetectorProtocol
 from ..registry import BUILDER_REGISTRY, VALIDATION_REGISTRY, ValidationEntry
 from .base_builder import BaseConfigBuilder
+from .snapshot import DEFAULT_SNAPSHOT_PATH, _ConfigSnapshotCache
 
 
 class _ConfigBuilderFactory:
@@ -34,6 +35,8 @@ class _ConfigBuilderFactory:
     _cfg_type_detector: Optional[CfgTypeDetectorProtocol] = _ConfigTypeDetector(
         logger=LoggerManager().system_logger
     )
+    # Validated configs kept across restarts, disabled unless enabled
+    _snapshot_cache: Optional[_ConfigSnapshotCache] = None
 
     # -------------------------------------------------------------------------
     #   Public method
@@ -58,11 +61,62 @@ class _ConfigBuilderFactory:
             raise ...
 
         # Create builder after validation
-        config_data = self._get_config(path, format)
-        validated_config = self._validate_data(builder_type, config_data)
+        validated_config = self.load_config(builder_type, path, format)
         builder_reg = self._builder_registry[builder_type]["builder_class"]
         return builder_reg(validated_config)
 
+    def load_config(
+        self,
+        builder_type: str,
+        path: Path,
+        format: Optional[Literal["json", "yaml", "env"]] = None,
+    ) -> Any:
+        """Load and validate a builder type's config, without a builder.
+
+        With snapshots enabled, a pydantic config whose file and model are
+        unchanged since it was validated is loaded from its snapshot.
+        """
+
+        snapshots = self._snapshot_cache
+        strategy = self._validation_registry[builder_type]["strategy"]
+        if snapshots is None or strategy != "pydantic":
+            return self._validate_data(builder_type, self._get_config(path, format))
+
+        # Validated before the read, so a missing file raises `FileNotFoundError`
+        # or `PathNotFoundError` from `core.exceptions`
+        path = PathUtils.validate_path(path, file_creation=False)
+
+        # Hashed for the snapshot, and parsed on a miss, from a single read
+        key = (builder_type, str(path), format)
+        source = path.read_bytes()
+        config_class = self._builder_registry[builder_type]["config_class"]
+        config = snapshots.get(key, source, config_class)
+        if config is None:
+            loaded = self._cfg_type_detector.load(path, format, source=source)
+            config = self._validate_data(builder_type, loaded.data)
+            snapshots.put(key, source, config)
+        return config
+
+    @classmethod
+    def enable_snapshots(
+        cls,
+        path: Optional[Path | str] = DEFAULT_SNAPSHOT_PATH,
+    ) -> Optional[_ConfigSnapshotCache]:
+        """Load validated configs from a snapshot file, or disable if None.
+
+        Args:
+            path (Path | str): The snapshot file, created if missing
+
+        Returns:
+            The snapshot cache, None if disabled.
+        """
+
+        # Snapshots added so far are kept
+        if cls._snapshot_cache:
+            cls._snapshot_cache.flush()
+        cls._snapshot_cache = _ConfigSnapshotCache(path) if path else None
+        return cls._snapshot_cache
+
     @classmethod
     def get_builders(cls) -> List[str]:
         """Get the list of available builder types."""
@@ -127,17 +181,8 @@ class _ConfigBuilderFactory:
     ) -> ConfigValues:
         """Load config data from file with format-specific typing."""
 
-        config_type = format or self._cfg_type_detector.detect(path)
-        match config_type:
-            case "json":
-                return IOUtils.load_json(path)
-            case "yaml":
-                return IOUtils.load_yaml(path)
-            case "env":
-                return IOUtils.load_env(path)
-            case _:
-                # TODO:
-                raise ...
+        # Parsed once per file version, by the same read that detects it
+        return self._cfg_type_detector.load(path, format).data
 
     def _validate_data(
         self,
@@ -162,10 +207,11 @@ class _ConfigBuilderFactory:
             if schema is None:
                 # TODO:
                 raise ...
-            jsonschema.validate(config_data, schema)
-            return config_data
+            SchemaUtils.validate(config_data, schema)
+            # Loaded data is cached, so never hand out the shared copy
+            return copy.deepcopy(config_data)
         elif strategy is None:
-            return config_data
+            return copy.deepcopy(config_data)
         else:
             # TODO:
             raise ...
@@ -0,0 +1,273 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from ....config.paths import get_relative
+from ....core.protocols.infrastructure.logger import ServiceLoggerProtocol
+from ....shared.utils.str_formatter import blue, red, underline
+from ..adapters.file_watcher import create_file_watcher
+from ..protocol.file_watcher import FileWatcherProtocol
+from .base_builder import BaseConfigBuilder
+from .cache import loaded_config_cache
+
+# Seconds to wait for the rest of a save's events, e.g. write then rename
+SETTLE_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """A watched config file's new, validated config."""
+
+    builder_type: str
+    path: Path
+    builder: BaseConfigBuilder[BaseModel]
+    config: BaseModel
+
+
+ConfigSubscriber = Callable[[ConfigChange], Any]
+
+
+class _Subscription(NamedTuple):
+    callback: ConfigSubscriber
+    builder_type: Optional[str]
+    loop: Optional[asyncio.AbstractEventLoop]
+
+
+class _ConfigReloader:
+    """Reloads the configs of watched files when they change.
+
+    A daemon thread waits on the files, so reading and validating a changed
+    file never blocks the event loop. A valid config is swapped in as its
+    builders' base config, then handed to the subscribers; an invalid one
+    is logged and the previous config is kept.
+
+    Subscribers are called on the reload thread, unless subscribed with a
+    loop, then on the loop's thread.
+    """
+
+    def __init__(
+        self,
+        load_config: Callable[[str, Path], BaseModel],
+        *,
+        logger: ServiceLoggerProtocol,
+    ):
+        """
+        Args:
+            load_config (Callable): Loads and validates a builder type's
+                config from a file, e.g. `_ConfigBuilderFactory.load_config`
+            logger (ServiceLoggerProtocol): Logs reloads and their failures
+        """
+
+        self.load_config = load_config
+        self.logger = logger
+
+        # Resolved path -> (builder type, builder) watching it
+        self._watched: Dict[Path, List[Tuple[str, BaseConfigBuilder[BaseModel]]]] = {}
+        self._subscriptions: List[_Subscription] = []
+        self._lock = Lock()
+
+        self._watcher: Optional[FileWatcherProtocol] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.poll_interval: float = 1.0
+
+    # -------------------------------------------------------------------------
+    #   Public properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # -------------------------------------------------------------------------
+    #   Registration methods
+    # -------------------------------------------------------------------------
+
+    def watch(
+        self,
+        builder_type: str,
+        path: Path | str,
+        builder: BaseConfigBuilder[BaseModel],
+    ):
+        """Reload `builder`'s base config when the file changes."""
+
+        path = Path(path).resolve()
+        with self._lock:
+            self._watched.setdefault(path, []).append((builder_type, builder))
+
+    def subscribe(
+        self,
+        callback: ConfigSubscriber,
+        *,
+        builder_type: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Callable[[], None]:
+        """Call `callback` with every reloaded config.
+
+        Args:
+            callback (ConfigSubscriber): Called with the `ConfigChange`
+            builder_type (str): Only changes of this builder type, any if None
+            loop (asyncio.AbstractEventLoop): Call it on this loop's thread
+
+        Returns:
+            A function that unsubscribes the callback.
+        """
+
+        subscription = _Subscription(callback, builder_type, loop)
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    # -------------------------------------------------------------------------
+    #   Lifecycle methods
+    # -------------------------------------------------------------------------
+
+    def start(self, poll_interval: float = 1.0, use_inotify: bool = True):
+        """Start watching in a daemon thread, if not already.
+
+        Args:
+            poll_interval (float): Seconds between checks of the stop flag,
+                and between stats when inotify is unavailable
+            use_inotify (bool): Use inotify where available
+        """
+
+        with self._lock:
+            if self.running:
+                return
+            self.poll_interval = poll_interval
+            self._stop.clear()
+            self._watcher = create_file_watcher(use_inotify)
+            self._thread = threading.Thread(
+                target=self._watch_forever,
+                name="config-reloader",
+                daemon=True,
+            )
+            self._thread.start()
+
+        self.logger.debug(
+            lambda: f"Config reloader started "
+            f"with {blue(f'{type(self._watcher).__name__}')}"
+        )
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop watching, waiting at most `timeout` for the thread."""
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+
+        self._stop.set()
+        thread.join(self.poll_interval * 2 if timeout is None else timeout)
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+
+    # -------------------------------------------------------------------------
+    #   Reload methods
+    # -------------------------------------------------------------------------
+
+    def reload(self, path: Path | str) -> List[ConfigChange]:
+        """Reload the file's builders now, and notify the subscribers.
+
+        Returns:
+            A change per builder whose config changed.
+        """
+
+        path = Path(path).resolve()
+        with self._lock:
+            watchers = list(self._watched.get(path, ()))
+        if not watchers:
+            return []
+
+        # Written within the same mtime tick and at the same size would
+        # still hit the cache
+        loaded_config_cache.invalidate(path)
+
+        changes: List[ConfigChange] = []
+        for builder_type, builder in watchers:
+            try:
+                config = self.load_config(builder_type, path)
+            except Exception as err:
+                self.logger.warning(
+                    f"Failed to reload {underline(f'{get_relative(path)}')} "
+                    f"as {blue(f'{builder_type}')}, keeping the previous config "
+                    f"{red(f'{err}')}"
+                )
+                continue
+
+            if builder.replace_base(config):
+                changes.append(ConfigChange(builder_type, path, builder, config))
+
+        for change in changes:
+            self.logger.info(
+                f"Reloaded {blue(f'{change.builder_type}')} config "
+                f"from {underline(f'{get_relative(path)}')}"
+            )
+            self._notify(change)
+        return changes
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _watch_forever(self):
+        watcher = self._watcher
+        if watcher is None:
+            return
+
+        while not self._stop.is_set():
+            with self._lock:
+                paths: Set[Path] = set(self._watched)
+            try:
+                changed = watcher.wait(paths, self.poll_interval)
+                if changed:
+                    self._stop.wait(SETTLE_SECONDS)
+                    changed |= watcher.wait(paths, 0)
+            except Exception as err:
+                self.logger.error(f"Config watcher failed {red(f'{err}')}")
+                self._stop.wait(self.poll_interval)
+                continue
+
+            for path in changed:
+                self.reload(path)
+
+    def _notify(self, change: ConfigChange):
+        with self._lock:
+            subscriptions = [
+                subscription
+                for subscription in self._subscriptions
+                if subscription.builder_type in (None, change.builder_type)
+            ]
+
+        for subscription in subscriptions:
+            if subscription.loop is not None:
+                subscription.loop.call_soon_threadsafe(
+                    self._call, subscription.callback, change
+                )
+            else:
+                self._call(subscription.callback, change)
+
+    def _call(self, callback: ConfigSubscriber, change: ConfigChange):
+        """Call a subscriber, a failing one never stops the others."""
+
+        try:
+            callback(change)
+        except Exception as err:
+            self.logger.error(
+                f"Config subscriber {underline(f'{callback!r}')} failed "
+                f"{red(f'{err}')}",
+                exc_info=err,
+            )
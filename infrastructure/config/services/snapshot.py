@@ -0,0 +1,217 @@
+import atexit
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    get_args,
+)
+
+import pydantic
+from pydantic import BaseModel
+
+from ....config import PROJECT_ROOT
+
+# -----------------------------------------------------------------------------
+#   File format
+# -----------------------------------------------------------------------------
+
+# Magic, then a pickled `Dict[_Key, _Snapshot]`; a new magic discards every
+# snapshot written by an older layout
+SNAPSHOT_MAGIC = b"SENACFG\x01"
+
+DEFAULT_SNAPSHOT_PATH = Path(f"{PROJECT_ROOT}/data/config_snapshot.bin")
+
+# (builder type, resolved source path, format)
+_Key = Tuple[str, str, Optional[str]]
+
+
+class _Snapshot(NamedTuple):
+    source_digest: str
+    schema_fingerprint: str
+    config: BaseModel
+
+
+# -----------------------------------------------------------------------------
+#   Fingerprints
+# -----------------------------------------------------------------------------
+
+_fingerprints: Dict[Type[BaseModel], str] = {}
+
+
+def source_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def schema_fingerprint(config_class: Type[BaseModel]) -> str:
+    """Version of a config model's schema, computed once per process.
+
+    Hashes the pydantic version and the source of every module defining
+    the model, its bases and its sub-models, so any change to fields,
+    defaults or validators invalidates the snapshots of the model.
+    """
+
+    fingerprint = _fingerprints.get(config_class)
+    if fingerprint is None:
+        digest = hashlib.blake2b(pydantic.VERSION.encode(), digest_size=16)
+        for file in sorted(_model_files(config_class, set())):
+            with open(file, "rb") as source:
+                digest.update(source.read())
+        fingerprint = _fingerprints[config_class] = digest.hexdigest()
+    return fingerprint
+
+
+def _model_files(model: Type[BaseModel], seen: Set[Type[BaseModel]]) -> Set[str]:
+    files: Set[str] = set()
+    for cls in model.__mro__:
+        if (
+            not isinstance(cls, type)
+            or not issubclass(cls, BaseModel)
+            or cls in seen
+            or cls.__module__.startswith("pydantic")
+        ):
+            continue
+        seen.add(cls)
+
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if module_file:
+            files.add(module_file)
+        for field in cls.model_fields.values():
+            for sub_model in _annotation_models(field.annotation):
+                files |= _model_files(sub_model, seen)
+    return files
+
+
+def _annotation_models(annotation: Any) -> Iterator[Type[BaseModel]]:
+    """Models in an annotation, including nested ones like `Dict[str, List[M]]`."""
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _annotation_models(arg)
+
+
+# -----------------------------------------------------------------------------
+#   Cache
+# -----------------------------------------------------------------------------
+
+
+class _ConfigSnapshotCache:
+    """Binary cache of validated configs, to skip loading them on startup.
+
+    A snapshot is used while its source file's content hash and its model's
+    schema fingerprint both match, so its config needs no type detection,
+    parsing or validation. Every snapshot is kept in one file, read once;
+    added snapshots are written together (atomically) by `flush`, at the
+    latest on exit.
+
+    Note:
+        Snapshots are pickled; only point this at a file this process (or
+        a trusted one) wrote.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_SNAPSHOT_PATH):
+        self.path = Path(path)
+        self._snapshots: Optional[Dict[_Key, _Snapshot]] = None
+        self._dirty = False
+        self._lock = Lock()
+        atexit.register(self.flush)
+
+    # -------------------------------------------------------------------------
+    #   Public methods
+    # -------------------------------------------------------------------------
+
+    def get(
+        self,
+        key: _Key,
+        source: bytes,
+        config_class: Type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """Get the snapshot of an unchanged source and schema, if any.
+
+        Args:
+            key (_Key): Builder type, resolved source path and format
+            source (bytes): The source file's current content
+            config_class (Type[BaseModel]): Model the config is validated by
+        """
+
+        snapshot = self._load().get(key)
+        if snapshot is None:
+            return None
+        if snapshot.source_digest != source_digest(source):
+            return None
+        if snapshot.schema_fingerprint != schema_fingerprint(config_class):
+            return None
+        return snapshot.config
+
+    def put(self, key: _Key, source: bytes, config: BaseModel):
+        """Store a validated config, written by the next `flush`."""
+
+        snapshot = _Snapshot(
+            source_digest(source), schema_fingerprint(type(config)), config
+        )
+        with self._lock:
+            snapshots = dict(self._load())
+            snapshots[key] = snapshot
+            self._snapshots = snapshots
+            self._dirty = True
+
+    def flush(self):
+        """Write the snapshot file, if a snapshot was added since."""
+
+        with self._lock:
+            if not self._dirty or self._snapshots is None:
+                return
+            self._write(self._snapshots)
+            self._dirty = False
+
+    def clear(self):
+        """Drop every snapshot, and delete the snapshot file."""
+
+        with self._lock:
+            self._snapshots = {}
+            self._dirty = False
+            self.path.unlink(missing_ok=True)
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> Dict[_Key, _Snapshot]:
+        snapshots = self._snapshots
+        if snapshots is None:
+            snapshots = self._snapshots = self._read()
+        return snapshots
+
+    def _read(self) -> Dict[_Key, _Snapshot]:
+        try:
+            with open(self.path, "rb") as file:
+                if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    return {}
+                snapshots = pickle.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            # Corrupt, or a model it refers to no longer exists; rebuilt
+            # from the sources as they are loaded
+            return {}
+        return snapshots if isinstance(snapshots, dict) else {}
+
+    def _write(self, snapshots: Dict[_Key, _Snapshot]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            pickle.dump(snapshots, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # Readers see the previous or the new file, never a partial one
+        os.replace(temp_path, self.path)
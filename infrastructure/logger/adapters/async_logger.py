@@ -0,0 +1,45 @@
+import asyncio
+from typing import Optional
+
+from .default_logger import _ServiceLogger
+
+
+class _AsyncServiceLogger(_ServiceLogger):
+    """Service logger for asyncio code.
+
+    Records are stamped with the `LogContext` bound to the emitting task and
+    handed to a lock-free queue; a listener thread does the formatting and
+    I/O. A log call never waits on a handler lock, so thousands of
+    concurrent tasks don't stall the event loop or each other.
+
+    Closing can be awaited with `aclose`, which drains the queue off the
+    event loop.
+
+    Note:
+        Created by the factory when `async.native` is set, which provides
+        the non-blocking queue handler and the context filter.
+    """
+
+    # -------------------------------------------------------------------------
+    #   Close method
+    # -------------------------------------------------------------------------
+
+    async def aclose(self, timeout: Optional[float] = None):
+        """Close the logger without blocking the event loop.
+
+        Args:
+            timeout (float): Max seconds to wait for queued records to be
+                written. Defaults to the configured timeout
+        """
+
+        await asyncio.to_thread(self.close, timeout)
+
+    # -------------------------------------------------------------------------
+    #   Entry an asynchronous runtime context
+    # -------------------------------------------------------------------------
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -1,25 +1,52 @@
 import logging
+import sys
+import time
 from collections.abc import Callable
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 from ....core.exceptions.error_codes import ErrorCode
 from ....core.protocols.infrastructure.logger import ServiceLoggerProtocol
+from ....shared.logger.aliases import LogMessage
+from ....shared.logger.lazy_message import LazyMessage
 from ....shared.logger.log_levels import LogLevel
+from ....shared.metrics import LOG_EMIT_SECONDS, LOG_RECORDS
 from ...exceptions import MissingValueError
+from ..filters import BaseLogFilter, Filter
+from ..handlers import BoundedQueueListener, RingBufferHandler
+
+# Above every level, used once the logger is closed
+_DISABLED = logging.CRITICAL + 1
 
 
 class _ServiceLogger:
-    """Logger instance for a specific service."""
+    """Logger instance for a specific service.
+
+    The lowest level of its handlers is cached, so a call below it returns
+    before building the record, walking frames, or formatting the message.
+    Messages can be lazy: a callable, or %-style `args`, is only resolved
+    when the record is formatted, after the filters let it through.
+
+    An optional ring buffer keeps recent records in memory, including ones
+    below the console and file levels, to be dumped on a crash. Its level is
+    checked on its own, records only it wants skip the other handlers.
+
+    Every call at or above the level is counted in `LOG_RECORDS`, and the
+    time it takes to reach the handlers (or queue) in `LOG_EMIT_SECONDS`.
+    """
 
     def __init__(
         self,
         name: str,
         console_handler: Optional[logging.Handler] = None,
         file_handler: Optional[logging.Handler] = None,
+        queue_handler: Optional[logging.Handler] = None,
+        listener: Optional[BoundedQueueListener] = None,
+        ring_handler: Optional[RingBufferHandler] = None,
+        filters: Optional[List[Filter]] = None,
         on_close_callback: Optional[Callable] = None,
     ):
 
-        if (not console_handler) and (not file_handler):
+        if (not console_handler) and (not file_handler) and (not queue_handler):
             raise MissingValueError(
                 message="The logger does not have file and/or console handler",
                 err_code=ErrorCode.INF_CFGB_LOOK_524,
@@ -27,18 +54,38 @@ class _ServiceLogger:
 
         self.name = name
         self.logger = logging.getLogger(f"sena.{name}")
-        self.logger.setLevel(logging.DEBUG)
-        self.handlers: List[Any] = [console_handler, file_handler]
+        self.console_handler = console_handler
+        self.file_handler = file_handler
+        self.handlers: List[Any] = [
+            handler for handler in (console_handler, file_handler) if handler
+        ]
+        self.queue_handler = queue_handler
+        self.listener = listener
+        self.ring_handler = ring_handler
+        self.filters: List[Filter] = filters or []
         self._closed: bool = False
         self.on_close_callback = on_close_callback
 
-        if console_handler:
-            self.logger.addHandler(console_handler)
-        if file_handler:
-            self.logger.addHandler(file_handler)
+        # Async mode: only the queue handler is attached, the listener
+        # thread owns the console and file handlers
+        if queue_handler and listener:
+            self.logger.addHandler(queue_handler)
+            listener.start()
+        elif queue_handler:
+            # Worker process: the aggregator process owns the handlers
+            self.logger.addHandler(queue_handler)
+        else:
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+        if ring_handler:
+            self.logger.addHandler(ring_handler)
+
+        for _filter in self.filters:
+            self.logger.addFilter(_filter)
 
-        # Test
-        # print(self.logger.getEffectiveLevel())
+        self._min_level: int = logging.DEBUG
+        self._ring_level: int = _DISABLED
+        self.refresh_level()
 
     # -------------------------------------------------------------------------
     #   Public properties
@@ -53,79 +100,247 @@ class _ServiceLogger:
     #   Use this for emitting logs
     # -------------------------------------------------------------------------
 
-    def debug(self, message: str, **context):
-        self._log_with_context(
-            level=LogLevel.DEBUG,
-            message=message,
-            **context,
-        )
+    def debug(self, message: LogMessage, *args, **context):
+        if self._min_level > logging.DEBUG:
+            if self._ring_level <= logging.DEBUG:
+                self._keep_recent(logging.DEBUG, message, args, context)
+            return
+        self._log_with_context(LogLevel.DEBUG, message, *args, **context)
 
-    def info(self, message: str, **context):
-        self._log_with_context(
-            level=LogLevel.INFO,
-            message=message,
-            **context,
-        )
+    def info(self, message: LogMessage, *args, **context):
+        if self._min_level > logging.INFO:
+            if self._ring_level <= logging.INFO:
+                self._keep_recent(logging.INFO, message, args, context)
+            return
+        self._log_with_context(LogLevel.INFO, message, *args, **context)
 
-    def warning(self, message: str, **context):
-        self._log_with_context(
-            level=LogLevel.WARNING,
-            message=message,
-            **context,
-        )
+    def warning(self, message: LogMessage, *args, **context):
+        if self._min_level > logging.WARNING:
+            if self._ring_level <= logging.WARNING:
+                self._keep_recent(logging.WARNING, message, args, context)
+            return
+        self._log_with_context(LogLevel.WARNING, message, *args, **context)
 
-    def error(self, message: str, **context):
-        self._log_with_context(
-            level=LogLevel.ERROR,
-            message=message,
-            **context,
-        )
+    def error(self, message: LogMessage, *args, **context):
+        if self._min_level > logging.ERROR:
+            if self._ring_level <= logging.ERROR:
+                self._keep_recent(logging.ERROR, message, args, context)
+            return
+        self._log_with_context(LogLevel.ERROR, message, *args, **context)
 
-    def critical(self, message: str, **context):
-        self._log_with_context(
-            level=LogLevel.CRITICAL,
-            message=message,
-            **context,
-        )
+    def critical(self, message: LogMessage, *args, **context):
+        if self._min_level > logging.CRITICAL:
+            if self._ring_level <= logging.CRITICAL:
+                self._keep_recent(logging.CRITICAL, message, args, context)
+            return
+        self._log_with_context(LogLevel.CRITICAL, message, *args, **context)
 
     def _log_with_context(
         self,
         level: LogLevel,
-        message: str,
+        message: LogMessage,
+        *args,
         **context,
     ):
         if self._closed:
             return
 
-        extra = context if context else {}
+        # Reserved by `Logger.makeRecord`, not context
+        exc_info = context.pop("exc_info", None)
+        stack_info = context.pop("stack_info", False)
+
+        LOG_RECORDS.inc(self.name, level.value)
+        start = time.perf_counter()
         self.logger.log(
-            level=level.to_value(),
-            msg=message,
-            extra=extra,
+            level.to_value(),
+            LazyMessage(message) if callable(message) else message,
+            *args,
+            exc_info=exc_info,
+            stack_info=stack_info,
+            extra=context,
             # Refer to the calling functions
             # 1 is default (itself), incrementing 1 refers to a level above
             stacklevel=3,
         )
+        LOG_EMIT_SECONDS.observe(time.perf_counter() - start, self.name)
+
+    def _keep_recent(
+        self,
+        level: int,
+        message: LogMessage,
+        args: Tuple[Any, ...],
+        context: Dict[str, Any],
+    ):
+        """Hand a record below every handler's level to the ring buffer only.
+
+        The record still goes through the logger's filters, but skips the
+        handlers, the queue and the metrics.
+        """
+
+        exc_info = context.pop("exc_info", None)
+        stack_info = context.pop("stack_info", False)
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif exc_info and not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info()
+
+        # Refer to the calling function, as in `_log_with_context`
+        pathname, lineno, func, sinfo = self.logger.findCaller(stack_info, stacklevel=3)
+        record = self.logger.makeRecord(
+            self.logger.name,
+            level,
+            pathname,
+            lineno,
+            LazyMessage(message) if callable(message) else message,
+            args,
+            exc_info,
+            func,
+            context,
+            sinfo,
+        )
+        if self.logger.filter(record):
+            self.ring_handler.handle(record)  # type: ignore[union-attr]
+
+    # -------------------------------------------------------------------------
+    #   Level methods
+    # -------------------------------------------------------------------------
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if any handler would emit a record of this level."""
+
+        return level.to_value() >= self._min_level
+
+    def set_levels(
+        self,
+        *,
+        console_level: Optional[LogLevel] = None,
+        file_level: Optional[LogLevel] = None,
+    ):
+        """Re-level the handlers in place.
+
+        Args:
+            console_level (LogLevel): New level of the console handler
+            file_level (LogLevel): New level of the file handler
+        """
+
+        if console_level and self.console_handler:
+            self.console_handler.setLevel(console_level.to_value())
+        if file_level and self.file_handler:
+            self.file_handler.setLevel(file_level.to_value())
+        self.refresh_level()
+
+    def refresh_level(self):
+        """Recompute the lowest level emitted by any handler.
+
+        Call after changing a handler's level directly.
+        """
+
+        if self._closed or not (self.handlers or self.queue_handler):
+            self._min_level = _DISABLED
+            self._ring_level = _DISABLED
+            return
+
+        self._min_level = (
+            min(handler.level for handler in self.handlers)
+            if self.handlers
+            else self.queue_handler.level  # type: ignore[union-attr]
+        )
+        # Checked separately, so a DEBUG ring buffer doesn't send DEBUG
+        # records through the handlers
+        self._ring_level = self.ring_handler.level if self.ring_handler else _DISABLED
+        self.logger.setLevel(self._min_level)
+
+    # -------------------------------------------------------------------------
+    #   Ring buffer methods
+    # -------------------------------------------------------------------------
+
+    def dump_recent(self, stream: TextIO) -> int:
+        """Write the records kept by the ring buffer, oldest first.
+
+        Returns:
+            The amount of records written, 0 without a ring buffer.
+        """
+
+        if not self.ring_handler:
+            return 0
+        return self.ring_handler.dump(stream)
+
+    # -------------------------------------------------------------------------
+    #   Redirect method
+    # -------------------------------------------------------------------------
+
+    def redirect(self, handler: logging.Handler):
+        """Hand records to `handler` instead of the logger's own handlers.
+
+        Used in worker processes, whose output is written by another
+        process. The handler takes the lowest level of the replaced ones.
+        """
+
+        if self._closed:
+            return
+
+        if self.handlers:
+            handler.setLevel(min(_handler.level for _handler in self.handlers))
+        self._close_handlers()
+        self.queue_handler = handler
+        self.logger.addHandler(handler)
+        self.refresh_level()
 
     # -------------------------------------------------------------------------
     #   Close method
     # -------------------------------------------------------------------------
 
-    def close(self):
+    def close(self, timeout: Optional[float] = None):
+        """Close the logger and its handlers.
+
+        Args:
+            timeout (float): Async mode only; max seconds to wait for queued
+                records to be written. Defaults to the configured timeout
+        """
+
         if self._closed:
             return
 
-        for handler in self.handlers:
-            self.logger.removeHandler(handler)
-            handler.close()
+        for _filter in self.filters:
+            self.logger.removeFilter(_filter)
+            # Held back records (e.g. dedup summaries) go out while the
+            # handlers are still open
+            if isinstance(_filter, BaseLogFilter):
+                _filter.close()
+
+        self._close_handlers(timeout)
+        if self.ring_handler:
+            self.logger.removeHandler(self.ring_handler)
+            self.ring_handler.close()
 
-        self.handlers.clear()
         self._closed = True
+        self._min_level = _DISABLED
+        self._ring_level = _DISABLED
 
         # Notify factory that this service logger is closing
         if self.on_close_callback:
             self.on_close_callback(self.name)
 
+    def _close_handlers(self, timeout: Optional[float] = None):
+        """Close the queue, console and file handlers."""
+
+        if self.queue_handler:
+            self.logger.removeHandler(self.queue_handler)
+            self.queue_handler.close()
+        if self.listener:
+            self.listener.stop(timeout)
+
+        # Pooled file handlers release their shared handler on close
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        self.handlers.clear()
+        self.console_handler = None
+        self.file_handler = None
+        self.queue_handler = None
+        self.listener = None
+
     # -------------------------------------------------------------------------
     #   Entry a runtime context
     # -------------------------------------------------------------------------
@@ -1,8 +1,9 @@
-from .filters import Filter, _Filter
+from .filters import BaseLogFilter, Filter, _Filter
 from .registry import FilterRegistry
 
 __all__ = [
     # .filters
+    "BaseLogFilter",
     "Filter",
     "_Filter",
     # .registry
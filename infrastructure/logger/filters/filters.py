@@ -1,8 +1,21 @@
+import heapq
+import itertools
+import logging
+import random
 import re
+import sys
+import threading
+import time
+import traceback
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import partial
 from logging import LogRecord
-from typing import TypeAlias
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeAlias
+
+from ....shared.logger.context import get_log_context
+from ....shared.logger.lazy_message import LazyMessage
 
 
 class BaseLogFilter(ABC):
@@ -12,11 +25,83 @@ class BaseLogFilter(ABC):
     def __call__(self, record: LogRecord) -> bool:
         pass
 
+    def close(self) -> None:
+        """Send anything held back, before the logger's handlers close."""
+
 
 Filter: TypeAlias = Callable[[LogRecord], bool]
 """A filter ready to be added."""
 _Filter: TypeAlias = Callable[..., BaseLogFilter]
 """A callable filter constructor."""
+_CallSite: TypeAlias = Tuple[int, str, int]
+"""A record's level, path and line number."""
+
+
+# -----------------------------------------------------------------------------
+#   Deadlines
+#   One thread runs every filter's deferred summaries
+# -----------------------------------------------------------------------------
+
+
+class _DeadlineScheduler:
+    """Calls callbacks at monotonic deadlines, from one shared thread.
+
+    Scheduling pushes to a heap, so a filter deferring work costs no thread
+    creation. Callbacks can't be cancelled; they check themselves whether
+    they are still due.
+    """
+
+    def __init__(self):
+        # (deadline, sequence, callback), the sequence breaks ties
+        self._deadlines: List[Tuple[float, int, Callable[[], Any]]] = []
+        self._sequence = itertools.count()
+        self._lock = Lock()
+        self._wake_up = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, deadline: float, callback: Callable[[], Any]) -> None:
+        """Call `callback` at `deadline` (`time.monotonic`), or soon after."""
+
+        with self._lock:
+            heapq.heappush(self._deadlines, (deadline, next(self._sequence), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="log-filter-deadlines",
+                    daemon=True,
+                )
+                self._thread.start()
+            elif self._deadlines[0][2] is callback:
+                # Earlier than the deadline the thread waits for
+                self._wake_up.set()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._wake_up.clear()
+                now = time.monotonic()
+                if not self._deadlines:
+                    delay: Optional[float] = None
+                elif self._deadlines[0][0] <= now:
+                    _, _, callback = heapq.heappop(self._deadlines)
+                    delay = 0.0
+                else:
+                    delay = self._deadlines[0][0] - now
+
+            if delay is None or delay > 0.0:
+                self._wake_up.wait(delay)
+                continue
+            try:
+                callback()
+            except Exception:
+                # A failing summary must not stop the others; reported as
+                # `logging.Handler.handleError` does
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write("--- Log filter deadline failed ---\n")
+                    traceback.print_exc(file=sys.stderr)
+
+
+_deadlines = _DeadlineScheduler()
 
 
 # -----------------------------------------------------------------------------
@@ -35,6 +120,26 @@ class ServiceFilter(BaseLogFilter):
         return True
 
 
+class ContextFilter(BaseLogFilter):
+    """Stamps records with the bound `LogContext`, if any.
+
+    Must run on the logging thread (or task), where the context is bound.
+    """
+
+    def __call__(self, record: LogRecord) -> bool:
+        context = get_log_context()
+        if context is None:
+            return True
+
+        if context.correlation_id is not None:
+            record.correlation_id = context.correlation_id
+        if context.guild_id is not None:
+            record.guild_id = context.guild_id
+        if context.user_id is not None:
+            record.user_id = context.user_id
+        return True
+
+
 class StripMarkupFilter(BaseLogFilter):
     """Strips markup (like '[bold], [/bold]') from log messages."""
 
@@ -47,6 +152,364 @@ class StripMarkupFilter(BaseLogFilter):
         self.pattern = re.compile(pattern)
 
     def __call__(self, record: LogRecord) -> bool:
-        if hasattr(record, "msg") and isinstance(record.msg, str):
-            record.msg = self.pattern.sub("", record.msg)
+        if isinstance(getattr(record, "msg", None), (str, LazyMessage)):
+            record.msg = self.pattern.sub("", str(record.msg))
+        return True
+
+
+# Inline flags at the start of a pattern, only valid at the start of a regex
+_LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+def _scope_flags(pattern: str) -> str:
+    """Turn leading global flags into a group, e.g. '(?i)a' to '(?i:a)'."""
+
+    flags = _LEADING_FLAGS.match(pattern)
+    if flags is None:
+        return pattern
+    return f"(?{flags.group(1)}:{pattern[flags.end():]})"
+
+
+class _PatternSet:
+    """Include/exclude patterns matched one by one, like the combined regex.
+
+    Used when the patterns can't be combined into one regex.
+    """
+
+    def __init__(self, include_patterns: List[str], exclude_patterns: List[str]):
+        self.include = [re.compile(pattern, re.S) for pattern in include_patterns]
+        self.exclude = [re.compile(pattern, re.S) for pattern in exclude_patterns]
+
+    def match(self, message: str) -> Optional[bool]:
+        """True if the message passes, None otherwise."""
+
+        if any(pattern.search(message) for pattern in self.exclude):
+            return None
+        if self.include and not any(
+            pattern.search(message) for pattern in self.include
+        ):
+            return None
+        return True
+
+
+class ThrottleFilter(BaseLogFilter):
+    """Drops records by message pattern and rate limits the rest.
+
+    Meant to be attached to a service's `logging.Logger` (not its handlers),
+    so a rejected record never reaches formatting, the async queue, or disk.
+
+    Stages:
+        - Patterns: all include/exclude patterns are compiled into a single
+          anchored regex. A message passes when it matches no exclude pattern
+          and, if any include patterns are given, at least one of them
+        - Rate limit: a token bucket that refills `rate_limit` records per
+          second, with a burst of `rate_limit` records
+        - Summary: once every `summary_interval` seconds, a warning with the
+          number of rate-limited records is sent to the logger's handlers,
+          by the next passing record or once the interval is over; pending
+          counts are sent on `close`
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        *,
+        rate_limit: Optional[int] = None,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        summary_interval: float = 10.0,
+    ):
+        """
+        Args:
+            service_name (str): Service whose records are throttled
+            rate_limit (int): Max records per second, no limit if None
+            include_patterns (List[str]): Regexes a message must match one of
+            exclude_patterns (List[str]): Regexes a message must not match
+            summary_interval (float): Min seconds between suppression summaries
+        """
+        self.service_name = service_name
+        self.pattern = self._compile(include_patterns or [], exclude_patterns or [])
+
+        self.rate_limit = rate_limit
+        self.summary_interval = summary_interval
+        self.suppressed: int = 0
+        # Latest rate-limited record, where a deferred summary points at
+        self._suppressed_record: Optional[LogRecord] = None
+        self._tokens: float = float(rate_limit or 0)
+        self._last_refill = time.monotonic()
+        self._last_summary = self._last_refill
+        self._lock = Lock()
+
+    def __call__(self, record: LogRecord) -> bool:
+        if self.pattern is not None:
+            message = record.getMessage() if record.args else str(record.msg)
+            if self.pattern.match(message) is None:
+                return False
+
+        if self.rate_limit is None:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate_limit),
+                self._tokens + (now - self._last_refill) * self.rate_limit,
+            )
+            self._last_refill = now
+
+            if self._tokens < 1.0:
+                if not self.suppressed:
+                    # Sends the summary if no record passes until then
+                    _deadlines.schedule(
+                        max(now, self._last_summary + self.summary_interval),
+                        self._expire,
+                    )
+                self.suppressed += 1
+                self._suppressed_record = record
+                return False
+            self._tokens -= 1.0
+
+            suppressed = 0
+            if self.suppressed and (now - self._last_summary) >= self.summary_interval:
+                suppressed, self.suppressed = self.suppressed, 0
+                self._last_summary = now
+
+        if suppressed:
+            self._emit_summary(record, suppressed)
+        return True
+
+    def close(self) -> None:
+        self.flush()
+
+    # -------------------------------------------------------------------------
+    #   Public methods
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Send the summary of records suppressed so far, if any."""
+
+        with self._lock:
+            suppressed, self.suppressed = self.suppressed, 0
+            record, self._suppressed_record = self._suppressed_record, None
+            self._last_summary = time.monotonic()
+
+        if suppressed and record is not None:
+            self._emit_summary(record, suppressed)
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _compile(
+        include_patterns: List[str],
+        exclude_patterns: List[str],
+    ) -> Optional[re.Pattern[str] | _PatternSet]:
+        """Compile every pattern into one regex matched at the start.
+
+        Exclusions are a negative lookahead and inclusions a positive one, so
+        a single `match` decides the record regardless of pattern count.
+        A pattern's leading inline flags, e.g. '(?i)', are scoped to it; if
+        the patterns still can't be combined, each is matched on its own.
+        """
+
+        if not (include_patterns or exclude_patterns):
+            return None
+
+        include = [_scope_flags(pattern) for pattern in include_patterns]
+        exclude = [_scope_flags(pattern) for pattern in exclude_patterns]
+        pattern = "(?s)"
+        if exclude:
+            pattern += f"(?!.*?(?:{'|'.join(exclude)}))"
+        if include:
+            pattern += f"(?=.*?(?:{'|'.join(include)}))"
+        try:
+            return re.compile(pattern)
+        except re.error:
+            return _PatternSet(include_patterns, exclude_patterns)
+
+    def _expire(self) -> None:
+        """Send the summary once its interval is over. Runs on a deadline."""
+
+        with self._lock:
+            now = time.monotonic()
+            # Sent by a passing record already, or a later deadline is due
+            elapsed = now - self._last_summary
+            if not self.suppressed or elapsed < self.summary_interval:
+                return
+            suppressed, self.suppressed = self.suppressed, 0
+            record, self._suppressed_record = self._suppressed_record, None
+            self._last_summary = now
+
+        if record is not None:
+            self._emit_summary(record, suppressed)
+
+    def _emit_summary(self, record: LogRecord, suppressed: int) -> None:
+        """Send a summary record straight to the logger's handlers.
+
+        Uses `callHandlers` so the summary bypasses this filter.
+        """
+
+        summary = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": f"{suppressed} records suppressed by rate limit",
+                "pathname": record.pathname,
+                "module": record.module,
+                "funcName": record.funcName,
+                "lineno": record.lineno,
+            }
+        )
+        logging.getLogger(record.name).callHandlers(summary)
+
+
+class SampleFilter(BaseLogFilter):
+    """Samples high-volume levels and collapses repeated messages.
+
+    Meant to be attached to a service's `logging.Logger`, like
+    `ThrottleFilter`, so DEBUG can stay on at a fraction of the I/O.
+
+    Records are keyed by call site, their level, file and line, which costs
+    one tuple hash per record.
+
+    Stages:
+        - Dedup: a record with the same call site, message and args as the
+          previous record, within `dedup_window` seconds of the first of
+          them, is dropped. When the run ends (a different record, the
+          window expiring, or `close`), a summary like "Previous message
+          repeated 532 times" is sent to the handlers
+        - Sampling: records of a level in `sample_rates` pass with that
+          probability, except the first record of each call site
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        *,
+        sample_rates: Optional[Dict[str, float]] = None,
+        dedup_window: float = 0.0,
+    ):
+        """
+        Args:
+            service_name (str): Service whose records are sampled
+            sample_rates (Dict[str, float]): Level name to the fraction of
+                its records kept, levels not given are kept whole
+            dedup_window (float): Max seconds a run of repeats is collapsed
+                into one summary, no dedup if 0
+        """
+        self.service_name = service_name
+        self.sample_rates: Dict[int, float] = {
+            logging.getLevelName(level.upper()): rate
+            for level, rate in (sample_rates or {}).items()
+            if rate < 1.0
+        }
+        self.dedup_window = dedup_window
+
+        # Previous record's (key, first seen, repeats, first record)
+        self._run: Optional[Tuple[Any, float, int, LogRecord]] = None
+        self._seen: Set[_CallSite] = set()
+        self._random = random.random
+        self._lock = Lock()
+
+    def __call__(self, record: LogRecord) -> bool:
+        site = (record.levelno, record.pathname, record.lineno)
+
+        if self.dedup_window and not self._dedup(site, record):
+            return False
+
+        rate = self.sample_rates.get(record.levelno)
+        if rate is None:
+            return True
+        if site not in self._seen:
+            self._seen.add(site)
+            return True
+        return self._random() < rate
+
+    def close(self) -> None:
+        self.flush()
+
+    # -------------------------------------------------------------------------
+    #   Public methods
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """End the current run of repeats, sending its summary if any."""
+
+        with self._lock:
+            run, self._run = self._run, None
+
+        if run is not None and run[2]:
+            self._emit_summary(run[3], run[2])
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _dedup(self, site: _CallSite, record: LogRecord) -> bool:
+        """Whether the record is not a repeat of the previous record."""
+
+        # A lazy message is compared by its text, not by the callable
+        message = record.msg
+        if isinstance(message, LazyMessage):
+            message = str(message)
+        key = (site, message, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable args, e.g. a dict, are never collapsed
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            run = self._run
+            if run is not None:
+                run_key, started, repeats, first = run
+                if run_key == key and (now - started) < self.dedup_window:
+                    self._run = (run_key, started, repeats + 1, first)
+                    if not repeats:
+                        # Ends the run once its window expires, if nothing
+                        # else does
+                        _deadlines.schedule(
+                            started + self.dedup_window,
+                            partial(self._expire, run_key, started),
+                        )
+                    return False
+            self._run = (key, now, 0, record)
+
+        if run is not None and run[2]:
+            self._emit_summary(run[3], run[2])
         return True
+
+    def _expire(self, key: Any, started: float) -> None:
+        """End the run if it is still the current one. Runs on a deadline."""
+
+        with self._lock:
+            current = self._run
+            # Ended (and summarized) already, or a newer run
+            if current is None or current[:2] != (key, started):
+                return
+            self._run = None
+
+        self._emit_summary(current[3], current[2])
+
+    def _emit_summary(self, record: LogRecord, repeats: int) -> None:
+        """Send a summary record straight to the logger's handlers.
+
+        Uses `callHandlers` so the summary bypasses this filter.
+        """
+
+        summary = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": record.levelno,
+                "levelname": record.levelname,
+                "msg": f"Previous message repeated {repeats} times",
+                "pathname": record.pathname,
+                "module": record.module,
+                "funcName": record.funcName,
+                "lineno": record.lineno,
+            }
+        )
+        logging.getLogger(record.name).callHandlers(summary)
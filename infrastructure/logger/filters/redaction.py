@@ -0,0 +1,198 @@
+import logging
+import os
+import re
+from itertools import islice
+from logging import LogRecord
+from typing import Any, Dict, Iterable, List, Optional
+
+from ....infrastructure.config.models.logger_config import SecurityConfig
+from ....shared.logger.lazy_message import LazyMessage
+from .filters import BaseLogFilter
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+REDACTED = "<redacted>"
+
+# Known secret shapes, as (group name, pattern)
+# `url_creds` keeps the scheme and user, only the password is redacted
+TOKEN_PATTERNS = (
+    # Discord bot token: base64 user ID, timestamp, HMAC
+    (
+        "discord_token",
+        r"\b[A-Za-z\d_-]{23,28}\.[A-Za-z\d_-]{6,7}\.[A-Za-z\d_-]{27,38}\b",
+    ),
+    # OpenAI API key, including project keys
+    ("openai_key", r"\bsk-(?:proj-)?[A-Za-z\d_-]{20,}"),
+    # Password in a DSN or URL, e.g. 'postgresql://user:pass@', 'redis://:pass@'
+    ("url_creds", r"(?P<url_user>\b[a-z][a-z\d+.-]*://[^:/@\s]*):[^@\s]+@"),
+    # HTTP bearer token
+    ("bearer", r"(?i:\bbearer\s+)[A-Za-z\d._~+/-]+=*"),
+)
+
+# Substrings that every match of `TOKEN_PATTERNS` contains, except Discord
+# tokens, checked before the regex runs. Bearer tokens are found spelled
+# 'Bearer', 'bearer' or 'BEARER'
+TOKEN_MARKERS = ("sk-", "://", "earer", "EARER")
+
+# A Discord token has no fixed substring, but two dots and this many
+# characters
+DISCORD_TOKEN_MIN_LENGTH = 23 + 1 + 6 + 1 + 27
+
+# Where the secrets from `.env.example` are loaded from, as configured by
+# default in `SecurityConfig`
+DEFAULT_SECRET_ENV_VARS = tuple(SecurityConfig().secret_env_vars)
+
+# Shorter values would redact ordinary words
+MIN_SECRET_LENGTH = 8
+
+# Attributes `LogRecord.__init__` sets, before any context
+_RECORD_INIT_ATTRS = len(logging.makeLogRecord({}).__dict__)
+
+# Record attributes that are never context
+_STANDARD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {
+    "service",
+    "contextStr",
+    "message",
+    "asctime",
+}
+
+
+class RedactFilter(BaseLogFilter):
+    """Redacts secrets from log messages and context values.
+
+    Literal secret values and known token shapes are compiled into a single
+    alternation, so each string is scanned once regardless of how many
+    secrets are known. Literal secrets come first, longest first. Strings
+    containing none of the secrets and none of the tokens' markers (see
+    `TOKEN_MARKERS`) skip the regex, found by substring checks only.
+
+    Results for short strings are cached, as the same constant messages and
+    context values (IDs, names) repeat across records. Strings are
+    immutable, so a cached result never goes stale.
+
+    Note:
+        Exception tracebacks are rendered by the handlers and not redacted.
+    """
+
+    def __init__(
+        self,
+        *,
+        secrets: Optional[Iterable[str]] = None,
+        secret_env_vars: Iterable[str] = DEFAULT_SECRET_ENV_VARS,
+        replacement: str = REDACTED,
+        cache_size: int = 4096,
+        max_cached_length: int = 512,
+    ):
+        """
+        Args:
+            secrets (Iterable[str]): Literal values to redact
+            secret_env_vars (Iterable[str]): Environment variables whose
+                values are redacted
+            replacement (str): What redacted text is replaced with
+            cache_size (int): Max cached strings before the cache is reset
+            max_cached_length (int): Longer strings are not cached
+        """
+        values = set(secrets or [])
+        values.update(
+            os.environ[name] for name in secret_env_vars if os.environ.get(name)
+        )
+        literals = sorted(
+            (value for value in values if len(value) >= MIN_SECRET_LENGTH),
+            key=len,
+            reverse=True,
+        )
+
+        self.replacement = replacement
+        self.pattern = self._compile(literals)
+        self.markers = (*literals, *TOKEN_MARKERS)
+        self.cache_size = cache_size
+        self.max_cached_length = max_cached_length
+        self._cache: Dict[str, str] = {}
+
+    def __call__(self, record: LogRecord) -> bool:
+        if record.args:
+            record.msg = self.redact(record.getMessage())
+            record.args = None
+        elif isinstance(record.msg, (str, LazyMessage)):
+            record.msg = self.redact(str(record.msg))
+
+        attrs = record.__dict__
+        if type(record) is LogRecord:
+            # Context is added after `__init__`'s attributes, in order
+            keys = list(islice(attrs, _RECORD_INIT_ATTRS, None))
+        else:
+            # A custom record factory may set attributes in any order
+            keys = list(attrs)
+        for key in keys:
+            if key in _STANDARD_ATTRS:
+                continue
+            # Most context values are plain strings and numbers
+            value = attrs[key]
+            if isinstance(value, str):
+                attrs[key] = self.redact(value)
+            elif isinstance(value, (dict, list, tuple)):
+                attrs[key] = self._redact_value(value)
+        return True
+
+    # -------------------------------------------------------------------------
+    #   Public methods
+    # -------------------------------------------------------------------------
+
+    def redact(self, text: str) -> str:
+        """Redact every secret in a string."""
+
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+
+        if self._may_contain_secret(text):
+            result = self.pattern.sub(self._replace, text)
+        else:
+            result = text
+        if len(text) <= self.max_cached_length:
+            if len(self._cache) >= self.cache_size:
+                self._cache = {}
+            self._cache[text] = result
+        return result
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _compile(self, literals: List[str]) -> re.Pattern[str]:
+        alternatives = []
+        if literals:
+            escaped = "|".join(re.escape(literal) for literal in literals)
+            alternatives.append(f"(?P<literal>{escaped})")
+        alternatives.extend(
+            f"(?P<{name}>{pattern})" for name, pattern in TOKEN_PATTERNS
+        )
+        return re.compile("|".join(alternatives))
+
+    def _may_contain_secret(self, text: str) -> bool:
+        """Whether the regex could match, by substring checks only."""
+
+        for marker in self.markers:
+            if marker in text:
+                return True
+        return len(text) >= DISCORD_TOKEN_MIN_LENGTH and text.count(".") >= 2
+
+    def _replace(self, match: re.Match[str]) -> str:
+        if match.lastgroup == "url_creds":
+            return f"{match.group('url_user')}:{self.replacement}@"
+        return self.replacement
+
+    def _redact_value(self, value: Any, depth: int = 0) -> Any:
+        """Redact strings, including inside (shallow) containers."""
+
+        if isinstance(value, str):
+            return self.redact(value)
+        if depth >= 2:
+            return value
+        if isinstance(value, dict):
+            return {k: self._redact_value(v, depth + 1) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._redact_value(v, depth + 1) for v in value)
+        return value
@@ -1,7 +1,16 @@
 from enum import StrEnum
 from typing import Dict, List
 
-from .filters import BaseLogFilter, ServiceFilter, StripMarkupFilter, _Filter
+from .filters import (
+    BaseLogFilter,
+    ContextFilter,
+    SampleFilter,
+    ServiceFilter,
+    StripMarkupFilter,
+    ThrottleFilter,
+    _Filter,
+)
+from .redaction import RedactFilter
 
 # -----------------------------------------------------------------------------
 #   Registry
@@ -11,6 +20,10 @@ from .filters import BaseLogFilter, ServiceFilter, StripMarkupFilter, _Filter
 class FilterType(StrEnum):
     SERVICE = "service"
     STRIP_MARKUP = "strip_markup"
+    THROTTLE = "throttle"
+    REDACT = "redact"
+    CONTEXT = "context"
+    SAMPLE = "sample"
 
 
 class FilterRegistry:
@@ -19,6 +32,10 @@ class FilterRegistry:
     _filters: Dict[FilterType, _Filter] = {
         FilterType.SERVICE: ServiceFilter,
         FilterType.STRIP_MARKUP: StripMarkupFilter,
+        FilterType.THROTTLE: ThrottleFilter,
+        FilterType.REDACT: RedactFilter,
+        FilterType.CONTEXT: ContextFilter,
+        FilterType.SAMPLE: SampleFilter,
     }
 
     @classmethod
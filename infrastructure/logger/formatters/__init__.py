@@ -1,6 +1,11 @@
 from .registry import FormatterRegistry
+from .serializers import BaseJSONSerializer, SerializerRegistry, SerializerType
 
 __all__ = [
     # .registry
     "FormatterRegistry",
+    # .serializers
+    "BaseJSONSerializer",
+    "SerializerRegistry",
+    "SerializerType",
 ]
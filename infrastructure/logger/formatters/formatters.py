@@ -1,6 +1,21 @@
-import json
-from datetime import datetime
 from logging import Formatter, LogRecord, makeLogRecord
+from typing import Optional
+
+from .serializers import BaseJSONSerializer, SerializerRegistry
+from .timestamps import CachedTimestamp
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+# Standard fields every `LogRecord` has
+_STANDARD_ATTRS = frozenset(makeLogRecord({}).__dict__.keys())
+
+# Redundant keys that already appear on every formatted record
+_REDUNDANT_KEYS = frozenset({"contextStr", "message", "asctime", "service"})
+
+_EXCLUDED_CONTEXT_KEYS = _STANDARD_ATTRS | _REDUNDANT_KEYS
+
 
 # -----------------------------------------------------------------------------
 #   Formatters
@@ -16,6 +31,16 @@ class JSONFormatter(Formatter):
         format: Formats emitted log to a JSON struct
     """
 
+    def __init__(
+        self,
+        *args,
+        serializer: Optional[BaseJSONSerializer] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.serializer = serializer or SerializerRegistry.create_serializer()
+        self.timestamp = CachedTimestamp()
+
     def format(self, record: LogRecord) -> str:
         """Formats recorded recorded log to a JSON struct.
 
@@ -43,7 +68,7 @@ class JSONFormatter(Formatter):
             The formatted record as text.
         """
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self.timestamp.isoformat(record.created),
             "level": record.levelname,
             "logger": record.name,
             "service": getattr(record, "service", "unknown"),
@@ -58,19 +83,46 @@ class JSONFormatter(Formatter):
 
         log_entry.update(getattr(record, "extra_data", {}))
 
-        return json.dumps(log_entry, default=str)
+        return self.serializer.dumps(log_entry)
 
 
 class ContextJSONFormatter(Formatter):
-    """Custom logger formatter that appends structured context as
-       indented JSON.
+    """Custom logger formatter that appends structured context as JSON.
 
-    This formatter constructs only the context into a JSON format.
+    This formatter constructs only the context into a JSON format, either
+    indented over multiple lines or compact on the record's own line.
+
+    Attributes:
+        compact:        Whether the context is dumped as a single line.
+        excluded_keys:  Record attributes that are never part of the
+                        context. Computed once at import.
+        serializer:     JSON backend, the fastest installed one by
+                        default.
 
     Methods:
         format: Formats emitted log context to a JSON struct
     """
 
+    def __init__(
+        self,
+        *args,
+        compact: bool = False,
+        serializer: Optional[BaseJSONSerializer] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.compact = compact
+        self.excluded_keys = _EXCLUDED_CONTEXT_KEYS
+        self.serializer = serializer or SerializerRegistry.create_serializer()
+        self.timestamp = CachedTimestamp(self.datefmt)
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format `asctime`, reusing the formatted second across records."""
+
+        if datefmt is not None and datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        return self.timestamp.format_time(record.created, record.msecs)
+
     def format(self, record: LogRecord) -> str:
         """Override format to add custom formatter algorithm.
 
@@ -78,12 +130,6 @@ class ContextJSONFormatter(Formatter):
             record: A `LogRecord` containing the records of data
                     an emitted log carries
 
-        standard_attrs: A set of standard attributes that should
-                        not be a part of the emitted log.
-        redundant_keys: Skips redundant keys from the log record
-                        that already appear on every
-        excluded_keys:  A union of sets to exclude from the
-                        context.
         context:        A raw dict that contains the key-values
                         to be formatted to a str in JSON struct.
         contextStr:     The formatted JSON context as str.
@@ -92,16 +138,16 @@ class ContextJSONFormatter(Formatter):
             The formatted specified record as text.
         """
 
-        # Extract standard fields to exclude
-        standard_attrs = set(makeLogRecord({}).__dict__.keys())
-
-        # Exclude redundant keys
-        redundant_keys = {"contextStr", "message", "asctime", "service"}
-
-        excluded_keys = standard_attrs | redundant_keys
-
         # Extract custom context from `record.__dict__`
-        context = {k: v for k, v in record.__dict__.items() if k not in excluded_keys}
+        # Set difference is done in C, most records carry no context
+        attrs = record.__dict__
+        if attrs.keys() - self.excluded_keys:
+            context = {k: v for k, v in attrs.items() if k not in self.excluded_keys}
+            if self.compact:
+                record.contextStr = f": {self.serializer.dumps(context)}"
+            else:
+                record.contextStr = f":\n{self.serializer.dumps_indented(context)}"
+        else:
+            record.contextStr = ""
 
-        record.contextStr = f":\n{json.dumps(context, indent=4)}" if context else ""
         return super().format(record)
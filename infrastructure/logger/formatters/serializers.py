@@ -0,0 +1,166 @@
+import json
+from abc import ABC, abstractmethod
+from enum import StrEnum
+from typing import Any, Dict, List, Optional, Type
+
+# Optional fast backends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class SerializerType(StrEnum):
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+    STDLIB = "stdlib"
+
+
+# -----------------------------------------------------------------------------
+#   Serializers
+# -----------------------------------------------------------------------------
+
+
+class BaseJSONSerializer(ABC):
+    """Base class for JSON serializers used by the formatters.
+
+    Values that are not natively serializable are rendered with `str`.
+    """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Serialize to single-line JSON."""
+        pass
+
+    @abstractmethod
+    def dumps_indented(self, obj: Any) -> str:
+        """Serialize to indented, multi-line JSON."""
+        pass
+
+
+class StdlibJSONSerializer(BaseJSONSerializer):
+    """Serializer backed by the stdlib `json` module."""
+
+    def __init__(self):
+        self._compact = json.JSONEncoder(separators=(",", ":"), default=str)
+        self._indented = json.JSONEncoder(indent=4, default=str)
+
+    def dumps(self, obj: Any) -> str:
+        return self._compact.encode(obj)
+
+    def dumps_indented(self, obj: Any) -> str:
+        return self._indented.encode(obj)
+
+
+class OrjsonSerializer(BaseJSONSerializer):
+    """Serializer backed by `orjson`.
+
+    Note:
+        `orjson` only supports 2-space indentation, so indented output uses
+        the stdlib encoder to keep the 4-space context format.
+    """
+
+    def __init__(self):
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibJSONSerializer()
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, default=str, option=self._option).decode()
+        except TypeError:
+            # e.g. ints wider than 64 bits
+            return self._fallback.dumps(obj)
+
+    def dumps_indented(self, obj: Any) -> str:
+        return self._fallback.dumps_indented(obj)
+
+
+class MsgspecSerializer(BaseJSONSerializer):
+    """Serializer backed by `msgspec.json`."""
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._fallback = StdlibJSONSerializer()
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._encoder.encode(obj).decode()
+        except (TypeError, OverflowError):
+            # e.g. ints wider than 64 bits
+            return self._fallback.dumps(obj)
+
+    def dumps_indented(self, obj: Any) -> str:
+        try:
+            encoded = self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return self._fallback.dumps_indented(obj)
+        return msgspec.json.format(encoded, indent=4).decode()
+
+
+# -----------------------------------------------------------------------------
+#   Registry
+# -----------------------------------------------------------------------------
+
+
+class SerializerRegistry:
+    """Registry for picking a JSON serializer backend."""
+
+    _serializers: Dict[SerializerType, Type[BaseJSONSerializer]] = {
+        SerializerType.ORJSON: OrjsonSerializer,
+        SerializerType.MSGSPEC: MsgspecSerializer,
+        SerializerType.STDLIB: StdlibJSONSerializer,
+    }
+    _available: Dict[SerializerType, bool] = {
+        SerializerType.ORJSON: orjson is not None,
+        SerializerType.MSGSPEC: msgspec is not None,
+        SerializerType.STDLIB: True,
+    }
+    _default: Optional[BaseJSONSerializer] = None
+
+    @classmethod
+    def create_serializer(
+        cls,
+        type: Optional[SerializerType | str] = None,
+    ) -> BaseJSONSerializer:
+        """Create a serializer of the specified type.
+
+        Args:
+            type (SerializerType | str): The backend to use. Defaults to the
+                fastest installed one (orjson, then msgspec, then stdlib)
+
+        Returns:
+            A serializer instance. Falls back to stdlib if the requested
+            backend is not installed.
+        """
+
+        if type is None:
+            if cls._default is None:
+                cls._default = cls._create_fastest()
+            return cls._default
+
+        _type = (
+            type
+            if isinstance(type, SerializerType)
+            else SerializerType[type.strip().upper()]
+        )
+        if not cls._available[_type]:
+            _type = SerializerType.STDLIB
+        return cls._serializers[_type]()
+
+    @classmethod
+    def get_available(cls) -> List[SerializerType]:
+        """Get the list of installed serializer backends."""
+
+        return [_type for _type, ok in cls._available.items() if ok]
+
+    @classmethod
+    def _create_fastest(cls) -> BaseJSONSerializer:
+        for _type in cls._serializers:
+            if cls._available[_type]:
+                return cls._serializers[_type]()
+        return StdlibJSONSerializer()
@@ -0,0 +1,59 @@
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+class CachedTimestamp:
+    """Formats record timestamps, reusing the formatted second.
+
+    Records arrive in bursts, so most records share the second of the
+    previous one. Only the sub-second part is formatted per record.
+
+    The `(second, prefix)` cache is swapped as one tuple, so concurrent
+    handlers never pair a prefix with the wrong second.
+    """
+
+    def __init__(self, datefmt: Optional[str] = None):
+        """
+        Args:
+            datefmt (str): A `time.strftime` format for `format_time`
+                Defaults to `logging.Formatter`'s default
+        """
+        self.datefmt = datefmt
+        self._iso_cache: Tuple[int, str] = (-1, "")
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def isoformat(self, created: float) -> str:
+        """Equivalent of `datetime.fromtimestamp(created).isoformat()`.
+
+        Microseconds are always included, so the output is fixed-width.
+        """
+
+        second = int(created)
+        micro = round((created - second) * 1_000_000)
+        if micro >= 1_000_000:
+            second, micro = second + 1, micro - 1_000_000
+
+        cached_second, prefix = self._iso_cache
+        if cached_second != second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._iso_cache = (second, prefix)
+
+        return f"{prefix}.{micro:06d}"
+
+    def format_time(self, created: float, msecs: float) -> str:
+        """Equivalent of `logging.Formatter.formatTime` for local time."""
+
+        second = int(created)
+        cached_second, prefix = self._time_cache
+        if cached_second != second:
+            struct = time.localtime(second)
+            if self.datefmt:
+                prefix = time.strftime(self.datefmt, struct)
+            else:
+                prefix = time.strftime("%Y-%m-%d %H:%M:%S", struct)
+            self._time_cache = (second, prefix)
+
+        if self.datefmt:
+            return prefix
+        return f"{prefix},{int(msecs):03d}"
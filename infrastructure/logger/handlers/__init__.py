@@ -1,7 +1,29 @@
-from .console import RichHandlerCfg
-from .file import RotatingFileHandler
+from .binary import BinaryLogHandler, BinaryLogReader
+from .console import BufferedConsoleHandler, RichHandlerCfg
+from .file import BackgroundRotatingFileHandler, Compression, RotateWhen
+from .process import AggregatorListener, ProcessQueueHandler, create_process_queue
+from .queue import (
+    BoundedQueueHandler,
+    BoundedQueueListener,
+    NonBlockingQueueHandler,
+    OverflowPolicy,
+)
+from .ring import RingBufferHandler
 
 __all__ = [
+    "BufferedConsoleHandler",
     "RichHandlerCfg",
-    "RotatingFileHandler",
+    "BackgroundRotatingFileHandler",
+    "Compression",
+    "RotateWhen",
+    "BoundedQueueHandler",
+    "BoundedQueueListener",
+    "NonBlockingQueueHandler",
+    "OverflowPolicy",
+    "RingBufferHandler",
+    "AggregatorListener",
+    "ProcessQueueHandler",
+    "create_process_queue",
+    "BinaryLogHandler",
+    "BinaryLogReader",
 ]
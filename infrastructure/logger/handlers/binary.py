@@ -0,0 +1,352 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional
+
+from ..formatters.formatters import _EXCLUDED_CONTEXT_KEYS
+from ..formatters.serializers import BaseJSONSerializer, SerializerRegistry
+
+# -----------------------------------------------------------------------------
+#   File format
+# -----------------------------------------------------------------------------
+
+# Log file: magic, then frames of a little-endian u32 length and the record
+# as compact UTF-8 JSON
+LOG_MAGIC = b"SENALOG\x01"
+FRAME_HEADER = struct.Struct("<I")
+
+# Index file, `<log file>.idx`: magic, then one fixed-size entry per frame
+# created (f64), frame offset (u64), payload length (u32),
+# crc32 of the service name (u32), level number (u8), padding
+INDEX_MAGIC = b"SENAIDX\x01"
+INDEX_ENTRY = struct.Struct("<dQIIB3x")
+
+
+def index_path(path: Path | str) -> Path:
+    """Path of a binary log file's sidecar index."""
+
+    path = Path(path)
+    return path.with_name(f"{path.name}.idx")
+
+
+def service_hash(service: str) -> int:
+    """Hash of a service name, as stored in the index."""
+
+    return zlib.crc32(service.encode("utf-8"))
+
+
+class IndexEntry(NamedTuple):
+    created: float
+    offset: int
+    length: int
+    service: int
+    levelno: int
+
+
+# -----------------------------------------------------------------------------
+#   Writer
+# -----------------------------------------------------------------------------
+
+
+class BinaryLogHandler(logging.Handler):
+    """File handler writing length-prefixed records and a sidecar index.
+
+    Each record is written as one frame of compact JSON with its context,
+    and indexed by time, level and service, so `BinaryLogReader` can seek
+    to a time range and skip records without parsing them.
+
+    Rotates by size only, to `<file>.<YYYYmmdd-HHMMSS>` and its index.
+    Backups are not compressed, they are read through `mmap`.
+    """
+
+    def __init__(
+        self,
+        filename: Path | str,
+        *,
+        append: bool = True,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        serializer: Optional[BaseJSONSerializer] = None,
+    ):
+        """
+        Args:
+            filename (Path | str): Path of the log file
+            append (bool): Keep existing records, otherwise truncate
+            max_bytes (int): Rotate before the file would exceed it, never if 0
+            backup_count (int): Rotated files to keep, never rotates if 0
+            serializer (BaseJSONSerializer): Defaults to the fastest installed
+        """
+        super().__init__()
+        self.path = Path(filename)
+        self.index_path = index_path(self.path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.serializer = serializer or SerializerRegistry.create_serializer()
+
+        self._stream: Optional[BinaryIO] = None
+        self._index: Optional[BinaryIO] = None
+        self._size = 0
+        self._open(append)
+
+    # -------------------------------------------------------------------------
+    #   Handler methods
+    # -------------------------------------------------------------------------
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            payload = self.encode(record)
+            if self._should_rollover(len(payload)):
+                self._rollover()
+
+            stream, index = self._stream, self._index
+            if stream is None or index is None:
+                return
+
+            offset = self._size
+            stream.write(FRAME_HEADER.pack(len(payload)))
+            stream.write(payload)
+            stream.flush()
+            # Written after its frame, an indexed frame is always complete
+            index.write(
+                INDEX_ENTRY.pack(
+                    record.created,
+                    offset,
+                    len(payload),
+                    service_hash(getattr(record, "service", "unknown")),
+                    record.levelno,
+                )
+            )
+            index.flush()
+            self._size += FRAME_HEADER.size + len(payload)
+        except Exception:
+            self.handleError(record)
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Serialize a record, with its context, to compact JSON."""
+
+        entry: Dict[str, Any] = {
+            "created": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "service": getattr(record, "service", "unknown"),
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        context = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _EXCLUDED_CONTEXT_KEYS
+        }
+        if context:
+            entry["context"] = context
+
+        return self.serializer.dumps(entry).encode("utf-8")
+
+    def flush(self):
+        with self.lock:  # type: ignore[union-attr]
+            for file in (self._stream, self._index):
+                if file is not None:
+                    file.flush()
+
+    def close(self):
+        with self.lock:  # type: ignore[union-attr]
+            self._close_files()
+        super().close()
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _open(self, append: bool):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "ab" if append else "wb"
+        self._stream = open(self.path, mode)
+        self._index = open(self.index_path, mode)
+
+        self._size = self._stream.seek(0, os.SEEK_END)
+        if self._size == 0:
+            self._stream.write(LOG_MAGIC)
+            self._size = len(LOG_MAGIC)
+        if self._index.seek(0, os.SEEK_END) == 0:
+            self._index.write(INDEX_MAGIC)
+
+    def _close_files(self):
+        for file in (self._stream, self._index):
+            if file is not None:
+                file.close()
+        self._stream = self._index = None
+
+    def _should_rollover(self, length: int) -> bool:
+        return bool(
+            self.max_bytes
+            and self.backup_count > 0
+            and self._size > len(LOG_MAGIC)
+            and self._size + FRAME_HEADER.size + length > self.max_bytes
+        )
+
+    def _rollover(self):
+        """Rename the file and its index to a backup and start new ones."""
+
+        self._close_files()
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        backup = self.path.with_name(f"{self.path.name}.{stamp}")
+        counter = 1
+        while backup.exists():
+            backup = self.path.with_name(f"{self.path.name}.{stamp}-{counter}")
+            counter += 1
+        os.replace(self.path, backup)
+        os.replace(self.index_path, index_path(backup))
+
+        self._prune()
+        self._open(append=False)
+
+    def _prune(self):
+        """Delete the oldest backups beyond `backup_count`."""
+
+        backups = sorted(
+            path
+            for path in self.path.parent.glob(f"{self.path.name}.*")
+            if path.suffix != ".idx"
+        )
+        excess = len(backups) - self.backup_count
+        for backup in backups[: max(0, excess)]:
+            for path in (backup, index_path(backup)):
+                path.unlink(missing_ok=True)
+
+
+# -----------------------------------------------------------------------------
+#   Reader
+# -----------------------------------------------------------------------------
+
+
+class BinaryLogReader:
+    """Memory-mapped reader of a `BinaryLogHandler` file and its index.
+
+    Queries run on the index: the start of a time range is found with a
+    binary search, and level and service are compared as integers, so only
+    matching frames are sliced out of the log file. Frames are in write
+    order, which may differ from `created` by the few records that raced
+    the one written before them.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._files: List[BinaryIO] = []
+        self._log = self._map(self.path, LOG_MAGIC)
+        self._index = self._map(index_path(self.path), INDEX_MAGIC)
+
+        # A partly written entry at the end is ignored
+        self.count = (len(self._index) - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    # -------------------------------------------------------------------------
+    #   Query methods
+    # -------------------------------------------------------------------------
+
+    def entry(self, position: int) -> IndexEntry:
+        return IndexEntry._make(
+            INDEX_ENTRY.unpack_from(
+                self._index, len(INDEX_MAGIC) + position * INDEX_ENTRY.size
+            )
+        )
+
+    def entries(
+        self,
+        *,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_level: int = logging.NOTSET,
+        services: Optional[List[str]] = None,
+    ) -> Iterator[IndexEntry]:
+        """Index entries of the matching records, in write order.
+
+        Args:
+            since (float): Earliest `created` UNIX time, inclusive
+            until (float): Latest `created` UNIX time, inclusive
+            min_level (int): Lowest level number
+            services (List[str]): Service names, any if None
+        """
+
+        hashes = {service_hash(service) for service in services or []}
+        position = self._bisect(since) if since is not None else 0
+
+        for position in range(position, self.count):
+            entry = self.entry(position)
+            if until is not None and entry.created > until:
+                return
+            if since is not None and entry.created < since:
+                continue
+            if entry.levelno < min_level:
+                continue
+            if hashes and entry.service not in hashes:
+                continue
+            yield entry
+
+    def payload(self, entry: IndexEntry) -> bytes:
+        """The record's compact JSON, as written."""
+
+        start = entry.offset + FRAME_HEADER.size
+        return self._log[start : start + entry.length]
+
+    def records(self, **query: Any) -> Iterator[Dict[str, Any]]:
+        """Decoded records matching the query, see `entries`."""
+
+        for entry in self.entries(**query):
+            yield json.loads(self.payload(entry))
+
+    def close(self):
+        for mapped in (self._log, self._index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        for file in self._files:
+            file.close()
+        self._files.clear()
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _map(self, path: Path, magic: bytes) -> mmap.mmap | bytes:
+        file = open(path, "rb")
+        self._files.append(file)
+        if os.fstat(file.fileno()).st_size < len(magic):
+            return magic
+
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[: len(magic)] != magic:
+            mapped.close()
+            raise ValueError(f"{path} is not a binary log file")
+        return mapped
+
+    def _bisect(self, since: float) -> int:
+        """Position of the first entry created at or after `since`."""
+
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.entry(middle).created < since:
+                low = middle + 1
+            else:
+                high = middle
+        return low
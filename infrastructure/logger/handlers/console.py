@@ -1,4 +1,10 @@
+import logging
+import sys
+import threading
+import time
 from enum import Enum
+from typing import IO, List, Optional
+from weakref import WeakSet
 
 from rich.console import Console
 
@@ -24,3 +30,150 @@ class RichHandlerCfg(Enum):
     show_path = False
     markup = True
     rich_tracebacks = True
+
+
+class BufferedConsoleHandler(logging.StreamHandler):
+    """Plain-text console handler for non-interactive output.
+
+    Used instead of `RichHandler` when stdout is piped (e.g. to a container
+    log collector). Records are formatted with the plain formatter and
+    buffered; the buffer is written when it reaches `buffer_size`, when an
+    ERROR or above is emitted, and every `flush_interval` seconds by a
+    background thread shared by every live handler.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        *,
+        flush_interval: float = 1.0,
+        buffer_size: int = 64 * 1024,
+    ):
+        """
+        Args:
+            stream (IO[str]): Where to write. Defaults to `sys.stdout`
+            flush_interval (float): Max seconds a line stays buffered
+            buffer_size (int): Buffered characters that force a write
+        """
+        super().__init__(stream or sys.stdout)
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+        self._buffered: int = 0
+
+        # Monotonic time of the next periodic flush
+        self._flush_at = time.monotonic() + flush_interval
+        _register(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self.lock:  # type: ignore[union-attr]
+            self._buffer.append(line)
+            self._buffered += len(line)
+            if self._buffered >= self.buffer_size or record.levelno >= logging.ERROR:
+                self._write_buffer()
+
+    def flush(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            self._write_buffer()
+            super().flush()
+
+    def close(self) -> None:
+        _unregister(self)
+        self.flush()
+        super().close()
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _write_buffer(self) -> None:
+        """Write out buffered lines. Caller must hold `self.lock`."""
+
+        if not self._buffer:
+            return
+
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except ValueError:
+            # Stream already closed at interpreter shutdown
+            pass
+
+
+# -----------------------------------------------------------------------------
+#   Shared flusher
+#   One thread flushes every live `BufferedConsoleHandler` on its interval
+# -----------------------------------------------------------------------------
+
+_handlers: "WeakSet[BufferedConsoleHandler]" = WeakSet()
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+# Set when a handler is added, so the flusher recomputes its next wake up
+_wake_up = threading.Event()
+
+
+def _register(handler: BufferedConsoleHandler) -> None:
+    """Flush the handler periodically, starting the flusher if needed."""
+
+    global _flusher
+    with _flusher_lock:
+        _handlers.add(handler)
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_flush_periodically,
+                name="console-log-flusher",
+                daemon=True,
+            )
+            _flusher.start()
+        else:
+            _wake_up.set()
+
+
+def _unregister(handler: BufferedConsoleHandler) -> None:
+    with _flusher_lock:
+        _handlers.discard(handler)
+
+
+def _flush_periodically() -> None:
+    """Flush handlers as their intervals elapse, exit once none is left."""
+
+    while True:
+        delay = _flush_due()
+        if delay is None:
+            return
+        _wake_up.wait(delay)
+
+
+def _flush_due() -> Optional[float]:
+    """Flush each handler whose interval elapsed.
+
+    Returns:
+        Seconds until the next handler is due, or None if no handler is left
+        (and the flusher must exit). The handlers are only referenced while
+        this runs, so an unused one can still be collected.
+    """
+
+    global _flusher
+    with _flusher_lock:
+        handlers = list(_handlers)
+        if not handlers:
+            _flusher = None
+            return None
+        _wake_up.clear()
+
+    now = time.monotonic()
+    for handler in handlers:
+        if now >= handler._flush_at:
+            handler._flush_at = now + handler.flush_interval
+            handler.flush()
+    next_flush = min(handler._flush_at for handler in handlers)
+    return max(0.0, next_flush - time.monotonic())
@@ -1,3 +1,213 @@
-from logging.handlers import RotatingFileHandler
+import gzip
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Literal, Optional, Set, TypeAlias
 
-...
+# Optional zstd backend
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+Compression: TypeAlias = Literal["none", "gzip", "zstd"]
+"""How rotated log files are compressed."""
+
+RotateWhen: TypeAlias = Literal["S", "M", "H", "D", "midnight"]
+"""Unit of time-based rotation, as in `TimedRotatingFileHandler`."""
+
+_WHEN_SECONDS = {"S": 1, "M": 60, "H": 60 * 60, "D": 24 * 60 * 60}
+
+# One worker for all handlers, rotations are rare and I/O bound
+_rotation_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="log-rotation",
+)
+
+
+class BackgroundRotatingFileHandler(logging.FileHandler):
+    """File handler that rotates in O(1) and compresses in the background.
+
+    On rollover the active file is renamed to a timestamped backup and a
+    new file is opened; that is all the emitting thread pays for.
+    Compressing the backup and pruning backups beyond `backup_count` run on
+    a shared background thread.
+
+    Rotation Triggers:
+        - size: the file would exceed `max_bytes` (counted in characters,
+          so approximate for non-ASCII text)
+        - time: every `interval` `when` units, or at local midnight
+
+    Backups are named `<file>.<YYYYmmdd-HHMMSS>[.gz|.zst]`. As with
+    `RotatingFileHandler`, a `backup_count` of 0 never rolls over.
+    """
+
+    def __init__(
+        self,
+        filename: Path | str,
+        mode: str = "a",
+        *,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        encoding: Optional[str] = None,
+        rotation: Literal["size", "time"] = "size",
+        when: RotateWhen = "midnight",
+        interval: int = 1,
+        compression: Compression = "gzip",
+    ):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotation = rotation
+        self.when = when
+        self.interval = interval
+        self.compression: Compression = (
+            "gzip" if compression == "zstd" and zstandard is None else compression
+        )
+
+        self._size = self._current_size()
+        self._rollover_at = self._compute_rollover_at(time.time())
+        self._pending: List[Future] = []
+        # Backups handed to the worker but not yet compressed
+        self._queued: Set[Path] = set()
+
+    # -------------------------------------------------------------------------
+    #   Handler methods
+    # -------------------------------------------------------------------------
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called by `Handler.handle` with `self.lock` held
+        try:
+            msg = self.format(record) + self.terminator
+            if self._should_rollover(record.created, len(msg)):
+                self.do_rollover(record.created)
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        super().close()
+        wait(self._pending)
+        self._pending.clear()
+
+    def do_rollover(self, now: Optional[float] = None) -> None:
+        """Move the active file aside and hand it to the background worker."""
+
+        now = time.time() if now is None else now
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+
+        source = Path(self.baseFilename)
+        if self.backup_count > 0 and source.exists() and source.stat().st_size > 0:
+            backup = self._backup_name(source, now)
+            os.replace(source, backup)
+            self._queued.add(backup)
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(
+                _rotation_executor.submit(self._finish_rollover, backup)
+            )
+
+        self.stream = self._open()
+        self._size = 0
+        self._rollover_at = self._compute_rollover_at(now)
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _should_rollover(self, now: float, size: int) -> bool:
+        if self.backup_count <= 0:
+            return False
+        if self.rotation == "time":
+            return now >= self._rollover_at
+        return self.max_bytes > 0 and (self._size + size) > self.max_bytes
+
+    def _current_size(self) -> int:
+        try:
+            return os.path.getsize(self.baseFilename)
+        except OSError:
+            return 0
+
+    def _compute_rollover_at(self, now: float) -> float:
+        if self.when == "midnight":
+            tomorrow = datetime.fromtimestamp(now).date() + timedelta(days=1)
+            return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+        return now + _WHEN_SECONDS[self.when] * self.interval
+
+    def _backup_name(self, source: Path, now: float) -> Path:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        backup = source.with_name(f"{source.name}.{stamp}")
+        counter = 1
+        while (
+            backup.exists()
+            or backup in self._queued
+            or self._compressed_name(backup).exists()
+        ):
+            backup = source.with_name(f"{source.name}.{stamp}-{counter}")
+            counter += 1
+        return backup
+
+    def _compressed_name(self, backup: Path) -> Path:
+        suffix = {"gzip": ".gz", "zstd": ".zst"}.get(self.compression, "")
+        return backup.with_name(backup.name + suffix)
+
+    def _finish_rollover(self, backup: Path) -> None:
+        """Compress a backup and prune old ones. Runs on the worker thread."""
+
+        try:
+            if self.compression != "none":
+                self._compress(backup)
+            self._queued.discard(backup)
+            self._prune_backups()
+        except Exception:
+            # Not tied to a record, one is made to say which backup failed
+            self.handleError(
+                logging.makeLogRecord({"msg": f"Log rotation failed for {backup}"})
+            )
+        finally:
+            self._queued.discard(backup)
+
+    def _compress(self, backup: Path) -> None:
+        target = self._compressed_name(backup)
+        partial = target.with_name(target.name + ".part")
+
+        try:
+            with open(backup, "rb") as source:
+                if self.compression == "zstd":
+                    with open(partial, "wb") as dest:
+                        zstandard.ZstdCompressor().copy_stream(source, dest)
+                else:
+                    with gzip.open(partial, "wb", compresslevel=6) as dest:
+                        shutil.copyfileobj(source, dest)
+            os.replace(partial, target)
+        except BaseException:
+            # The backup is kept whole, only the partial copy goes
+            partial.unlink(missing_ok=True)
+            raise
+        backup.unlink()
+
+    def _prune_backups(self) -> None:
+        source = Path(self.baseFilename)
+        queued = set(self._queued)
+        backups = sorted(
+            (
+                path
+                for path in source.parent.glob(f"{source.name}.*")
+                if path not in queued and not path.name.endswith(".part")
+            ),
+            # Single worker, so finished backups are in rotation order
+            key=lambda path: path.stat().st_mtime_ns,
+        )
+        for path in backups[: max(0, len(backups) - self.backup_count)]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,97 @@
+import copy
+import logging
+import multiprocessing
+import queue
+from logging.handlers import QueueHandler
+from typing import Any, Optional
+
+from .queue import BoundedQueueListener, _make_dropped_report
+
+# Renders tracebacks in the worker, tracebacks can't be pickled
+_exc_formatter = logging.Formatter()
+
+
+class ProcessQueueHandler(QueueHandler):
+    """Worker-side handler shipping records to the aggregator process.
+
+    The record is copied with its message rendered and its traceback
+    formatted, so it pickles, and tagged with the worker's ID. The copy is
+    handed to a `multiprocessing.Queue`, whose feeder thread pickles and
+    sends it; the caller pays for one non-blocking `put`.
+
+    Note:
+        Context values must be picklable.
+
+    Attributes:
+        dropped (int): Records discarded since the last drop report
+    """
+
+    def __init__(self, log_queue: Any, worker_id: int | str):
+        super().__init__(log_queue)
+        self.worker_id = worker_id
+        self.dropped: int = 0
+
+    def handle(self, record: logging.LogRecord):
+        # The queue is process-safe, the handler lock adds nothing
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy, local handlers (e.g. the ring buffer) keep the original
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.worker_id = self.worker_id
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            try:
+                self.queue.put_nowait(_make_dropped_report(record, dropped))
+            except queue.Full:
+                self.dropped += dropped
+
+
+class AggregatorListener(BoundedQueueListener):
+    """Aggregator-side listener writing records from every worker.
+
+    Each record is routed to the handlers of the aggregator's logger with
+    the same name, so the aggregator's own service loggers decide the files,
+    levels and rotation. Records of services the aggregator has no logger
+    for go to `fallback`.
+    """
+
+    def __init__(
+        self,
+        log_queue: Any,
+        *,
+        fallback: Optional[logging.Logger] = None,
+        timeout: float = 1.0,
+    ):
+        super().__init__(log_queue, timeout=timeout)
+        self.fallback = fallback
+
+    def handle(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if not logger.handlers and self.fallback:
+            logger = self.fallback
+        logger.callHandlers(record)
+
+
+def create_process_queue(queue_size: int) -> Any:
+    """A queue to pass from the aggregator to its worker processes."""
+
+    return multiprocessing.Queue(maxsize=queue_size)
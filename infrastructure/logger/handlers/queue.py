@@ -0,0 +1,200 @@
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal, Optional, TypeAlias, Union
+
+OverflowPolicy: TypeAlias = Literal["drop", "block"]
+"""What to do with a record when the log queue is full."""
+
+_LogQueue: TypeAlias = Union[
+    "queue.Queue[Optional[logging.LogRecord]]",
+    "queue.SimpleQueue[Optional[logging.LogRecord]]",
+]
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that hands records to a bounded in-memory queue.
+
+    The record is enqueued as-is; formatting, filtering and I/O are left
+    to the handlers owned by the `BoundedQueueListener` thread, so the
+    caller only pays for record creation and one `put`.
+
+    Overflow Policies:
+        - drop: Discard the record immediately when the queue is full
+        - block: Wait up to `timeout` seconds for a free slot, then discard
+
+    Attributes:
+        dropped (int): Records discarded since the last drop report
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Optional[logging.LogRecord]]",
+        *,
+        overflow: OverflowPolicy = "drop",
+        timeout: float = 1.0,
+    ):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.timeout = timeout
+        self.dropped: int = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through untouched.
+
+        The stdlib implementation formats the record and strips `exc_info`
+        so it can be pickled. The listener runs in the same process, so the
+        downstream handlers get the original record and its context.
+        """
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.overflow == "block":
+                self.queue.put(record, block=True, timeout=self.timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        # Report drops once there is room again
+        if self.dropped:
+            self._report_dropped(record)
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _report_dropped(self, record: logging.LogRecord) -> None:
+        """Enqueue a warning about previously dropped records."""
+
+        dropped, self.dropped = self.dropped, 0
+        try:
+            self.queue.put_nowait(_make_dropped_report(record, dropped))
+        except queue.Full:
+            self.dropped += dropped
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that never blocks or takes a lock.
+
+    Backed by a `queue.SimpleQueue`, whose `put` is atomic and never waits,
+    and skips the handler lock `Handler.handle` would take. Meant for
+    asyncio code, where concurrent tasks would otherwise stall the event
+    loop on handler locks and I/O.
+
+    The queue is unbounded; records are dropped once about `queue_size`
+    are waiting, as `qsize` is read without synchronisation.
+
+    Attributes:
+        dropped (int): Records discarded since the last drop report
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[Optional[logging.LogRecord]]",
+        *,
+        queue_size: int,
+    ):
+        super().__init__(log_queue)  # type: ignore[arg-type]
+        self.queue_size = queue_size
+        self.dropped: int = 0
+
+    def handle(self, record: logging.LogRecord):
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through untouched, as in `BoundedQueueHandler`."""
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.queue_size:
+            self.dropped += 1
+            return
+
+        self.queue.put_nowait(record)
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            self.queue.put_nowait(_make_dropped_report(record, dropped))
+
+
+class BoundedQueueListener(QueueListener):
+    """Queue listener whose shutdown is bounded by a timeout.
+
+    Owns the console/file handlers and runs them on a daemon thread.
+    """
+
+    def __init__(
+        self,
+        log_queue: _LogQueue,
+        *handlers: logging.Handler,
+        timeout: float = 1.0,
+    ):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.timeout = timeout
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        super().start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Drain the queue and stop the listener thread.
+
+        Args:
+            timeout (float): Max seconds to wait for queued records to be
+                handled. Defaults to the listener's configured timeout
+
+        Returns:
+            Whether the queue was fully drained within the timeout.
+        """
+
+        if not self.running:
+            return True
+
+        timeout = self.timeout if timeout is None else timeout
+        thread: threading.Thread = self._thread  # type: ignore[assignment]
+        try:
+            self.queue.put(self._sentinel, block=True, timeout=timeout)
+        except queue.Full:
+            return False
+
+        thread.join(timeout)
+        drained = not thread.is_alive()
+        if drained:
+            self._thread = None
+        return drained
+
+    def flush(self) -> None:
+        """Flush all owned handlers."""
+
+        for handler in self.handlers:
+            handler.flush()
+
+
+def _make_dropped_report(record: logging.LogRecord, dropped: int) -> logging.LogRecord:
+    """A warning about dropped records, attributed to the record after them."""
+
+    return logging.makeLogRecord(
+        {
+            "name": record.name,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": f"Log queue full, {dropped} records dropped",
+            "pathname": record.pathname,
+            "module": record.module,
+            "funcName": record.funcName,
+            "lineno": record.lineno,
+        }
+    )
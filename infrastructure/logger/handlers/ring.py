@@ -0,0 +1,56 @@
+import logging
+from typing import List, Optional, TextIO
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records in memory.
+
+    Slots are preallocated and overwritten in place, so emitting is a store
+    and an increment. Records are only formatted when dumped, e.g. to a
+    crash file, which lets it keep DEBUG records the file handler never
+    writes.
+    """
+
+    def __init__(self, capacity: int, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.capacity = capacity
+        self._records: List[Optional[logging.LogRecord]] = [None] * capacity
+        self._count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called by `Handler.handle` with `self.lock` held
+        self._records[self._count % self.capacity] = record
+        self._count += 1
+
+    # -------------------------------------------------------------------------
+    #   Public methods
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> List[logging.LogRecord]:
+        """Get the kept records, oldest first."""
+
+        with self.lock:  # type: ignore[union-attr]
+            start = self._count % self.capacity
+            records = self._records[start:] + self._records[:start]
+        return [record for record in records if record is not None]
+
+    def dump(self, stream: TextIO) -> int:
+        """Write the kept records to a stream, oldest first.
+
+        Returns:
+            The amount of records written.
+        """
+
+        records = self.snapshot()
+        for record in records:
+            try:
+                stream.write(self.format(record) + "\n")
+            except Exception:
+                # A broken record must not lose the rest of the dump
+                stream.write(f"<unformattable record: {record.msg!r}>\n")
+        return len(records)
+
+    def clear(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            self._records = [None] * self.capacity
+            self._count = 0
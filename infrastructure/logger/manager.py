@@ -1,14 +1,28 @@
+import asyncio
+import atexit
+import io
+import logging
+import os
 import sys
+import time
+import traceback
 from contextlib import contextmanager
+from pathlib import Path
 from threading import Lock
-from typing import Dict, Optional, Set
+from types import TracebackType
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
-from ...config.logger.static import SYSTEM_LOGGER_CONFIG
+from ...config.logger.static import CRASH_DUMP_DIR, SYSTEM_LOGGER_CONFIG
 from ...core.exceptions.error_codes import ErrorCode
 from ...core.protocols.infrastructure.logger import ServiceLoggerProtocol
 from ...infrastructure.config.models import LoggerConfig
 from ..exceptions import LookupError
+from .handlers import AggregatorListener, create_process_queue
 from .services.factory import _LoggerFactory
+from .services.handlers import get_process_queue_handler
+from .services.registry import _LoggerRegistry
+
+_ExcInfo = Tuple[Type[BaseException], BaseException, Optional[TracebackType]]
 
 
 class LoggerManager:
@@ -20,10 +34,14 @@ class LoggerManager:
     _lock = Lock()  # Avoid race conditions
 
     # Track active loggers
-    active_loggers: Dict[str, ServiceLoggerProtocol] = {}
+    # Lookups are lock-free, see `_LoggerRegistry`
+    _registry = _LoggerRegistry()
     _system_logger: Optional[ServiceLoggerProtocol] = None
     global_exception_handler_set: bool = False
 
+    # Multi-process logging, set in the aggregator process
+    _aggregator: Optional[AggregatorListener] = None
+
     def __new__(cls) -> "LoggerManager":
         if cls._instance is None:
             with cls._lock:
@@ -42,6 +60,8 @@ class LoggerManager:
         if not self.global_exception_handler_set:
             self._setup_global_exception_handler()
         self._create_system_logger()
+        # Drain async loggers before `logging.shutdown` closes their handlers
+        atexit.register(self.close_all)
         self._initialized = True
 
     # -------------------------------------------------------------------------
@@ -66,41 +86,137 @@ class LoggerManager:
     def create_logger(self, config: LoggerConfig) -> ServiceLoggerProtocol:
         """Create a new logger instance for a service"""
 
-        with self._lock:
-            if config.name in self.active_loggers:
-                # Don't log because its not yet initialized
-                raise LookupError(
-                    message=f"{config.name} logger cannot be created, for it already exists",
-                    err_code=ErrorCode.INF_LOGR_LOOK_526,
-                )
-
-            logger = self.factory.create_logger(
-                config=config,
-                on_close_callback=self._on_logger_closed,
+        logger, created = self._registry.get_or_create(
+            config.name, lambda: self._build_logger(config)
+        )
+        if not created:
+            # Don't log because its not yet initialized
+            raise LookupError(
+                message=f"{config.name} logger cannot be created, for it already exists",
+                err_code=ErrorCode.INF_LOGR_LOOK_526,
             )
 
-            self.active_loggers[f"{config.name}"] = logger
-            logger.info(f"{config.name} logger initialized")
+        logger.info(f"{config.name} logger initialized")
+        return logger
 
-            return logger
+    def get_or_create_logger(self, config: LoggerConfig) -> ServiceLoggerProtocol:
+        """Get the service's open logger, creating it if there is none.
+
+        Concurrent calls for the same service create one logger.
+        """
+
+        logger, created = self._registry.get_or_create(
+            config.name, lambda: self._build_logger(config)
+        )
+        if created:
+            logger.info(f"{config.name} logger initialized")
+        return logger
 
     @classmethod
     def get_logger(cls, service_name: str) -> ServiceLoggerProtocol:
-        """Get an existing logger by service name."""
+        """Get an existing logger by service name.
 
-        logger = cls.active_loggers[service_name]
+        Lock-free, safe to call per message.
+        """
+
+        logger = cls._registry.get(service_name)
+        if logger is None:
+            # Never created, or was closed using logger's `.close` method
+            raise LookupError(
+                message=f"{service_name} logger does not exist or is closed",
+                err_code=ErrorCode.INF_LOGR_LOOK_528,
+            )
 
-        # Was already closed using logger's `.close` method
-        if logger and logger.closed:
-            del logger
+        return logger
+
+    def apply_config(self, config: LoggerConfig) -> ServiceLoggerProtocol:
+        """Re-level an active logger from a (re)built config.
+
+        Use with `LoggerConfigBuilder.with_console_level`/`with_file_level`
+        to change levels without recreating the logger.
+        """
 
+        logger = self.get_logger(config.name)
+        logger.set_levels(
+            console_level=config.console.level,
+            file_level=config.file.level,
+        )
         return logger
 
     @classmethod
     def list_active_loggers(cls) -> Set[str]:
         """Get service names of all active loggers."""
 
-        return set(cls.active_loggers.keys())
+        return set(cls._registry.snapshot().keys())
+
+    # -------------------------------------------------------------------------
+    #   Multi-process methods
+    #   For running the bot as several (e.g. shard) processes
+    # -------------------------------------------------------------------------
+
+    def start_aggregator(self, queue_size: int = 10_000, timeout: float = 1.0) -> Any:
+        """Write the records of worker processes from this process.
+
+        Worker records are routed to this process's logger of the same
+        service, so create the service loggers here too; records of other
+        services go to the system logger.
+
+        Args:
+            queue_size (int): Max records waiting, workers drop beyond it
+            timeout (float): Max seconds to drain the queue on shutdown
+
+        Returns:
+            The queue to hand to each worker's `configure_worker`.
+        """
+
+        with self._lock:
+            if self._aggregator is None:
+                log_queue = create_process_queue(queue_size)
+                self._aggregator = AggregatorListener(
+                    log_queue,
+                    fallback=logging.getLogger(f"sena.{SYSTEM_LOGGER_CONFIG['name']}"),
+                    timeout=timeout,
+                )
+                self._aggregator.start()
+            return self._aggregator.queue
+
+    def stop_aggregator(self, timeout: Optional[float] = None) -> bool:
+        """Write the remaining worker records and stop aggregating.
+
+        Returns:
+            Whether the queue was fully drained within the timeout.
+        """
+
+        with self._lock:
+            aggregator, self._aggregator = self._aggregator, None
+        if aggregator is None:
+            return True
+        return aggregator.stop(timeout)
+
+    def configure_worker(self, log_queue: Any, worker_id: int | str):
+        """Ship this process's records to the aggregator's queue.
+
+        Every record is tagged with `worker_id`; the console and file
+        output is written by the aggregator. Call at the start of the
+        worker process. Loggers that already exist, e.g. inherited through
+        `fork`, are redirected in place.
+
+        Args:
+            log_queue (multiprocessing.Queue): From `start_aggregator`
+            worker_id (int | str): E.g. the shard group of the worker
+        """
+
+        self.factory.set_worker(log_queue, worker_id)
+
+        with self._lock:
+            # Inherited through `fork`, the listener thread is the parent's
+            self._aggregator = None
+        for logger in self._registry.snapshot().values():
+            logger.redirect(
+                get_process_queue_handler(
+                    log_queue, worker_id=worker_id, level=logging.NOTSET
+                )
+            )
 
     # -------------------------------------------------------------------------
     #   Private helper methods
@@ -114,7 +230,7 @@ class LoggerManager:
         system_logger = self.factory.create_logger(system_config)
         self._system_logger = system_logger
         self.system_logger.debug("System logger initialized")
-        self.active_loggers[system_config.name] = system_logger
+        self._registry.replace(system_config.name, system_logger)
 
         return system_logger
 
@@ -138,9 +254,98 @@ class LoggerManager:
                 exc_value=str(exc_value),
                 exc_info=(exc_type, exc_value, exc_traceback),
             )
+            self._report_crash(
+                "Uncaught system exception",
+                (exc_type, exc_value, exc_traceback),
+            )
 
         sys.excepthook = handle_exception
 
+    def install_asyncio_exception_handler(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """Log unhandled asyncio exceptions and dump the ring buffers.
+
+        Call from within the running loop (or pass it), e.g. at startup.
+        A previously installed handler is still called afterwards.
+        """
+
+        loop = loop or asyncio.get_running_loop()
+        previous_handler = loop.get_exception_handler()
+
+        def handle_exception(loop: asyncio.AbstractEventLoop, context: Dict):
+            exception = context.get("exception")
+            exc_info = (
+                (type(exception), exception, exception.__traceback__)
+                if exception
+                else None
+            )
+            message = context.get("message", "Unhandled asyncio exception")
+
+            self.system_logger.critical(
+                "Unhandled asyncio exception",
+                asyncio_message=message,
+                exc_info=exc_info,
+            )
+            self._report_crash(f"Unhandled asyncio exception: {message}", exc_info)
+
+            if previous_handler:
+                previous_handler(loop, context)
+
+        loop.set_exception_handler(handle_exception)
+
+    def dump_crash_report(
+        self,
+        reason: str,
+        exc_info: Optional[_ExcInfo] = None,
+    ) -> Path:
+        """Write every active logger's ring buffer to a new crash file.
+
+        Args:
+            reason (str): Why the report is written, its first line
+            exc_info (tuple): The exception that caused it, if any
+
+        Returns:
+            Path of the crash file.
+        """
+
+        loggers = self._registry.snapshot().items()
+
+        CRASH_DUMP_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = CRASH_DUMP_DIR / f"crash-{stamp}-{os.getpid()}.log"
+        counter = 1
+        while path.exists():
+            path = CRASH_DUMP_DIR / f"crash-{stamp}-{os.getpid()}-{counter}.log"
+            counter += 1
+
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(f"{reason}\n")
+            if exc_info:
+                stream.write("".join(traceback.format_exception(*exc_info)))
+
+            for name, logger in loggers:
+                recent = io.StringIO()
+                count = logger.dump_recent(recent)
+                if count:
+                    stream.write(f"\n==== {name}: last {count} records ====\n")
+                    stream.write(recent.getvalue())
+
+        return path
+
+    def _report_crash(self, reason: str, exc_info: Optional[_ExcInfo]):
+        """Dump the ring buffers, never raising from an exception handler."""
+
+        try:
+            path = self.dump_crash_report(reason, exc_info)
+        except Exception as err:
+            # Written as `logging.Handler.handleError` does
+            if logging.raiseExceptions and sys.stderr:
+                sys.stderr.write(f"--- Crash report could not be written: {err}\n")
+            return
+        self.system_logger.info(f"Crash report written to {path}")
+
     # -------------------------------------------------------------------------
     #   Temporary logger method
     #   Use when entering runtime context
@@ -160,21 +365,36 @@ class LoggerManager:
     #   Close logger method
     # -------------------------------------------------------------------------
 
+    def _build_logger(self, config: LoggerConfig) -> ServiceLoggerProtocol:
+        return self.factory.create_logger(
+            config=config,
+            on_close_callback=self._on_logger_closed,
+        )
+
     def _on_logger_closed(self, service_name: str):
         """Called when a `_ServiceLogger` closes itself."""
 
-        with self._lock:
-            if service_name in self.active_loggers:
-                del self.active_loggers[service_name]
+        # The logger's name is normalized, evict by identity instead
+        for name, logger in self._registry.snapshot().items():
+            if logger.closed:
+                self._registry.remove(name, logger)
 
-    def close_all(self):
-        """Close all active loggers."""
+    def close_all(self, timeout: Optional[float] = None):
+        """Close all active loggers.
 
-        with self._lock:
-            for logger in list(self.active_loggers.values()):
-                logger.close()
-                del logger
-            self.active_loggers.clear()
+        In the aggregator process, worker records still queued are written
+        first.
+
+        Args:
+            timeout (float): Max seconds each async logger may take to flush
+                its queue. Defaults to each logger's configured timeout
+        """
+
+        self.stop_aggregator(timeout)
+
+        # Unregister first, `close` calls back into `_on_logger_closed`
+        for logger in self._registry.clear():
+            logger.close(timeout)
 
 
 # Global factory instance
@@ -1,19 +1,58 @@
+import logging
+import multiprocessing
 from collections.abc import Callable
-from typing import Optional
+from typing import Any, Optional
 
+from ....config.logger.static import CRASH_DUMP_DATEFMT
 from ....core.protocols.infrastructure.logger import ServiceLoggerProtocol
 from ....infrastructure.config.models.logger_config import LoggerConfig
 from ....shared.logger.format_utils import Megabyte
 from ....shared.utils import IOUtils
+from ..adapters.async_logger import _AsyncServiceLogger
 from ..adapters.default_logger import _ServiceLogger
 from ..filters import FilterRegistry
 from ..formatters import FormatterRegistry
-from .handlers import get_console_handler, get_file_handler
+from .handlers import (
+    get_binary_file_handler,
+    get_console_handler,
+    get_file_handler,
+    get_nonblocking_queue_handler,
+    get_process_queue_handler,
+    get_queue_handler,
+    get_ring_handler,
+    resolve_console_mode,
+)
+from .pool import file_handler_pool
 
 
 class _LoggerFactory:
     """Factory for creating and managing service-specific loggers."""
 
+    def __init__(self):
+        # Set in worker processes, see `set_worker`
+        self.worker_queue: Optional[Any] = None
+        self.worker_id: Optional[int | str] = None
+
+    # -------------------------------------------------------------------------
+    #   Worker method
+    # -------------------------------------------------------------------------
+
+    def set_worker(
+        self,
+        log_queue: Optional[Any],
+        worker_id: Optional[int | str] = None,
+    ):
+        """Ship records of loggers created from now on to an aggregator.
+
+        Args:
+            log_queue (multiprocessing.Queue): The aggregator's queue, or
+                None to write locally again
+            worker_id (int | str): Tagged on every shipped record
+        """
+
+        self.worker_queue = log_queue
+        self.worker_id = worker_id
+
     # -------------------------------------------------------------------------
     #   Initialization method
     # -------------------------------------------------------------------------
@@ -32,10 +71,13 @@ class _LoggerFactory:
         _console_fmt = _console.fmt
         _console_datefmt = _console.datefmt
         _console_level = _console.level.to_value()
+        _console_mode = resolve_console_mode(_console.mode)
+        _console_flush_interval = _console.flush_interval
 
         # File config
         _file = config.file
-        _file_name = f"{_file.output_name}.log"
+        _file_binary = _file.format == "binary"
+        _file_name = f"{_file.output_name}.{'slog' if _file_binary else 'log'}"
         _file_path = _file.output_to / _file_name
         _file_level = _file.level.to_value()
         _file_append = _file.append
@@ -44,52 +86,194 @@ class _LoggerFactory:
         _file_datefmt = _file.datefmt
         _file_max_size_b = Megabyte(int(_file.max_size_mb)).b
         _file_backup_count = _file.backup_count
+        _file_compact_context = _file.compact_context
+        _file_rotation = _file.rotation
+        _file_rotate_when = _file.rotate_when
+        _file_rotate_interval = _file.rotate_interval
+        _file_compression = _file.compression
+
+        # Async config
+        _async = config.async_
+
+        # Worker process
+        # Records are shipped to the aggregator, which owns the console and
+        # file handlers
+        _worker = self.worker_queue is not None
+
+        # Ring buffer config
+        _ring = config.ring_buffer
 
         console_handler = None
         file_handler = None
 
         # Not all services should output to console
         # Console handler
-        if _console.enabled:
+        if _console.enabled and not _worker:
             format = FormatterRegistry.create_fmtter(
                 "formatter",
                 fmt=_console_fmt,
                 datefmt=_console_datefmt,
             )
-            filter = FilterRegistry.create_filter("service", service_name=_service_name)
+            console_filters = []
+            # Plain output has no markup renderer
+            if _console_mode == "plain":
+                console_filters.append(FilterRegistry.create_filter("strip_markup"))
             console_handler = get_console_handler(
                 fmt=format,
                 level=_console_level,
-                filter=filter,
+                filter=console_filters,
+                mode=_console_mode,
+                flush_interval=_console_flush_interval,
             )
 
         # File handler
-        if _file.enabled:
-            if not _file_append:
-                IOUtils.clear_content(_file_path)
+        # Shared with every service writing to the same file; the first
+        # service's file config decides format and rotation
+        if _file.enabled and not _worker:
 
+            def create_file_handler() -> logging.Handler:
+                # Child processes share the file with their parent, e.g. a
+                # spawned worker before `configure_worker`
+                _truncate = (
+                    not _file_append and multiprocessing.parent_process() is None
+                )
+                if _file_binary:
+                    return get_binary_file_handler(
+                        filename=_file_path,
+                        level=logging.NOTSET,
+                        size_bytes=int(_file_max_size_b),
+                        backup_count=_file_backup_count,
+                        append=not _truncate,
+                        filter=FilterRegistry.create_filter("strip_markup"),
+                    )
+                if _truncate:
+                    IOUtils.clear_content(_file_path)
+
+                format = FormatterRegistry.create_fmtter(
+                    "context_json",
+                    fmt=_file_fmt,
+                    datefmt=_file_datefmt,
+                    compact=_file_compact_context,
+                )
+                return get_file_handler(
+                    filename=_file_path,
+                    fmt=format,
+                    # Each service's level is set on its pooled handler
+                    level=logging.NOTSET,
+                    size_bytes=int(_file_max_size_b),
+                    backup_count=_file_backup_count,
+                    encoding=_file_encoding,
+                    filter=FilterRegistry.create_filter("strip_markup"),
+                    rotation=_file_rotation,
+                    when=_file_rotate_when,
+                    interval=_file_rotate_interval,
+                    compression=_file_compression,
+                )
+
+            file_handler = file_handler_pool.acquire(
+                _file_path,
+                level=_file_level,
+                create=create_file_handler,
+            )
+
+        # Ring buffer handler
+        # Attached to the logger directly, even in async mode, so a crash
+        # dump never waits on (or misses) queued records
+        ring_handler = None
+        if _ring.enabled:
             format = FormatterRegistry.create_fmtter(
                 "context_json",
                 fmt=_file_fmt,
-                datefmt=_file_datefmt,
+                datefmt=CRASH_DUMP_DATEFMT,
+                compact=True,
             )
-            filters = [
-                FilterRegistry.create_filter("service", service_name=_service_name),
-                FilterRegistry.create_filter("strip_markup"),
-            ]
-            file_handler = get_file_handler(
-                filename=_file_path,
+            ring_handler = get_ring_handler(
+                capacity=_ring.capacity,
                 fmt=format,
-                level=_file_level,
-                size_bytes=int(_file_max_size_b),
-                backup_count=_file_backup_count,
-                encoding=_file_encoding,
-                filter=filters,
+                level=_ring.level,
+                filter=FilterRegistry.create_filter("strip_markup"),
+            )
+
+        # Logger-level filters
+        # Run once per record before any handler or the async queue
+        logger_filters = []
+        _filters = config.filters
+        if _filters.enabled and (_filters.sample_rates or _filters.dedup_window):
+            # Before throttling, so dropped samples don't use up its tokens
+            logger_filters.append(
+                FilterRegistry.create_filter(
+                    "sample",
+                    service_name=_service_name,
+                    sample_rates=_filters.sample_rates,
+                    dedup_window=_filters.dedup_window,
+                )
+            )
+        if config.filters.enabled:
+            logger_filters.append(
+                FilterRegistry.create_filter(
+                    "throttle",
+                    service_name=_service_name,
+                    rate_limit=config.filters.rate_limit,
+                    include_patterns=config.filters.include_patterns,
+                    exclude_patterns=config.filters.exclude_patterns,
+                    summary_interval=config.filters.summary_interval,
+                )
+            )
+        if config.security.enabled and config.security.sanitize_sensitive_data:
+            logger_filters.append(
+                FilterRegistry.create_filter(
+                    "redact", secret_env_vars=config.security.secret_env_vars
+                )
+            )
+
+        logger_filters.append(
+            FilterRegistry.create_filter("service", service_name=_service_name)
+        )
+        _native = _async.enabled and _async.native
+        if _native:
+            # Read from the emitting task's context, before the queue
+            logger_filters.append(FilterRegistry.create_filter("context"))
+
+        # Queue handler
+        # The listener owns the console and file handlers, so emitting only
+        # costs the caller one enqueue
+        queue_handler = None
+        listener = None
+        if _worker:
+            queue_handler = get_process_queue_handler(
+                self.worker_queue,
+                worker_id=self.worker_id,  # type: ignore[arg-type]
+                level=min(
+                    level
+                    for enabled, level in (
+                        (_console.enabled, _console_level),
+                        (_file.enabled, _file_level),
+                    )
+                    if enabled
+                ),
+            )
+        elif _native and (console_handler or file_handler):
+            queue_handler, listener = get_nonblocking_queue_handler(
+                handlers=[_h for _h in (console_handler, file_handler) if _h],
+                queue_size=_async.queue_size,
+                timeout=_async.timeout,
+            )
+        elif _async.enabled and (console_handler or file_handler):
+            queue_handler, listener = get_queue_handler(
+                handlers=[_h for _h in (console_handler, file_handler) if _h],
+                queue_size=_async.queue_size,
+                timeout=_async.timeout,
+                overflow=_async.overflow,
             )
 
-        return _ServiceLogger(
+        logger_cls = _AsyncServiceLogger if _native else _ServiceLogger
+        return logger_cls(
             name=_service_name,
             console_handler=console_handler,
             file_handler=file_handler,
+            queue_handler=queue_handler,
+            listener=listener,
+            ring_handler=ring_handler,
+            filters=logger_filters,
             on_close_callback=on_close_callback,
         )
@@ -1,13 +1,28 @@
 import logging
+import queue
+import sys
 from collections.abc import Callable
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Literal, Optional, Tuple
 
 from rich.logging import RichHandler
 
 from ....shared.logger.log_levels import LogLevel
 from ..filters import Filter
-from ..handlers import RichHandlerCfg, RotatingFileHandler
+from ..handlers import (
+    BackgroundRotatingFileHandler,
+    BinaryLogHandler,
+    BoundedQueueHandler,
+    BoundedQueueListener,
+    BufferedConsoleHandler,
+    NonBlockingQueueHandler,
+    Compression,
+    OverflowPolicy,
+    ProcessQueueHandler,
+    RichHandlerCfg,
+    RingBufferHandler,
+    RotateWhen,
+)
 
 # -----------------------------------------------------------------------------
 #   Public functions
@@ -23,16 +38,24 @@ def get_file_handler(
     encoding: str,
     *,
     filter: Optional[Filter | List[Filter]] = None,
+    rotation: Literal["size", "time"] = "size",
+    when: RotateWhen = "midnight",
+    interval: int = 1,
+    compression: Compression = "gzip",
 ) -> logging.Handler:
 
     level = level.to_value() if isinstance(level, LogLevel) else level
 
-    handler = RotatingFileHandler(
+    handler = BackgroundRotatingFileHandler(
         filename=filename,
         mode="a",
-        maxBytes=size_bytes,
-        backupCount=backup_count,
+        max_bytes=size_bytes,
+        backup_count=backup_count,
         encoding=encoding,
+        rotation=rotation,
+        when=when,
+        interval=interval,
+        compression=compression,
     )
     handler.setLevel(level)
     handler.setFormatter(fmt)
@@ -54,17 +77,149 @@ def get_console_handler(
     level: LogLevel | int,
     *,
     filter: Optional[Filter | List[Filter]] = None,
+    mode: Literal["rich", "plain"] = "rich",
+    flush_interval: float = 1.0,
 ) -> logging.Handler:
 
     level = level.to_value() if isinstance(level, LogLevel) else level
-    handler = RichHandler(
-        console=RichHandlerCfg.console.value,
-        show_time=RichHandlerCfg.show_time.value,
-        show_level=RichHandlerCfg.show_level.value,
-        show_path=RichHandlerCfg.show_path.value,
-        markup=RichHandlerCfg.markup.value,
-        rich_tracebacks=RichHandlerCfg.rich_tracebacks.value,
+    handler: logging.Handler
+    if mode == "plain":
+        handler = BufferedConsoleHandler(flush_interval=flush_interval)
+    else:
+        handler = RichHandler(
+            console=RichHandlerCfg.console.value,
+            show_time=RichHandlerCfg.show_time.value,
+            show_level=RichHandlerCfg.show_level.value,
+            show_path=RichHandlerCfg.show_path.value,
+            markup=RichHandlerCfg.markup.value,
+            rich_tracebacks=RichHandlerCfg.rich_tracebacks.value,
+        )
+    handler.setLevel(level)
+    handler.setFormatter(fmt)
+
+    if filter is None:
+        filters: List[Filter] = []
+    elif isinstance(filter, List):
+        filters = filter
+    else:
+        filters = [filter]
+    for _filter in filters:
+        handler.addFilter(_filter)
+
+    return handler
+
+
+def get_queue_handler(
+    handlers: List[logging.Handler],
+    queue_size: int,
+    timeout: float,
+    *,
+    overflow: OverflowPolicy = "drop",
+) -> Tuple[logging.Handler, BoundedQueueListener]:
+    """Wrap handlers behind a bounded queue and a background listener.
+
+    Args:
+        handlers (List[Handler]): Handlers the listener thread will own
+        queue_size (int): Max records waiting in the queue
+        timeout (float): Seconds to wait for a slot (`block` policy) and to
+            drain the queue on shutdown
+        overflow (OverflowPolicy): `drop` or `block` when the queue is full
+
+    Returns:
+        The queue handler to attach to the logger, and its (not yet started)
+        listener.
+    """
+
+    log_queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(
+        maxsize=queue_size
     )
+    handler = BoundedQueueHandler(log_queue, overflow=overflow, timeout=timeout)
+    # Cheap pre-filter, the listener still respects each handler's level
+    handler.setLevel(min(_handler.level for _handler in handlers))
+
+    listener = BoundedQueueListener(log_queue, *handlers, timeout=timeout)
+    return handler, listener
+
+
+def get_nonblocking_queue_handler(
+    handlers: List[logging.Handler],
+    queue_size: int,
+    timeout: float,
+) -> Tuple[logging.Handler, BoundedQueueListener]:
+    """Like `get_queue_handler`, but never blocks the caller.
+
+    Returns:
+        The queue handler to attach to the logger, and its (not yet started)
+        listener.
+    """
+
+    log_queue: "queue.SimpleQueue[Optional[logging.LogRecord]]" = queue.SimpleQueue()
+    handler = NonBlockingQueueHandler(log_queue, queue_size=queue_size)
+    handler.setLevel(min(_handler.level for _handler in handlers))
+
+    listener = BoundedQueueListener(log_queue, *handlers, timeout=timeout)
+    return handler, listener
+
+
+def get_process_queue_handler(
+    log_queue: Any,
+    worker_id: int | str,
+    level: LogLevel | int,
+) -> logging.Handler:
+    """Ship records to the aggregator process through its queue."""
+
+    level = level.to_value() if isinstance(level, LogLevel) else level
+
+    handler = ProcessQueueHandler(log_queue, worker_id=worker_id)
+    handler.setLevel(level)
+    return handler
+
+
+def get_binary_file_handler(
+    filename: Path | str,
+    level: LogLevel | int,
+    size_bytes: int,
+    backup_count: int,
+    *,
+    append: bool = True,
+    filter: Optional[Filter | List[Filter]] = None,
+) -> BinaryLogHandler:
+    """Write indexed binary records, see `BinaryLogReader` to query them."""
+
+    level = level.to_value() if isinstance(level, LogLevel) else level
+
+    handler = BinaryLogHandler(
+        filename,
+        append=append,
+        max_bytes=size_bytes,
+        backup_count=backup_count,
+    )
+    handler.setLevel(level)
+
+    if filter is None:
+        filters: List[Filter] = []
+    elif isinstance(filter, List):
+        filters = filter
+    else:
+        filters = [filter]
+    for _filter in filters:
+        handler.addFilter(_filter)
+
+    return handler
+
+
+def get_ring_handler(
+    capacity: int,
+    fmt: logging.Formatter,
+    level: LogLevel | int,
+    *,
+    filter: Optional[Filter | List[Filter]] = None,
+) -> RingBufferHandler:
+    """Keep the last `capacity` records in memory for crash dumps."""
+
+    level = level.to_value() if isinstance(level, LogLevel) else level
+
+    handler = RingBufferHandler(capacity)
     handler.setLevel(level)
     handler.setFormatter(fmt)
 
@@ -78,3 +233,14 @@ def get_console_handler(
         handler.addFilter(_filter)
 
     return handler
+
+
+def resolve_console_mode(
+    mode: Literal["auto", "rich", "plain"],
+) -> Literal["rich", "plain"]:
+    """Resolve `auto` to `rich` on a terminal and to `plain` when piped."""
+
+    if mode != "auto":
+        return mode
+    isatty = getattr(sys.stdout, "isatty", None)
+    return "rich" if isatty and isatty() else "plain"
@@ -0,0 +1,117 @@
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+
+@dataclass
+class _PoolEntry:
+    handler: logging.Handler
+    refs: int = 0
+
+
+class _PooledFileHandler(logging.Handler):
+    """A service's view of a file handler shared through the pool.
+
+    Carries the service's own level and forwards records to the shared
+    handler, which owns the file descriptor, formatter and rotation.
+    Closing it releases the shared handler instead of closing it.
+    """
+
+    def __init__(
+        self,
+        key: Path,
+        shared: logging.Handler,
+        pool: "_FileHandlerPool",
+        level: int,
+    ):
+        super().__init__(level)
+        self.key = key
+        self.shared = shared
+        self._pool = pool
+        self._released = False
+
+    def handle(self, record: logging.LogRecord):
+        # The shared handler takes its own lock, don't take ours too
+        rv = self.filter(record)
+        if rv:
+            self.shared.handle(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.shared.handle(record)
+
+    def flush(self) -> None:
+        self.shared.flush()
+
+    def close(self) -> None:
+        if not self._released:
+            self._released = True
+            self._pool.release(self.key)
+        super().close()
+
+
+class _FileHandlerPool:
+    """Reference-counted file handlers keyed by resolved log path.
+
+    Services writing to the same file share one handler, so they share one
+    file descriptor and one rotation instead of racing on it.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, _PoolEntry] = {}
+        self._lock = Lock()
+
+    def acquire(
+        self,
+        path: Path | str,
+        level: int,
+        create: Callable[[], logging.Handler],
+    ) -> logging.Handler:
+        """Get a per-service handler for a log file.
+
+        Args:
+            path (Path | str): Path of the log file
+            level (int): The service's level for this file
+            create (Callable): Builds the shared handler, only called if the
+                file is not open yet
+
+        Returns:
+            A handler to attach to the service's logger.
+        """
+
+        key = Path(path).resolve()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _PoolEntry(handler=create())
+                self._entries[key] = entry
+            entry.refs += 1
+            return _PooledFileHandler(key, entry.handler, self, level)
+
+    def release(self, key: Path) -> None:
+        """Drop a reference, closing the shared handler on the last one."""
+
+        handler: Optional[logging.Handler] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0:
+                handler = self._entries.pop(key).handler
+
+        # Closing may wait on background rotation, do it outside the lock
+        if handler:
+            handler.close()
+
+    def is_open(self, path: Path | str) -> bool:
+        """Check if a log file already has a shared handler."""
+
+        return Path(path).resolve() in self._entries
+
+
+# Global pool instance
+file_handler_pool = _FileHandlerPool()
@@ -0,0 +1,142 @@
+from collections.abc import Callable, Mapping
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from ....core.protocols.infrastructure.logger import ServiceLoggerProtocol
+
+
+class _LoggerRegistry:
+    """Copy-on-write registry of active service loggers.
+
+    Reads go to an immutable snapshot and never take a lock. Writers copy
+    the map under a lock and publish the new snapshot with one reference
+    assignment, which is atomic, so a reader sees either the old or the new
+    map, never a half-updated one.
+
+    Closed loggers are evicted when they are looked up.
+    """
+
+    def __init__(self):
+        self._snapshot: Mapping[str, ServiceLoggerProtocol] = MappingProxyType({})
+        self._write_lock = Lock()
+
+    # -------------------------------------------------------------------------
+    #   Read methods
+    #   Lock-free
+    # -------------------------------------------------------------------------
+
+    def get(self, name: str) -> Optional[ServiceLoggerProtocol]:
+        """Get an open logger, or None."""
+
+        logger = self._snapshot.get(name)
+        if logger is not None and logger.closed:
+            self.remove(name, logger)
+            return None
+        return logger
+
+    def snapshot(self) -> Mapping[str, ServiceLoggerProtocol]:
+        """Get a read-only view of the registry, unaffected by later updates."""
+
+        return self._snapshot
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    # -------------------------------------------------------------------------
+    #   Write methods
+    #   Copy-on-write under the write lock
+    # -------------------------------------------------------------------------
+
+    def get_or_create(
+        self,
+        name: str,
+        create: Callable[[], ServiceLoggerProtocol],
+    ) -> Tuple[ServiceLoggerProtocol, bool]:
+        """Get the open logger, or create and register it.
+
+        Args:
+            name (str): Service name
+            create (Callable): Builds the logger, called at most once per
+                concurrent race
+
+        Returns:
+            The logger, and whether it was created by this call.
+        """
+
+        logger = self.get(name)
+        if logger is not None:
+            return logger, False
+
+        with self._write_lock:
+            logger = self._snapshot.get(name)
+            if logger is not None and not logger.closed:
+                return logger, False
+
+            logger = create()
+            self._publish({**self._snapshot, name: logger})
+            return logger, True
+
+    def add(self, name: str, logger: ServiceLoggerProtocol) -> bool:
+        """Register a logger unless an open one has the name.
+
+        Returns:
+            Whether it was registered.
+        """
+
+        with self._write_lock:
+            current = self._snapshot.get(name)
+            if current is not None and not current.closed:
+                return False
+            self._publish({**self._snapshot, name: logger})
+            return True
+
+    def replace(self, name: str, logger: ServiceLoggerProtocol) -> None:
+        """Register a logger, replacing any with the name."""
+
+        with self._write_lock:
+            self._publish({**self._snapshot, name: logger})
+
+    def remove(
+        self,
+        name: str,
+        logger: Optional[ServiceLoggerProtocol] = None,
+    ) -> bool:
+        """Unregister a logger.
+
+        Args:
+            name (str): Service name
+            logger (ServiceLoggerProtocol): Only remove if this is the
+                registered logger, so a newer logger of the same name stays
+
+        Returns:
+            Whether a logger was removed.
+        """
+
+        with self._write_lock:
+            current = self._snapshot.get(name)
+            if current is None or (logger is not None and current is not logger):
+                return False
+            updated: Dict[str, ServiceLoggerProtocol] = dict(self._snapshot)
+            del updated[name]
+            self._publish(updated)
+            return True
+
+    def clear(self) -> List[ServiceLoggerProtocol]:
+        """Unregister every logger.
+
+        Returns:
+            The loggers that were registered.
+        """
+
+        with self._write_lock:
+            loggers = list(self._snapshot.values())
+            self._publish({})
+            return loggers
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _publish(self, loggers: Dict[str, ServiceLoggerProtocol]) -> None:
+        self._snapshot = MappingProxyType(loggers)
@@ -0,0 +1,6 @@
+from .server import MetricsServer, start_metrics_server
+
+__all__ = [
+    "MetricsServer",
+    "start_metrics_server",
+]
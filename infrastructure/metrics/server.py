@@ -0,0 +1,89 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from ...shared.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    metrics_registry,
+    render_prometheus,
+)
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving the registry in Prometheus text format.
+
+    Serves `GET /metrics` from a daemon thread. Binds to localhost by
+    default, the metrics are not meant to leave the host unscraped.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        registry: MetricsRegistry = metrics_registry,
+    ):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        if self._server is not None:
+            return self
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = render_prometheus(
+                    registry.metrics(), registry.snapshot()
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args):
+                # Scrapes would flood the console
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Port 0 picks a free one
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="metrics-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+
+def start_metrics_server(
+    host: str = "127.0.0.1",
+    port: int = 9464,
+    registry: MetricsRegistry = metrics_registry,
+) -> MetricsServer:
+    """Start serving `GET /metrics` in the background."""
+
+    return MetricsServer(host, port, registry).start()
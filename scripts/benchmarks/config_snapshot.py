@@ -0,0 +1,150 @@
+"""Config Snapshot Startup Benchmark
+
+Measures the time to load every config at startup through
+`_ConfigBuilderFactory.load_config`, with and without config snapshots.
+
+Cases:
+    - No snapshots: detect, parse and validate every file
+    - Cold: snapshots enabled, none written yet (loaded, then flushed)
+    - Warm: snapshots enabled and up to date (read from the snapshot file)
+
+Each run starts as a fresh process would: the loaded config cache, the
+snapshot cache and the schema fingerprints are dropped first.
+
+Usage:
+    python3 -m Sena.scripts.benchmarks.config_snapshot [--configs N]
+"""
+
+import argparse
+import json
+import shutil
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import List
+
+import yaml
+
+from ...config.paths import PROJECT_ROOT
+from ...infrastructure.config.services import snapshot
+from ...infrastructure.config.services.cache import loaded_config_cache
+from ...infrastructure.config.services.factory import _ConfigBuilderFactory
+from ...infrastructure.logger import LoggerManager
+from ...shared.logger import LogLevel
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+CONFIGS = 20
+REPEATS = 5
+
+# Under the project root, the config loader logs paths relative to it
+WORK_DIR = Path(f"{PROJECT_ROOT}/data/benchmarks/config_snapshot/")
+
+# -----------------------------------------------------------------------------
+#   Helper functions
+# -----------------------------------------------------------------------------
+
+
+def write_configs(count: int) -> List[Path]:
+    """Write logger configs, alternating YAML and JSON."""
+
+    paths: List[Path] = []
+    for i in range(count):
+        config = {
+            "name": f"bench-{i}",
+            "path": str(WORK_DIR),
+            "console": {"enabled": True, "level": "INFO"},
+            "file": {
+                "enabled": True,
+                "output_to": str(WORK_DIR / "logs"),
+                "output_name": f"bench-{i}",
+                "level": "DEBUG",
+            },
+            "filters": {
+                "enabled": True,
+                "rate_limit": 100,
+                "exclude_patterns": ["heartbeat", "^ping"],
+                "sample_rates": {"debug": 0.1},
+            },
+        }
+        if i % 2:
+            path = WORK_DIR / f"logger-{i}.json"
+            path.write_text(json.dumps(config, indent=2))
+        else:
+            path = WORK_DIR / f"logger-{i}.yaml"
+            path.write_text(yaml.safe_dump(config))
+        paths.append(path)
+    return paths
+
+
+def fresh_start(snapshot_path: Path | None):
+    """Drop every in-process cache, as a new process would start."""
+
+    loaded_config_cache.invalidate()
+    snapshot._fingerprints.clear()
+    _ConfigBuilderFactory.enable_snapshots(snapshot_path)
+
+
+def measure(paths: List[Path], setup: Callable[[], None]) -> float:
+    """Best milliseconds to load every config over `REPEATS` runs."""
+
+    factory = _ConfigBuilderFactory()
+    best = float("inf")
+    for _ in range(REPEATS):
+        setup()
+        start = time.perf_counter()
+        for path in paths:
+            factory.load_config("logger", path)
+        # Part of a cold start, written once every config is loaded
+        if factory._snapshot_cache:
+            factory._snapshot_cache.flush()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """Run every case and print the startup time of each."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", type=int, default=CONFIGS)
+    args = parser.parse_args()
+
+    # The loader logs every detected file
+    LoggerManager().system_logger.set_levels(console_level=LogLevel.WARNING)
+
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+    WORK_DIR.mkdir(parents=True)
+    snapshot_path = WORK_DIR / "config_snapshot.bin"
+    try:
+        paths = write_configs(args.configs)
+
+        def cold():
+            snapshot_path.unlink(missing_ok=True)
+            fresh_start(snapshot_path)
+
+        baseline = measure(paths, lambda: fresh_start(None))
+        cold_ms = measure(paths, cold)
+        warm_ms = measure(paths, lambda: fresh_start(snapshot_path))
+    finally:
+        _ConfigBuilderFactory.enable_snapshots(None)
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    print(f"{args.configs} configs")
+    print(f"{'case':<16}{'ms':>10}{'speedup':>10}")
+    for name, elapsed in (
+        ("no snapshots", baseline),
+        ("cold", cold_ms),
+        ("warm", warm_ms),
+    ):
+        print(f"{name:<16}{elapsed:>10.2f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
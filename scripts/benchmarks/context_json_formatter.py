@@ -0,0 +1,129 @@
+"""Context JSON Formatter Benchmark
+
+Measures records/second of `ContextJSONFormatter.format` against the
+previous implementation, which rebuilt the standard attribute set with
+`makeLogRecord({})` on every record.
+
+Cases:
+    - Records without context kwargs
+    - Records with context kwargs, indented (default) and compact mode
+
+Usage:
+    python3 -m Sena.scripts.benchmarks.context_json_formatter
+"""
+
+import json
+import time
+from logging import INFO, Formatter, LogRecord, makeLogRecord
+from typing import Any, Dict, List, Tuple
+
+from ...infrastructure.config.models.logger_config import FileConfig
+from ...infrastructure.logger.formatters.formatters import ContextJSONFormatter
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+RECORDS = 50_000
+REPEATS = 5
+
+FMT = FileConfig.model_fields["fmt"].default
+DATEFMT = FileConfig.model_fields["datefmt"].default
+
+CONTEXT = {
+    "guild_id": 123456789012345678,
+    "channel_id": 987654321098765432,
+    "user": "amjko",
+    "latency_ms": 41.7,
+}
+
+# -----------------------------------------------------------------------------
+#   Baseline
+# -----------------------------------------------------------------------------
+
+
+class _LegacyContextJSONFormatter(Formatter):
+    """The formatter as it was before precomputing the excluded keys."""
+
+    def format(self, record: LogRecord) -> str:
+        standard_attrs = set(makeLogRecord({}).__dict__.keys())
+        redundant_keys = {"contextStr", "message", "asctime", "service"}
+        excluded_keys = standard_attrs | redundant_keys
+        context = {k: v for k, v in record.__dict__.items() if k not in excluded_keys}
+        record.contextStr = f":\n{json.dumps(context, indent=4)}" if context else ""
+        return super().format(record)
+
+
+# -----------------------------------------------------------------------------
+#   Helper functions
+# -----------------------------------------------------------------------------
+
+
+def make_records(count: int, context: Dict[str, Any]) -> List[LogRecord]:
+    """Build records the way `logging.Logger.makeRecord` would."""
+
+    records = []
+    for i in range(count):
+        record = LogRecord(
+            "sena.bench", INFO, __file__, i, "Handled message", None, None, "bench"
+        )
+        record.__dict__.update(context)
+        records.append(record)
+    return records
+
+
+def measure(formatter: Formatter, context: Dict[str, Any]) -> float:
+    """Best records/second over `REPEATS` runs."""
+
+    best = 0.0
+    for _ in range(REPEATS):
+        records = make_records(RECORDS, context)
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        elapsed = time.perf_counter() - start
+        best = max(best, RECORDS / elapsed)
+    return best
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """Run every case and print records/second before and after."""
+
+    cases: List[Tuple[str, Dict[str, Any], Formatter, Formatter]] = [
+        (
+            "no context",
+            {},
+            _LegacyContextJSONFormatter(fmt=FMT, datefmt=DATEFMT),
+            ContextJSONFormatter(fmt=FMT, datefmt=DATEFMT),
+        ),
+        (
+            "context, indented",
+            CONTEXT,
+            _LegacyContextJSONFormatter(fmt=FMT, datefmt=DATEFMT),
+            ContextJSONFormatter(fmt=FMT, datefmt=DATEFMT),
+        ),
+        (
+            "context, compact",
+            CONTEXT,
+            _LegacyContextJSONFormatter(fmt=FMT, datefmt=DATEFMT),
+            ContextJSONFormatter(fmt=FMT, datefmt=DATEFMT, compact=True),
+        ),
+    ]
+
+    print(f"{'case':<20}{'before (rec/s)':>18}{'after (rec/s)':>18}{'speedup':>10}")
+    for name, context, before, after in cases:
+        before_rate = measure(before, context)
+        after_rate = measure(after, context)
+        print(
+            f"{name:<20}{before_rate:>18,.0f}{after_rate:>18,.0f}"
+            f"{after_rate / before_rate:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
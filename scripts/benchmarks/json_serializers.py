@@ -0,0 +1,107 @@
+"""JSON Serializer Benchmark
+
+Measures records/second of `JSONFormatter` and compact `ContextJSONFormatter`
+for every installed serializer backend, against the previous stdlib
+`json.dumps` + `datetime.isoformat` implementation.
+
+Usage:
+    python3 -m Sena.scripts.benchmarks.json_serializers
+"""
+
+import json
+import time
+from datetime import datetime
+from logging import Formatter, LogRecord
+from typing import List, Tuple
+
+from ...infrastructure.config.models.logger_config import FileConfig
+from ...infrastructure.logger.formatters import SerializerRegistry
+from ...infrastructure.logger.formatters.formatters import (
+    ContextJSONFormatter,
+    JSONFormatter,
+)
+from .context_json_formatter import CONTEXT, REPEATS, make_records
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+RECORDS = 50_000
+
+FMT = FileConfig.model_fields["fmt"].default
+DATEFMT = FileConfig.model_fields["datefmt"].default
+
+# -----------------------------------------------------------------------------
+#   Baseline
+# -----------------------------------------------------------------------------
+
+
+class _LegacyJSONFormatter(Formatter):
+    """`JSONFormatter` as it was before the serializer abstraction."""
+
+    def format(self, record: LogRecord) -> str:
+        log_entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "service": getattr(record, "service", "unknown"),
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        log_entry.update(getattr(record, "extra_data", {}))
+        return json.dumps(log_entry, default=str)
+
+
+# -----------------------------------------------------------------------------
+#   Helper functions
+# -----------------------------------------------------------------------------
+
+
+def measure(formatter: Formatter) -> float:
+    """Best records/second over `REPEATS` runs."""
+
+    best = 0.0
+    for _ in range(REPEATS):
+        records = make_records(RECORDS, CONTEXT)
+        for record in records:
+            record.extra_data = CONTEXT
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        elapsed = time.perf_counter() - start
+        best = max(best, RECORDS / elapsed)
+    return best
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """Run every backend and print records/second."""
+
+    cases: List[Tuple[str, Formatter]] = [
+        ("json, legacy", _LegacyJSONFormatter()),
+    ]
+    for backend in SerializerRegistry.get_available():
+        serializer = SerializerRegistry.create_serializer(backend)
+        cases.append((f"json, {backend}", JSONFormatter(serializer=serializer)))
+        cases.append(
+            (
+                f"context, {backend}",
+                ContextJSONFormatter(
+                    fmt=FMT, datefmt=DATEFMT, compact=True, serializer=serializer
+                ),
+            )
+        )
+
+    print(f"{'case':<24}{'rec/s':>14}")
+    for name, formatter in cases:
+        print(f"{name:<24}{measure(formatter):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
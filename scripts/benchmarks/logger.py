@@ -0,0 +1,397 @@
+"""Logger Throughput Benchmark Suite
+
+Measures the full path of a log call, from `_ServiceLogger.info` through
+the logger filters and formatter to the handler, for loggers created by
+`LoggerManager.create_logger`.
+
+Cases:
+    - Console (plain, to /dev/null) vs file
+    - Context-JSON (indented and compact) vs JSON file formatters
+    - Emitted vs filtered (below the handlers' level) calls
+    - With and without context kwargs
+    - Async (queued) file logger
+    - Multithreaded emitting to one logger, looking loggers up, and
+      creating/closing loggers
+
+Metrics:
+    - rec/s: records (or operations) per second
+    - p50/p99: latency of a single call, in microseconds
+    - B/rec: bytes allocated per call, by `tracemalloc` peak
+
+Baselines:
+    Results are saved per case to `BASELINE_PATH` with `--save`. Later runs
+    compare against it and exit with 1 if a case's rec/s dropped or its p99
+    rose by more than `--threshold`.
+
+Usage:
+    python3 -m Sena.scripts.benchmarks.logger [--records N] [--save]
+        [--baseline PATH] [--threshold 0.15]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...config.paths import PROJECT_ROOT
+from ...infrastructure.config.models.logger_config import LoggerConfig
+from ...infrastructure.logger import LoggerManager
+from ...infrastructure.logger.formatters.formatters import JSONFormatter
+from .context_json_formatter import CONTEXT
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+RECORDS = 20_000
+WARMUP = 1_000
+ALLOC_SAMPLES = 1_000
+THREADS = 8
+
+THRESHOLD = 0.15
+BASELINE_PATH = Path(f"{PROJECT_ROOT}/data/benchmarks/logger_baseline.json")
+
+DEFAULT_ENCODING = "utf-8"
+
+# -----------------------------------------------------------------------------
+#   Results
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class Result:
+    records_per_s: float
+    p50_us: float
+    p99_us: float
+    alloc_bytes: float
+
+
+# -----------------------------------------------------------------------------
+#   Measuring
+# -----------------------------------------------------------------------------
+
+
+def measure(
+    call: Callable[[], Any],
+    records: int,
+    threads: int = 1,
+) -> Result:
+    """Measure one call repeated `records` times, split over `threads`.
+
+    Throughput and latency are measured in separate runs, so the timer
+    calls don't count against throughput.
+    """
+
+    for _ in range(WARMUP):
+        call()
+
+    per_thread = records // threads
+
+    def run_throughput():
+        for _ in range(per_thread):
+            call()
+
+    samples: List[List[int]] = [[] for _ in range(threads)]
+
+    def run_latency(index: int):
+        clock = time.perf_counter_ns
+        out = samples[index]
+        for _ in range(per_thread):
+            start = clock()
+            call()
+            out.append(clock() - start)
+
+    elapsed = _run_threads(lambda _: run_throughput(), threads)
+    _run_threads(run_latency, threads)
+
+    latencies = sorted(ns for thread_samples in samples for ns in thread_samples)
+    return Result(
+        records_per_s=(per_thread * threads) / elapsed,
+        p50_us=latencies[len(latencies) // 2] / 1000,
+        p99_us=latencies[int(len(latencies) * 0.99)] / 1000,
+        alloc_bytes=_measure_allocations(call),
+    )
+
+
+def _run_threads(target: Callable[[int], Any], threads: int) -> float:
+    """Run `target` on `threads` threads at once, returning wall seconds."""
+
+    if threads == 1:
+        start = time.perf_counter()
+        target(0)
+        return time.perf_counter() - start
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        barrier.wait()
+        target(index)
+
+    workers = [
+        threading.Thread(target=worker, args=(index,)) for index in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _measure_allocations(call: Callable[[], Any]) -> float:
+    """Mean bytes allocated by one call."""
+
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(ALLOC_SAMPLES):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            total += max(0, peak - before)
+    finally:
+        tracemalloc.stop()
+    return total / ALLOC_SAMPLES
+
+
+# -----------------------------------------------------------------------------
+#   Cases
+# -----------------------------------------------------------------------------
+
+
+class Suite:
+    """Creates the benchmarked loggers, all writing under a temp directory."""
+
+    def __init__(self, output_to: Path):
+        self.manager = LoggerManager()
+        self.output_to = output_to
+        self.devnull = open(os.devnull, "w", encoding=DEFAULT_ENCODING)
+        self.loggers: List[Any] = []
+        self._count = 0
+
+    def create(
+        self,
+        *,
+        console: bool = False,
+        file: bool = True,
+        level: str = "INFO",
+        compact: bool = False,
+        json: bool = False,
+        async_: bool = False,
+    ) -> Any:
+        self._count += 1
+        name = f"bench_{self._count}"
+        config = LoggerConfig(
+            name=name,
+            path=self.output_to,
+            console={"enabled": console, "level": level, "mode": "plain"},
+            file={
+                "enabled": file,
+                "output_to": self.output_to,
+                "output_name": name,
+                "level": level,
+                "compact_context": compact,
+                "max_size_mb": 99,
+                "backup_count": 0,
+            },
+            **{"async": {"enabled": async_, "queue_size": 100_000}},
+        )
+        logger = self.manager.create_logger(config)
+        if console:
+            logger.console_handler.setStream(self.devnull)
+        if json:
+            logger.file_handler.shared.setFormatter(JSONFormatter())
+
+        self.loggers.append(logger)
+        return logger
+
+    def cases(self) -> Dict[str, Callable[[int], Result]]:
+        """Map of case name to a function running it for N records."""
+
+        def emit(logger: Any, context: bool) -> Callable[[], Any]:
+            if context:
+                return lambda: logger.info("Handled message", **CONTEXT)
+            return lambda: logger.info("Handled message")
+
+        file = self.create()
+        file_compact = self.create(compact=True)
+        file_json = self.create(json=True)
+        file_async = self.create(async_=True)
+        console = self.create(console=True, file=False)
+        shared = self.create()
+
+        return {
+            "file, context-json": lambda n: measure(emit(file, False), n),
+            "file, context-json, ctx": lambda n: measure(emit(file, True), n),
+            "file, compact, ctx": lambda n: measure(emit(file_compact, True), n),
+            "file, json, ctx": lambda n: measure(emit(file_json, True), n),
+            "file, async, ctx": lambda n: measure(emit(file_async, True), n),
+            "file, filtered": lambda n: measure(
+                lambda: file.debug("Handled message", **CONTEXT), n
+            ),
+            "console, plain": lambda n: measure(emit(console, False), n),
+            "console, plain, ctx": lambda n: measure(emit(console, True), n),
+            "console, filtered": lambda n: measure(
+                lambda: console.debug("Handled message", **CONTEXT), n
+            ),
+            f"file, {THREADS} threads": lambda n: measure(
+                emit(shared, True), n, THREADS
+            ),
+            f"manager, get_logger, {THREADS} threads": lambda n: measure(
+                lambda: self.manager.get_logger(file.name), n, THREADS
+            ),
+            "manager, create+close": lambda n: measure(self._create_and_close, n // 20),
+            f"manager, create+close, {THREADS} threads": lambda n: measure(
+                self._create_and_close, n // 20, THREADS
+            ),
+        }
+
+    def close(self):
+        for logger in self.loggers:
+            logger.close()
+        self.devnull.close()
+
+    def _create_and_close(self):
+        """One round trip through `LoggerManager._lock`, twice."""
+
+        name = f"bench_tmp_{threading.get_ident()}_{time.perf_counter_ns()}"
+        config = LoggerConfig(
+            name=name,
+            path=self.output_to,
+            console={"enabled": False},
+            file={
+                "enabled": True,
+                # Shares the pooled handler of the first logger
+                "output_to": self.output_to,
+                "output_name": "bench_1",
+                "append": True,
+            },
+        )
+        self.manager.create_logger(config).close()
+
+
+# -----------------------------------------------------------------------------
+#   Baselines
+# -----------------------------------------------------------------------------
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding=DEFAULT_ENCODING) as file:
+        return json.load(file).get("cases", {})
+
+
+def save_baseline(path: Path, results: Dict[str, Result]):
+    """Save results, keeping baselines of cases that were not run."""
+
+    cases = load_baseline(path)
+    cases.update({name: asdict(result) for name, result in results.items()})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "python": sys.version.split()[0],
+        "machine": platform.platform(),
+        "cases": cases,
+    }
+    with open(path, "w", encoding=DEFAULT_ENCODING) as file:
+        json.dump(data, file, indent=4)
+
+
+def compare(
+    result: Result,
+    baseline: Optional[Dict[str, float]],
+    threshold: float,
+) -> Optional[str]:
+    """Describe a regression against the baseline, if any."""
+
+    if not baseline:
+        return None
+
+    problems = []
+    rate = result.records_per_s / baseline["records_per_s"] - 1
+    if rate < -threshold:
+        problems.append(f"rec/s {rate:+.0%}")
+    p99 = result.p99_us / baseline["p99_us"] - 1
+    if p99 > threshold:
+        problems.append(f"p99 {p99:+.0%}")
+    return ", ".join(problems) or None
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=RECORDS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument(
+        "--save", action="store_true", help="Save the results as the baseline"
+    )
+    parser.add_argument(
+        "--case", action="append", help="Only run cases containing this text"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Run every case, print the results and flag regressions."""
+
+    args = parse_args()
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, Result] = {}
+    regressions = 0
+
+    print(
+        f"{'case':<36}{'rec/s':>12}{'p50 us':>10}{'p99 us':>10}{'B/rec':>10}"
+        "  vs baseline"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = Suite(Path(tmp))
+        try:
+            for name, run in suite.cases().items():
+                if args.case and not any(text in name for text in args.case):
+                    continue
+
+                result = run(args.records)
+                results[name] = result
+                regression = compare(result, baseline.get(name), args.threshold)
+                if regression:
+                    regressions += 1
+                status = (
+                    f"REGRESSED ({regression})"
+                    if regression
+                    else ("ok" if name in baseline else "-")
+                )
+                print(
+                    f"{name:<36}{result.records_per_s:>12,.0f}"
+                    f"{result.p50_us:>10.1f}{result.p99_us:>10.1f}"
+                    f"{result.alloc_bytes:>10,.0f}  {status}"
+                )
+        finally:
+            suite.close()
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"{regressions} case(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
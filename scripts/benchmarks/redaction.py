@@ -0,0 +1,210 @@
+"""Redaction Filter Benchmark
+
+Measures records/second of `RedactFilter` against a naive filter that runs
+one `re.sub` per secret and token shape, and the throughput it costs a
+service logger writing to a file.
+
+Cases:
+    - Clean messages, and messages carrying a token in message and context
+    - Repeated (cacheable) strings, and unique strings that miss the cache
+    - Filter alone, and a full log call with and without `RedactFilter`
+      (`sanitize_sensitive_data` on and off), whose difference is the
+      overhead of redaction
+
+Usage:
+    python3 -m Sena.scripts.benchmarks.redaction
+"""
+
+import os
+import re
+import tempfile
+import time
+from logging import LogRecord
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+from ...infrastructure.config.models.logger_config import LoggerConfig, SecurityConfig
+from ...infrastructure.logger import LoggerManager
+from ...infrastructure.logger.filters.redaction import (
+    REDACTED,
+    TOKEN_PATTERNS,
+    RedactFilter,
+)
+from .context_json_formatter import CONTEXT, REPEATS, make_records
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+RECORDS = 50_000
+
+# Calls per logger turn, in the logger cases
+CHUNK = 500
+
+SECRETS = [f"secret-value-{i:02d}-xxxxxxxx" for i in range(16)]
+
+# As the factory would pass them; set to `SECRETS` for the logger cases
+ENV_VARS = SecurityConfig().secret_env_vars
+
+TOKEN = "sk-proj-abcdefghijklmnopqrstuvwxyz012345"
+
+# -----------------------------------------------------------------------------
+#   Baseline
+# -----------------------------------------------------------------------------
+
+
+class _NaiveRedactFilter:
+    """One pass per pattern, no cache."""
+
+    def __init__(self, secrets: List[str]):
+        self.patterns = [re.compile(re.escape(secret)) for secret in secrets]
+        self.patterns += [re.compile(pattern) for _, pattern in TOKEN_PATTERNS]
+
+    def __call__(self, record: LogRecord) -> bool:
+        record.msg = self.redact(record.msg)
+        for key, value in CONTEXT.items():
+            attr = getattr(record, key)
+            if isinstance(attr, str):
+                setattr(record, key, self.redact(attr))
+        return True
+
+    def redact(self, text: str) -> str:
+        for pattern in self.patterns:
+            text = pattern.sub(REDACTED, text)
+        return text
+
+
+# -----------------------------------------------------------------------------
+#   Helper functions
+# -----------------------------------------------------------------------------
+
+
+def build_records(secret: bool, unique: bool) -> List[LogRecord]:
+    records = make_records(RECORDS, CONTEXT)
+    for i, record in enumerate(records):
+        suffix = f" #{i}" if unique else ""
+        if secret:
+            record.msg = f"Authenticated with {TOKEN}{suffix}"
+            record.user = f"{SECRETS[i % len(SECRETS)]}{suffix}"
+        else:
+            record.msg = f"Handled message{suffix}"
+    return records
+
+
+def measure(filter: Callable[[LogRecord], bool], secret: bool, unique: bool) -> float:
+    """Best records/second over `REPEATS` runs."""
+
+    best = 0.0
+    for _ in range(REPEATS):
+        records = build_records(secret, unique)
+        start = time.perf_counter()
+        for record in records:
+            filter(record)
+        elapsed = time.perf_counter() - start
+        best = max(best, RECORDS / elapsed)
+    return best
+
+
+def create_logger(output_to: Path, name: str, redact: bool) -> Any:
+    """File logger, as the factory builds it, with only `RedactFilter`."""
+
+    config = LoggerConfig(
+        name=name,
+        path=output_to,
+        console={"enabled": False},
+        file={
+            "enabled": True,
+            "output_to": output_to,
+            "output_name": name,
+            "level": "INFO",
+            "max_size_mb": 99,
+            "backup_count": 0,
+        },
+        filters={"enabled": False},
+        security={"sanitize_sensitive_data": redact, "secret_env_vars": ENV_VARS},
+    )
+    return LoggerManager().create_logger(config)
+
+
+def measure_loggers(
+    plain: Any,
+    redacted: Any,
+    secret: bool,
+    unique: bool,
+) -> Tuple[float, float]:
+    """Records/second of full log calls, from the fastest of `REPEATS`
+    runs of every chunk.
+
+    The loggers take turns every `CHUNK` calls, so drift (e.g. CPU
+    frequency, file size) costs both alike.
+    """
+
+    calls = []
+    for i in range(RECORDS):
+        suffix = f" #{i}" if unique else ""
+        if secret:
+            context = {**CONTEXT, "user": f"{SECRETS[i % len(SECRETS)]}{suffix}"}
+            calls.append((f"Authenticated with {TOKEN}{suffix}", context))
+        else:
+            calls.append((f"Handled message{suffix}", CONTEXT))
+
+    # Fastest run of each chunk, so a slow moment costs one chunk's sample
+    chunks = [calls[i : i + CHUNK] for i in range(0, len(calls), CHUNK)]
+    best = [[float("inf")] * len(chunks) for _ in range(2)]
+    for _ in range(REPEATS):
+        for index, chunk in enumerate(chunks):
+            for i, logger in enumerate((plain, redacted)):
+                start = time.perf_counter()
+                for message, context in chunk:
+                    logger.info(message, **context)
+                elapsed = time.perf_counter() - start
+                best[i][index] = min(best[i][index], elapsed)
+    return RECORDS / sum(best[0]), RECORDS / sum(best[1])
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """Run every case and print records/second, and the logger overhead."""
+
+    cases: List[Tuple[str, bool, bool]] = [
+        ("clean, repeated", False, False),
+        ("clean, unique", False, True),
+        ("secret, repeated", True, False),
+        ("secret, unique", True, True),
+    ]
+
+    print(f"{'case':<20}{'naive rec/s':>16}{'filter rec/s':>16}{'speedup':>10}")
+    for name, secret, unique in cases:
+        naive = measure(_NaiveRedactFilter(SECRETS), secret, unique)
+        fast = measure(
+            RedactFilter(secrets=SECRETS, secret_env_vars=ENV_VARS), secret, unique
+        )
+        print(f"{name:<20}{naive:>16,.0f}{fast:>16,.0f}{fast / naive:>9.2f}x")
+
+    # The factory's filter reads the secrets from the environment
+    for env_var, secret in zip(ENV_VARS, SECRETS):
+        os.environ[env_var] = secret
+
+    print()
+    print(f"{'case':<20}{'plain rec/s':>16}{'redacted rec/s':>16}{'overhead':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_logger = create_logger(Path(tmp), "bench_plain", redact=False)
+        redact_logger = create_logger(Path(tmp), "bench_redact", redact=True)
+        try:
+            for name, secret, unique in cases:
+                plain, redacted = measure_loggers(
+                    plain_logger, redact_logger, secret, unique
+                )
+                overhead = 1 - redacted / plain
+                print(f"{name:<20}{plain:>16,.0f}{redacted:>16,.0f}{overhead:>10.1%}")
+        finally:
+            plain_logger.close()
+            redact_logger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ Input:
 
 Output:
     Python Enum file: /Sena/core/exceptions/error_codes.py
+    With a metadata table (layer, service, category, severity, description)
+    indexed by member position, and indexes of codes by layer, service,
+    category and severity
 
 Usage:
     python3 -m Sena.scripts.exceptions.error_code_generator
@@ -17,11 +20,9 @@ Usage:
 from pathlib import Path
 from typing import Any, Dict, List, overload
 
-from jsonschema import validate
-
 from ...config.paths import PROJECT_ROOT
 from ...shared.scripts.generator_output_docstrings import ERROR_CODE_SOURCE_DOCSTRING
-from ...shared.utils import IOUtils, PathUtils
+from ...shared.utils import IOUtils, PathUtils, SchemaUtils
 
 # -----------------------------------------------------------------------------
 #   Constants
@@ -33,48 +34,13 @@ OUTPUT_PATH = f"{PROJECT_ROOT}/core/exceptions/error_codes.py"
 
 DEFAULT_ENCODING = "utf-8"
 
+INDENT = "    "  # Default indentation in python
+
 # -----------------------------------------------------------------------------
 #   Helper functions
 # -----------------------------------------------------------------------------
 
 
-@overload
-def load_json(
-    path: Path,
-    *,
-    expect: type[Dict],
-) -> Dict[str, Any]: ...
-
-
-@overload
-def load_json(
-    path: Path,
-    *,
-    expect: Any,
-) -> Any: ...
-
-
-def load_json(path: Path, *, expect: type[Any]) -> Any:
-    """Load a JSON file from disk.
-
-    Args:
-        path (Path): Path to the JSON file
-        expect (type): Expected Python type (e.g. dict, list)
-
-    Returns:
-        Parsed JSON content (cast to `expect`).
-
-    Raises:
-        FileNotFoundError: If file does not exist.
-        json.JSONDecodeError: If the file is not valid JSON.
-        TypeError: If the loaded JSON is not of the expected type.
-    """
-
-    data = IOUtils.load_json(path)
-    _validate_data_instance(data, expect)
-    return data
-
-
 @overload
 def load_yaml(
     path: Path,
@@ -116,19 +82,19 @@ def _validate_data_instance(obj: object, expect: type[Any]) -> None:
         raise
 
 
-def validate_registry(registry: List, schema: Dict[str, Any]) -> None:
+def validate_registry(registry: List, schema: Path | Dict[str, Any]) -> None:
     """Validate the error code registry against the JSON Schema.
 
     Args:
         registry (List): List of error code entries
-        schema (Dict): JSON Schema to validate against
+        schema (Path | Dict): JSON Schema (or its file) to validate against
 
     Raises:
         jsonschema.exceptions.ValidationError: If registry is invalid.
         ValueError: If a duplicated error code is found.
     """
 
-    validate(instance=registry, schema=schema)
+    SchemaUtils.validate(registry, schema)
 
     # Ensure no duplicated error code
     seen_codes = set()
@@ -139,6 +105,19 @@ def validate_registry(registry: List, schema: Dict[str, Any]) -> None:
         seen_codes.add(code)
 
 
+def get_severity(entry: Dict[str, Any]) -> str:
+    """Get an entry's severity.
+
+    Defaults to `WARNING` if the name its description starts with is a
+    warning (e.g. `FileNotFoundWarning - ...`), otherwise `ERROR`.
+    """
+
+    if "severity" in entry:
+        return entry["severity"]
+    name = entry["description"].split(" ", 1)[0]
+    return "WARNING" if name.endswith("Warning") else "ERROR"
+
+
 def generate_enum_source(registry: List) -> str:
     """Generate the Python Enum source code from the validated registry.
 
@@ -146,30 +125,128 @@ def generate_enum_source(registry: List) -> str:
         registry (List): List of error code entries
 
     Returns:
-        Python source code for the `ErrorCode` StrEnum (string Enum).
+        Python source code for the `ErrorCode` StrEnum (string Enum), with
+        its metadata table and indexes.
     """
 
     lines = [
         f'"""{ERROR_CODE_SOURCE_DOCSTRING}"""',
         "",
         "from enum import StrEnum",
+        "from typing import Dict, NamedTuple, Tuple",
         "",
         "class ErrorCode(StrEnum):",
     ]
 
-    indent = "    "  # Default indentation in python
-
     for entry in registry:
 
         # Each entry gets an inline comment of its description
         code_name = entry["code"].replace("-", "_")
         lines.append(
-            f"{indent}{code_name} = '{entry['code']}'  # {entry['description']}"
+            f"{INDENT}{code_name} = '{entry['code']}'  # {entry['description']}"
         )
 
+    lines.extend(generate_metadata_source(registry))
     return "\n".join(lines)
 
 
+def generate_metadata_source(registry: List) -> List[str]:
+    """Generate the metadata properties, table and indexes of `ErrorCode`.
+
+    The table is a tuple per field, indexed by the member's position in the
+    Enum, so importing it only loads constants.
+
+    Args:
+        registry (List): List of error code entries
+
+    Returns:
+        Lines of Python source following the `ErrorCode` members.
+    """
+
+    fields = {
+        "layer": [entry["layer"] for entry in registry],
+        "service": [entry["service"] for entry in registry],
+        "category": [entry["category"] for entry in registry],
+        "severity": [get_severity(entry) for entry in registry],
+        "description": [entry["description"] for entry in registry],
+    }
+
+    # Field -> name of its table
+    tables = {
+        "layer": "_LAYERS",
+        "service": "_SERVICES",
+        "category": "_CATEGORIES",
+        "severity": "_SEVERITIES",
+        "description": "_DESCRIPTIONS",
+    }
+
+    lines = [
+        "",
+        f"{INDENT}# {'-' * 73}",
+        f"{INDENT}#   Metadata",
+        f"{INDENT}#   O(1) lookups into the table below",
+        f"{INDENT}# {'-' * 73}",
+        "",
+        f"{INDENT}@property",
+        f'{INDENT}def info(self) -> "ErrorCodeInfo":',
+        f"{INDENT * 2}ordinal = _ORDINALS[self]",
+        f"{INDENT * 2}return ErrorCodeInfo(",
+        f"{INDENT * 3}self,",
+        *(f"{INDENT * 3}{tables[field]}[ordinal]," for field in fields),
+        f"{INDENT * 2})",
+    ]
+    for field in fields:
+        lines.extend(
+            [
+                "",
+                f"{INDENT}@property",
+                f"{INDENT}def {field}(self) -> str:",
+                f"{INDENT * 2}return {tables[field]}[_ORDINALS[self]]",
+            ]
+        )
+
+    lines.extend(
+        [
+            "",
+            "",
+            "class ErrorCodeInfo(NamedTuple):",
+            f"{INDENT}code: ErrorCode",
+            *(f"{INDENT}{field}: str" for field in fields),
+            "",
+            "",
+            "# Struct of arrays, indexed by the member's position in `ErrorCode`",
+        ]
+    )
+    for field, values in fields.items():
+        lines.append(f"{tables[field]}: Tuple[str, ...] = (")
+        lines.extend(f"{INDENT}{value!r}," for value in values)
+        lines.append(")")
+    lines.extend(
+        [
+            "",
+            "_ORDINALS: Dict[str, int] = {",
+            f"{INDENT}code: ordinal for ordinal, code in enumerate(ErrorCode)",
+            "}",
+            "",
+            "# Indexes, e.g. for aggregating metrics or routing alerts",
+        ]
+    )
+
+    for field in ("layer", "service", "category", "severity"):
+        index: Dict[str, List[str]] = {}
+        for entry, value in zip(registry, fields[field]):
+            index.setdefault(value, []).append(entry["code"].replace("-", "_"))
+
+        lines.append(f"CODES_BY_{field.upper()}: Dict[str, Tuple[ErrorCode, ...]] = {{")
+        for value, code_names in index.items():
+            lines.append(f"{INDENT}{value!r}: (")
+            lines.extend(f"{INDENT * 2}ErrorCode.{name}," for name in code_names)
+            lines.append(f"{INDENT}),")
+        lines.append("}")
+
+    return lines
+
+
 # -----------------------------------------------------------------------------
 #   Main
 #   Should be ran separte from app
@@ -186,8 +263,7 @@ def main():
     """
 
     registry = load_yaml(Path(REGISTRY_PATH), expect=List)
-    schema = load_json(Path(SCHEMA_PATH), expect=Dict)
-    validate_registry(registry, schema)
+    validate_registry(registry, Path(SCHEMA_PATH))
 
     enum_source = generate_enum_source(registry)
     output_path = PathUtils.validate_path(Path(OUTPUT_PATH))
@@ -0,0 +1,178 @@
+"""Binary Log Query
+
+Queries and exports logs written with the file config's `format: binary`.
+
+Only the index is scanned: a time range is found with a binary search, and
+level and service are compared on the index entries, so only matching
+records are read from the memory-mapped log files.
+
+Input:
+    Binary log files (`<name>.slog`) and their rotated backups, each with a
+    sidecar index (`<file>.idx`)
+
+Output:
+    Text lines, or NDJSON (the records as written, one per line)
+
+Usage:
+    python3 -m Sena.scripts.logs.binary_log_query FILE [FILE ...]
+        [--since TIME] [--until TIME] [--level LEVEL] [--service NAME]
+        [--limit N] [--ndjson] [--output PATH]
+
+    TIME is a UNIX timestamp or an ISO 8601 datetime (local time if no
+    offset is given).
+"""
+
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+# Imported before the logger, which `infrastructure.config` imports back
+from ...infrastructure import config  # noqa: F401 # isort: skip
+from ...infrastructure.logger.handlers import BinaryLogReader
+
+# -----------------------------------------------------------------------------
+#   Constants
+# -----------------------------------------------------------------------------
+
+DEFAULT_ENCODING = "utf-8"
+
+TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# -----------------------------------------------------------------------------
+#   Helper functions
+# -----------------------------------------------------------------------------
+
+
+def parse_time(value: str) -> float:
+    """Parse a UNIX timestamp or an ISO 8601 datetime."""
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid time: {value!r}")
+
+
+def parse_level(value: str) -> int:
+    level = logging.getLevelName(value.upper())
+    if not isinstance(level, int):
+        raise argparse.ArgumentTypeError(f"Invalid level: {value!r}")
+    return level
+
+
+def format_text(record: Dict[str, Any]) -> str:
+    created = datetime.fromtimestamp(record["created"]).strftime(TEXT_DATEFMT)
+    line = (
+        f"{created} | {record['level']:<8} | {record['service']}"
+        f" | {record['module']}:{record['function']}:{record['line']}"
+        f" | {record['message']}"
+    )
+    if "context" in record:
+        line += f": {json.dumps(record['context'], default=str)}"
+    if "exception" in record:
+        line += f"\n{record['exception']}"
+    return line
+
+
+def order_files(paths: List[Path]) -> List[Path]:
+    """Order files by their first record, so rotated backups come first."""
+
+    def first_created(path: Path) -> float:
+        with BinaryLogReader(path) as reader:
+            return reader.entry(0).created if len(reader) else float("inf")
+
+    return sorted(paths, key=first_created)
+
+
+# -----------------------------------------------------------------------------
+#   Main
+# -----------------------------------------------------------------------------
+
+
+def query(
+    paths: List[Path],
+    out: TextIO,
+    *,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    min_level: int = logging.NOTSET,
+    services: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    ndjson: bool = False,
+) -> int:
+    """Write the matching records of every file to `out`.
+
+    Returns:
+        The number of records written.
+    """
+
+    written = 0
+    for path in order_files(paths):
+        with BinaryLogReader(path) as reader:
+            entries = reader.entries(
+                since=since,
+                until=until,
+                min_level=min_level,
+                services=services,
+            )
+            for entry in entries:
+                if limit is not None and written >= limit:
+                    return written
+
+                payload = reader.payload(entry)
+                if ndjson:
+                    # Already compact JSON, exported without re-encoding
+                    out.write(payload.decode(DEFAULT_ENCODING))
+                else:
+                    out.write(format_text(json.loads(payload)))
+                out.write("\n")
+                written += 1
+
+    return written
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", type=Path, nargs="+")
+    parser.add_argument("--since", type=parse_time)
+    parser.add_argument("--until", type=parse_time)
+    parser.add_argument("--level", type=parse_level, default=logging.NOTSET)
+    parser.add_argument(
+        "--service", action="append", help="Only records of this service"
+    )
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--ndjson", action="store_true", help="Export as NDJSON")
+    parser.add_argument("--output", type=Path, help="Write to a file, not stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Query the binary log files and print or export the records."""
+
+    args = parse_args()
+    query_args: Dict[str, Any] = {
+        "since": args.since,
+        "until": args.until,
+        "min_level": args.level,
+        "services": args.service,
+        "limit": args.limit,
+        "ndjson": args.ndjson,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding=DEFAULT_ENCODING) as out:
+            written = query(args.files, out, **query_args)
+        print(f"{written} records written to {args.output}")
+    else:
+        query(args.files, sys.stdout, **query_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
+from .aliases import LogMessage
+from .context import (
+    LogContext,
+    bind_log_context,
+    get_log_context,
+    log_context,
+    reset_log_context,
+)
 from .format_utils import (
     Bytes,
     FileName,
@@ -7,10 +15,21 @@ from .format_utils import (
     MegaBytes,
     get_log_path,
 )
+from .lazy_message import LazyMessage
 from .log_levels import LogLevel
 from .log_values import LogConfigProfile
 
 __all__ = [
+    # .aliases
+    "LogMessage",
+    # .context
+    "LogContext",
+    "bind_log_context",
+    "get_log_context",
+    "log_context",
+    "reset_log_context",
+    # .lazy_message
+    "LazyMessage",
     # .log_values
     "LogConfigProfile",
     # .format_utils
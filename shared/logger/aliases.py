@@ -0,0 +1,12 @@
+"""Type aliases for service loggers.
+
+Type Aliases:
+    LogMessage: A log message, or a callable producing it only when the
+        record is actually emitted (see `LazyMessage`)
+
+"""
+
+from collections.abc import Callable
+from typing import TypeAlias
+
+LogMessage: TypeAlias = str | Callable[[], str]
@@ -0,0 +1,89 @@
+"""Request context stamped onto log records.
+
+The context is bound once per request (e.g. per Discord message) into a
+`ContextVar`, so every record logged while handling it - including from
+tasks it spawns - carries the same correlation ID without passing context
+kwargs on each call.
+
+Example:
+    with log_context(
+        correlation_id=message.id,
+        guild_id=message.guild.id,
+        user_id=message.author.id,
+    ):
+        await handle(message)
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, replace
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class LogContext:
+    """Immutable request context, shared by every record it stamps."""
+
+    correlation_id: Optional[int | str] = None
+    guild_id: Optional[int] = None
+    user_id: Optional[int] = None
+
+
+_current_context: ContextVar[Optional[LogContext]] = ContextVar(
+    "sena_log_context", default=None
+)
+
+
+def get_log_context() -> Optional[LogContext]:
+    """Get the context bound to the current task or thread, if any."""
+
+    return _current_context.get()
+
+
+def bind_log_context(
+    *,
+    correlation_id: Optional[int | str] = None,
+    guild_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+) -> Token:
+    """Bind a context, keeping fields of the current one that are not given.
+
+    Returns:
+        A token to restore the previous context with `reset_log_context`.
+    """
+
+    current = _current_context.get() or LogContext()
+    context = replace(
+        current,
+        correlation_id=(
+            current.correlation_id if correlation_id is None else correlation_id
+        ),
+        guild_id=current.guild_id if guild_id is None else guild_id,
+        user_id=current.user_id if user_id is None else user_id,
+    )
+    return _current_context.set(context)
+
+
+def reset_log_context(token: Token) -> None:
+    """Restore the context from before `bind_log_context`."""
+
+    _current_context.reset(token)
+
+
+@contextmanager
+def log_context(
+    *,
+    correlation_id: Optional[int | str] = None,
+    guild_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+) -> Iterator[LogContext]:
+    """Bind a context for the duration of a block."""
+
+    token = bind_log_context(
+        correlation_id=correlation_id, guild_id=guild_id, user_id=user_id
+    )
+    try:
+        yield _current_context.get()  # type: ignore[misc]
+    finally:
+        reset_log_context(token)
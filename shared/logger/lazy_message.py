@@ -0,0 +1,28 @@
+from collections.abc import Callable
+from typing import Optional
+
+
+class LazyMessage:
+    """A log message produced by a callable the first time it is read.
+
+    Set as a record's `msg`, it is resolved by `LogRecord.getMessage`, so a
+    record dropped by a level check, sampling or rate limiting never calls
+    it. The result is kept, so each handler formats the same text. With an
+    async logger it runs on the listener thread.
+    """
+
+    __slots__ = ("_factory", "_message")
+
+    def __init__(self, factory: Callable[[], str]):
+        self._factory = factory
+        self._message: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = str(self._factory())
+        return self._message
+
+    def __repr__(self) -> str:
+        if self._message is None:
+            return f"<LazyMessage {self._factory!r}>"
+        return repr(self._message)
@@ -12,13 +12,17 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
     def to_value(self) -> int:
-        return {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }[self.value]
+        return _LEVEL_VALUES[self.value]
+
+
+# Built once, `to_value` is on the per-record logging path
+_LEVEL_VALUES = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 class FileConfig(BaseModel):
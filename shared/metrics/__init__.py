@@ -0,0 +1,35 @@
+from .builtin import (
+    ERRORS,
+    LOG_EMIT_SECONDS,
+    LOG_RECORDS,
+    WARNINGS,
+    metrics_registry,
+)
+from .exposition import CONTENT_TYPE, render_prometheus
+from .registry import (
+    Counter,
+    Histogram,
+    HistogramValue,
+    MetricInfo,
+    MetricsRegistry,
+    MetricsSnapshot,
+)
+
+__all__ = [
+    # .builtin
+    "metrics_registry",
+    "LOG_RECORDS",
+    "LOG_EMIT_SECONDS",
+    "ERRORS",
+    "WARNINGS",
+    # .exposition
+    "CONTENT_TYPE",
+    "render_prometheus",
+    # .registry
+    "Counter",
+    "Histogram",
+    "HistogramValue",
+    "MetricInfo",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+]
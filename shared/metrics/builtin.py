@@ -0,0 +1,25 @@
+from .registry import MetricsRegistry
+
+# Process-wide registry, fed by the loggers and the exception hierarchy
+metrics_registry = MetricsRegistry()
+
+LOG_RECORDS = metrics_registry.counter(
+    "sena_log_records_total",
+    "Log calls at or above the service logger's level",
+    ("service", "level"),
+)
+LOG_EMIT_SECONDS = metrics_registry.histogram(
+    "sena_log_emit_seconds",
+    "Seconds a log call spends handing the record to its handlers or queue",
+    ("service",),
+)
+ERRORS = metrics_registry.counter(
+    "sena_errors_total",
+    "Created `CoreError` exceptions",
+    ("error_code", "type"),
+)
+WARNINGS = metrics_registry.counter(
+    "sena_warnings_total",
+    "Created `CoreWarning` warnings",
+    ("error_code", "type"),
+)
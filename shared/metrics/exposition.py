@@ -0,0 +1,60 @@
+from typing import Iterable, List
+
+from .registry import Labels, MetricInfo, MetricsSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus(metrics: Iterable[MetricInfo], snapshot: MetricsSnapshot) -> str:
+    """Render a snapshot in the Prometheus text exposition format."""
+
+    lines: List[str] = []
+    for info in metrics:
+        lines.append(f"# HELP {info.name} {_escape_help(info.help)}")
+        lines.append(f"# TYPE {info.name} {info.kind}")
+
+        if info.kind == "counter":
+            for labels, value in sorted(snapshot.counters.get(info.name, {}).items()):
+                lines.append(
+                    f"{info.name}{_labels(info.label_names, labels)} {_value(value)}"
+                )
+            continue
+
+        for labels, histogram in sorted(snapshot.histograms.get(info.name, {}).items()):
+            cumulative = 0
+            bounds = [*map(_value, histogram.buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                _bucket = _labels((*info.label_names, "le"), (*labels, bound))
+                lines.append(f"{info.name}_bucket{_bucket} {cumulative}")
+            _label_str = _labels(info.label_names, labels)
+            lines.append(f"{info.name}_sum{_label_str} {_value(histogram.sum)}")
+            lines.append(f"{info.name}_count{_label_str} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------------------------------------------------------
+#   Private helper functions
+# -----------------------------------------------------------------------------
+
+
+def _labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,263 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, TypeAlias
+
+Labels: TypeAlias = Tuple[str, ...]
+"""Label values, in the order of the metric's label names."""
+_Key: TypeAlias = Tuple[str, Labels]
+
+# Seconds, sized for a log call: an enqueue up to a slow synchronous write
+DEFAULT_BUCKETS = (
+    0.000_005,
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.000_25,
+    0.000_5,
+    0.001,
+    0.002_5,
+    0.005,
+    0.01,
+    0.025,
+    0.1,
+)
+
+# -----------------------------------------------------------------------------
+#   Snapshots
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class HistogramValue:
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    """Observations per bucket, the last one above every bound."""
+    sum: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+@dataclass
+class MetricsSnapshot:
+    counters: Dict[str, Dict[Labels, float]] = field(default_factory=dict)
+    histograms: Dict[str, Dict[Labels, HistogramValue]] = field(default_factory=dict)
+
+
+# -----------------------------------------------------------------------------
+#   Metrics
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class MetricInfo:
+    name: str
+    help: str
+    label_names: Labels
+    kind: str
+    buckets: Tuple[float, ...] = ()
+
+
+class Counter:
+    """A monotonically increasing count, per label values."""
+
+    __slots__ = ("info", "_name", "_local", "_registry")
+
+    def __init__(self, info: MetricInfo, registry: "MetricsRegistry"):
+        self.info = info
+        self._name = info.name
+        self._local = registry._local
+        self._registry = registry
+
+    def inc(self, *labels: str, value: float = 1.0):
+        try:
+            counters = self._local.shard.counters
+        except AttributeError:
+            counters = self._registry._shard().counters
+        key = (self._name, labels)
+        counters[key] = counters.get(key, 0.0) + value
+
+
+class Histogram:
+    """Observed values counted into fixed buckets, per label values."""
+
+    __slots__ = ("info", "_name", "_buckets", "_local", "_registry")
+
+    def __init__(self, info: MetricInfo, registry: "MetricsRegistry"):
+        self.info = info
+        self._name = info.name
+        self._buckets = info.buckets
+        self._local = registry._local
+        self._registry = registry
+
+    def observe(self, value: float, *labels: str):
+        try:
+            histograms = self._local.shard.histograms
+        except AttributeError:
+            histograms = self._registry._shard().histograms
+        key = (self._name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = HistogramValue(
+                buckets=self._buckets,
+                counts=[0] * (len(self._buckets) + 1),
+            )
+        histogram.counts[bisect_left(self._buckets, value)] += 1
+        histogram.sum += value
+
+
+# -----------------------------------------------------------------------------
+#   Registry
+# -----------------------------------------------------------------------------
+
+
+class _Shard:
+    """One thread's metric values, only ever written by that thread."""
+
+    __slots__ = ("thread", "counters", "histograms")
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.counters: Dict[_Key, float] = {}
+        self.histograms: Dict[_Key, HistogramValue] = {}
+
+
+class MetricsRegistry:
+    """In-process registry of counters and histograms.
+
+    Updates take no lock: each thread writes to its own shard, which is
+    registered once under a lock. A snapshot sums the shards. Shards of
+    threads that exited are folded into a retired total, so their counts
+    are kept, whenever a snapshot is taken or a new shard is registered.
+
+    Metrics are defined once with `counter`/`histogram`, and the returned
+    handle is updated with label values in the order of `label_names`.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, MetricInfo] = {}
+        self._shards: List[_Shard] = []
+        self._retired = _Shard(threading.main_thread())
+        self._local = threading.local()
+        self._lock = Lock()
+
+    # -------------------------------------------------------------------------
+    #   Definition methods
+    # -------------------------------------------------------------------------
+
+    def counter(self, name: str, help: str, label_names: Labels = ()) -> Counter:
+        return Counter(self._define(name, help, label_names, "counter"), self)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: Labels = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        info = self._define(name, help, label_names, "histogram", tuple(buckets))
+        return Histogram(info, self)
+
+    def metrics(self) -> List[MetricInfo]:
+        return list(self._metrics.values())
+
+    # -------------------------------------------------------------------------
+    #   Read methods
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Sum every thread's values into one consistent-enough view.
+
+        Values written while the snapshot is taken may or may not be in it.
+        """
+
+        with self._lock:
+            self._retire_exited()
+            shards = [self._retired, *self._shards]
+
+        snapshot = MetricsSnapshot()
+        for shard in shards:
+            for (name, labels), value in shard.counters.copy().items():
+                by_labels = snapshot.counters.setdefault(name, {})
+                by_labels[labels] = by_labels.get(labels, 0.0) + value
+            for (name, labels), histogram in shard.histograms.copy().items():
+                by_labels_h = snapshot.histograms.setdefault(name, {})
+                total = by_labels_h.get(labels)
+                if total is None:
+                    total = by_labels_h[labels] = HistogramValue(
+                        buckets=histogram.buckets,
+                        counts=[0] * len(histogram.counts),
+                    )
+                _merge_histogram(total, histogram)
+        return snapshot
+
+    def reset(self):
+        """Zero every metric, definitions are kept."""
+
+        with self._lock:
+            for shard in (self._retired, *self._shards):
+                shard.counters.clear()
+                shard.histograms.clear()
+
+    # -------------------------------------------------------------------------
+    #   Private helper methods
+    # -------------------------------------------------------------------------
+
+    def _define(
+        self,
+        name: str,
+        help: str,
+        label_names: Labels,
+        kind: str,
+        buckets: Tuple[float, ...] = (),
+    ) -> MetricInfo:
+        info = MetricInfo(name, help, tuple(label_names), kind, buckets)
+        with self._lock:
+            existing = self._metrics.setdefault(name, info)
+        if existing != info:
+            raise ValueError(f"Metric {name!r} is already defined differently")
+        return existing
+
+    def _shard(self) -> _Shard:
+        shard: Optional[_Shard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._lock:
+                # Bounds the shards by the live threads, not every thread
+                # that ever updated a metric
+                self._retire_exited()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_exited(self):
+        """Fold shards of exited threads into the retired shard.
+
+        Called under the lock.
+        """
+
+        alive: List[_Shard] = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+                continue
+
+            retired = self._retired
+            for key, value in shard.counters.items():
+                retired.counters[key] = retired.counters.get(key, 0.0) + value
+            for key, histogram in shard.histograms.items():
+                total = retired.histograms.get(key)
+                if total is None:
+                    retired.histograms[key] = histogram
+                else:
+                    _merge_histogram(total, histogram)
+        self._shards = alive
+
+
+def _merge_histogram(total: HistogramValue, histogram: HistogramValue):
+    for index, count in enumerate(list(histogram.counts)):
+        total.counts[index] += count
+    total.sum += histogram.sum
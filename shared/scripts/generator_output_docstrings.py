@@ -34,5 +34,10 @@ ERROR_CODE_SOURCE_DOCSTRING = (
     "   UNK: `Unknown`, unexpected/unclassified, or generic errors\n"
     "   VAL: `Validation`, input/data format validation\n"
     "\n"
+    "Metadata:\n"
+    "   `ErrorCode.info` (or `.layer`, `.service`, `.category`, `.severity`,\n"
+    "   `.description`), and the `CODES_BY_LAYER`, `CODES_BY_SERVICE`,\n"
+    "   `CODES_BY_CATEGORY` and `CODES_BY_SEVERITY` indexes\n"
+    "\n"
     "Generated by: `{PROJECT_ROOT}/scripts/exceptions/error_code_generator.py`\n"
 )
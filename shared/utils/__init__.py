@@ -1,7 +1,9 @@
 from .io_utils.manager import IOUtils
 from .path_utils.manager import PathUtils
+from .schema_utils.manager import SchemaUtils
 
 __all__ = [
     "PathUtils",
     "IOUtils",
+    "SchemaUtils",
 ]
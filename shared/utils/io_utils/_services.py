@@ -4,7 +4,8 @@ from typing import Any, Dict, Optional, Type
 
 import yaml
 from dotenv import dotenv_values
-from jsonschema import ValidationError, validate
+
+from ..schema_utils.manager import SchemaUtils
 
 # -----------------------------------------------------------------------------
 #   Functions exposed with an API
@@ -37,13 +38,9 @@ def _load_json(
 
     with open(path, mode="r", encoding=encoding) as file:
         data = json.load(file)
-        if schema:
-            with open(schema, mode="r") as schema_file:
-                schema_data = json.load(schema_file)
-                try:
-                    validate(instance=data, schema=schema_data)
-                except ValidationError:
-                    return None
+        # Schema loaded and checked once, while unchanged
+        if schema and not SchemaUtils.get_validator(schema).is_valid(data):
+            return None
         if expect:
             if not isinstance(data, expect):
                 # TODO:
@@ -0,0 +1,150 @@
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from jsonschema import Draft7Validator
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+# Optional code-generating validator
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+Schema = Dict[str, Any]
+
+# -----------------------------------------------------------------------------
+#   Validator
+# -----------------------------------------------------------------------------
+
+
+class SchemaValidator:
+    """A schema's validator, built once and shared by every validation.
+
+    The schema itself is checked once, when built. The validator class
+    follows the schema's `$schema`, defaulting to Draft 7.
+
+    If compiled, valid instances are checked by code generated with
+    `fastjsonschema` (when installed). Invalid ones are re-validated by
+    `jsonschema`, so errors are always a `jsonschema.ValidationError`.
+    """
+
+    __slots__ = ("schema", "_validator", "_compiled")
+
+    def __init__(self, schema: Schema, *, compiled: bool = False):
+        validator_class = validator_for(schema, default=Draft7Validator)
+        validator_class.check_schema(schema)
+
+        self.schema = schema
+        self._validator: Validator = validator_class(schema)
+        self._compiled: Optional[Callable[[Any], Any]] = None
+        if compiled and fastjsonschema is not None:
+            try:
+                self._compiled = fastjsonschema.compile(schema)
+            except fastjsonschema.JsonSchemaDefinitionException:
+                # Uses a feature it can't compile, `jsonschema` only
+                pass
+
+    @property
+    def compiled(self) -> bool:
+        return self._compiled is not None
+
+    def validate(self, instance: Any):
+        """Raise `jsonschema.ValidationError` if the instance is invalid."""
+
+        if self._compiled is not None:
+            try:
+                self._compiled(instance)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+        self._validator.validate(instance)
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check the instance, `jsonschema` decides as in `validate`."""
+
+        if self._compiled is not None:
+            try:
+                self._compiled(instance)
+                return True
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+        return self._validator.is_valid(instance)
+
+
+# -----------------------------------------------------------------------------
+#   Registry
+# -----------------------------------------------------------------------------
+
+
+class _SchemaRegistry:
+    """Process-wide cache of schema validators.
+
+    Schema files are cached by resolved path, and valid while their
+    `mtime_ns` and size are unchanged. In-memory schemas are cached by
+    identity, so they must not be mutated once validated against.
+    """
+
+    def __init__(self):
+        # (resolved path, compiled) -> (mtime_ns, size, validator)
+        self._files: Dict[Tuple[Path, bool], Tuple[int, int, SchemaValidator]] = {}
+        # (id of the schema, compiled) -> validator, which keeps it alive
+        self._schemas: Dict[Tuple[int, bool], SchemaValidator] = {}
+        self._lock = Lock()
+
+    def get(self, schema: Path | str | Schema, *, compiled: bool) -> SchemaValidator:
+        if isinstance(schema, dict):
+            return self._get_for_schema(schema, compiled)
+        return self._get_for_file(Path(schema), compiled)
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+            self._schemas.clear()
+
+    def _get_for_schema(self, schema: Schema, compiled: bool) -> SchemaValidator:
+        key = (id(schema), compiled)
+        validator = self._schemas.get(key)
+        if validator is None or validator.schema is not schema:
+            validator = SchemaValidator(schema, compiled=compiled)
+            with self._lock:
+                self._schemas[key] = validator
+        return validator
+
+    def _get_for_file(self, path: Path, compiled: bool) -> SchemaValidator:
+        path = path.resolve()
+        stat = os.stat(path)
+        key = (path, compiled)
+
+        entry = self._files.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+
+        with open(path, mode="r", encoding="utf-8") as file:
+            validator = SchemaValidator(json.load(file), compiled=compiled)
+        with self._lock:
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, validator)
+        return validator
+
+
+_schema_registry = _SchemaRegistry()
+
+# -----------------------------------------------------------------------------
+#   Functions exposed with an API
+# -----------------------------------------------------------------------------
+
+
+def _get_validator(
+    schema: Path | str | Schema,
+    *,
+    compiled: bool,
+) -> SchemaValidator:
+
+    return _schema_registry.get(schema, compiled=compiled)
+
+
+def _clear_validators() -> None:
+    _schema_registry.clear()
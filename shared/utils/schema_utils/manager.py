@@ -0,0 +1,60 @@
+from pathlib import Path
+from typing import Any
+
+from ._services import Schema, SchemaValidator, _clear_validators, _get_validator
+
+
+class SchemaUtils:
+
+    @classmethod
+    def get_validator(
+        cls,
+        schema: Path | str | Schema,
+        *,
+        compiled: bool = False,
+    ) -> SchemaValidator:
+        """Get a schema's cached validator, built on first use.
+
+        Args:
+            schema (Path | str | Dict): Path to a JSON schema file, or the
+                schema itself
+            compiled (bool): Check valid instances with generated code, if
+                `fastjsonschema` is installed
+                Defaults to False
+
+        Returns:
+            The validator, shared while the schema file is unchanged.
+
+        Raises:
+            jsonschema.SchemaError: The schema itself is invalid.
+        """
+
+        return _get_validator(schema, compiled=compiled)
+
+    @classmethod
+    def validate(
+        cls,
+        instance: Any,
+        schema: Path | str | Schema,
+        *,
+        compiled: bool = False,
+    ) -> None:
+        """Validate an instance with the schema's cached validator.
+
+        Args:
+            instance (Any): The data to validate
+            schema (Path | str | Dict): Path to a JSON schema file, or the
+                schema itself
+            compiled (bool): See `get_validator`
+
+        Raises:
+            jsonschema.ValidationError: The instance is invalid.
+        """
+
+        _get_validator(schema, compiled=compiled).validate(instance)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached validator."""
+
+        _clear_validators()